@@ -11,7 +11,9 @@ from alembic import context
 from app.config.database.session import DATABASE_URL, Base
 
 # Import all models to ensure they are registered with Base.metadata
-from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
+from app.config.database.models import import_all_models
+
+import_all_models()
 
 # this is the Alembic Config object
 config = context.config
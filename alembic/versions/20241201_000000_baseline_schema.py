@@ -0,0 +1,173 @@
+"""Baseline schema (tables that predate migrations)
+
+Revision ID: 20241201_000000
+Revises:
+Create Date: 2024-12-01
+
+Tables created by ``Base.metadata.create_all`` before the schema was managed
+by Alembic. Each table is created only if it does not exist yet, so the
+revision is safe on databases that were bootstrapped by create_all.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20241201_000000'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # account (role/plan/billing/status are added by 20241218_000001)
+    if 'account' not in existing:
+        op.create_table(
+            'account',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('email', sa.String(255), nullable=False),
+            sa.Column('nickname', sa.String(100), nullable=False),
+            sa.Column('terms_agreed', sa.Boolean(), nullable=False),
+            sa.Column('terms_agreed_at', sa.DateTime(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.Column('mbti', sa.String(4), nullable=True),
+            sa.Column('gender', sa.String(10), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_account_email', 'account', ['email'], unique=True)
+
+    if 'chat_room' not in existing:
+        op.create_table(
+            'chat_room',
+            sa.Column('room_id', sa.String(36), nullable=False),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(100), nullable=True),
+            sa.Column('category', sa.String(20), nullable=True),
+            sa.Column('division', sa.String(20), nullable=True),
+            sa.Column('out_api', sa.String(50), nullable=True),
+            sa.Column('status', sa.String(20), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('room_id'),
+        )
+        op.create_index('idx_account_updated', 'chat_room', ['account_id', 'updated_at'])
+        op.create_index('idx_status_category', 'chat_room', ['status', 'category'])
+
+    if 'chat_msg' not in existing:
+        op.create_table(
+            'chat_msg',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('room_id', sa.String(36), nullable=False),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('role', sa.String(20), nullable=False),
+            sa.Column('content_enc', sa.LargeBinary(), nullable=False),
+            sa.Column('iv', sa.LargeBinary(), nullable=False),
+            sa.Column('enc_version', sa.Integer(), nullable=True),
+            sa.Column('contents_type', sa.String(20), nullable=True),
+            sa.Column('file_urls', sa.JSON(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('parent_id', sa.Integer(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['room_id'], ['chat_room.room_id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['parent_id'], ['chat_msg.id'], ondelete='CASCADE'),
+        )
+        op.create_index('idx_room_id', 'chat_msg', ['room_id'])
+        op.create_index('idx_room_parent_id', 'chat_msg', ['room_id', 'parent_id'])
+
+    if 'chat_feedback' not in existing:
+        op.create_table(
+            'chat_feedback',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('message_id', sa.Integer(), nullable=False),
+            sa.Column('satisfaction', sa.Enum('LIKE', 'DISLIKE', name='satisfaction'), nullable=False),
+            sa.Column(
+                'reason',
+                sa.Enum(
+                    'ACCURATE', 'EMPATHETIC', 'HELPFUL',
+                    'INACCURATE', 'OFFENSIVE', 'TOO_LONG', 'NOT_EMPATHETIC', 'IRRELEVANT', 'OTHER',
+                    name='feedbackreason',
+                ),
+                nullable=True,
+            ),
+            sa.Column('comment', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('message_id'),
+            sa.ForeignKeyConstraint(['message_id'], ['chat_msg.id'], ondelete='CASCADE'),
+        )
+
+    if 'simulation_chat' not in existing:
+        op.create_table(
+            'simulation_chat',
+            sa.Column('id', sa.String(50), nullable=False),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('mbti', sa.String(4), nullable=True),
+            sa.Column('topic', sa.String(255), nullable=True),
+            sa.Column('gender', sa.String(10), nullable=True),
+            sa.Column('messages', sa.JSON(), nullable=True),
+            sa.Column('is_training_data', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_simulation_chat_account_id', 'simulation_chat', ['account_id'])
+        op.create_index('ix_account_id_created_at', 'simulation_chat', ['account_id', 'created_at'])
+
+    if 'survey_template' not in existing:
+        op.create_table(
+            'survey_template',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            sa.Column('title', sa.String(200), nullable=False),
+            sa.Column('subtitle', sa.String(500), nullable=True),
+            sa.Column('footer', sa.String(500), nullable=True),
+            sa.Column('questions_json', sa.Text(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('version'),
+        )
+
+    if 'survey_response' not in existing:
+        op.create_table(
+            'survey_response',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('user_id', sa.Integer(), nullable=True),
+            sa.Column('template_version', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'template_version', name='uq_survey_user_template'),
+            sa.ForeignKeyConstraint(['user_id'], ['account.id']),
+        )
+
+    if 'survey_response_item' not in existing:
+        op.create_table(
+            'survey_response_item',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('response_id', sa.Integer(), nullable=False),
+            sa.Column('question_id', sa.String(50), nullable=False),
+            sa.Column('question_type', sa.String(20), nullable=False),
+            sa.Column('value', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['response_id'], ['survey_response.id'], ondelete='CASCADE'),
+        )
+        op.create_index('ix_survey_response_item_response_id', 'survey_response_item', ['response_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('survey_response_item')
+    op.drop_table('survey_response')
+    op.drop_table('survey_template')
+    op.drop_table('simulation_chat')
+    op.drop_table('chat_feedback')
+    op.drop_table('chat_msg')
+    op.drop_table('chat_room')
+    op.drop_table('account')
@@ -1,7 +1,7 @@
 """Add role, plan, billing, status columns to account table
 
 Revision ID: 20241218_000001
-Revises:
+Revises: 20241201_000000
 Create Date: 2024-12-18
 
 """
@@ -13,19 +13,25 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = '20241218_000001'
-down_revision: Union[str, None] = None
+down_revision: Union[str, None] = '20241201_000000'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add new columns to account table
-    op.add_column('account', sa.Column('role', sa.String(30), nullable=False, server_default='USER'))
-    op.add_column('account', sa.Column('plan', sa.String(30), nullable=False, server_default='FREE'))
-    op.add_column('account', sa.Column('plan_started_at', sa.DateTime(), nullable=True))
-    op.add_column('account', sa.Column('plan_ends_at', sa.DateTime(), nullable=True))
-    op.add_column('account', sa.Column('billing_customer_id', sa.String(100), nullable=True))
-    op.add_column('account', sa.Column('status', sa.String(30), nullable=False, server_default='ACTIVE'))
+    # Add new columns to account table (skipped if create_all already added them)
+    existing = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('account')}
+    columns = [
+        sa.Column('role', sa.String(30), nullable=False, server_default='USER'),
+        sa.Column('plan', sa.String(30), nullable=False, server_default='FREE'),
+        sa.Column('plan_started_at', sa.DateTime(), nullable=True),
+        sa.Column('plan_ends_at', sa.DateTime(), nullable=True),
+        sa.Column('billing_customer_id', sa.String(100), nullable=True),
+        sa.Column('status', sa.String(30), nullable=False, server_default='ACTIVE'),
+    ]
+    for column in columns:
+        if column.name not in existing:
+            op.add_column('account', column)
 
 
 def downgrade() -> None:
@@ -19,59 +19,66 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
     # Create inquiry table
-    op.create_table(
-        'inquiry',
-        sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
-        sa.Column('account_id', sa.Integer(), nullable=False),
-        sa.Column('category', sa.String(30), nullable=False),
-        sa.Column('title', sa.String(200), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('status', sa.String(30), nullable=False, server_default='PENDING'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')),
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['account_id'], ['account.id'], ondelete='CASCADE'),
-    )
-    op.create_index('idx_inquiry_account_created', 'inquiry', ['account_id', 'created_at'])
-    op.create_index('idx_inquiry_status_created', 'inquiry', ['status', 'created_at'])
+    if 'inquiry' not in existing:
+        op.create_table(
+            'inquiry',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('category', sa.String(30), nullable=False),
+            sa.Column('title', sa.String(200), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('status', sa.String(30), nullable=False, server_default='PENDING'),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['account_id'], ['account.id'], ondelete='CASCADE'),
+        )
+        op.create_index('idx_inquiry_account_created', 'inquiry', ['account_id', 'created_at'])
+        op.create_index('idx_inquiry_status_created', 'inquiry', ['status', 'created_at'])
 
     # Create inquiry_reply table
-    op.create_table(
-        'inquiry_reply',
-        sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
-        sa.Column('inquiry_id', sa.Integer(), nullable=False),
-        sa.Column('account_id', sa.Integer(), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('is_admin_reply', sa.Boolean(), nullable=False, server_default='0'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['inquiry_id'], ['inquiry.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['account_id'], ['account.id'], ondelete='CASCADE'),
-    )
-    op.create_index('idx_inquiry_reply_inquiry', 'inquiry_reply', ['inquiry_id', 'created_at'])
+    if 'inquiry_reply' not in existing:
+        op.create_table(
+            'inquiry_reply',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('inquiry_id', sa.Integer(), nullable=False),
+            sa.Column('account_id', sa.Integer(), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('is_admin_reply', sa.Boolean(), nullable=False, server_default='0'),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['inquiry_id'], ['inquiry.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['account_id'], ['account.id'], ondelete='CASCADE'),
+        )
+        op.create_index('idx_inquiry_reply_inquiry', 'inquiry_reply', ['inquiry_id', 'created_at'])
 
     # Create faq table
-    op.create_table(
-        'faq',
-        sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
-        sa.Column('category', sa.String(30), nullable=False),
-        sa.Column('question', sa.String(500), nullable=False),
-        sa.Column('answer', sa.Text(), nullable=False),
-        sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('is_published', sa.Boolean(), nullable=False, server_default='1'),
-        sa.Column('view_count', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('created_by', sa.Integer(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
-        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')),
-        sa.PrimaryKeyConstraint('id'),
-        sa.ForeignKeyConstraint(['created_by'], ['account.id'], ondelete='CASCADE'),
-    )
-    op.create_index('idx_faq_category_order', 'faq', ['category', 'display_order'])
-    op.create_index('idx_faq_published', 'faq', ['is_published', 'display_order'])
+    if 'faq' not in existing:
+        op.create_table(
+            'faq',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('category', sa.String(30), nullable=False),
+            sa.Column('question', sa.String(500), nullable=False),
+            sa.Column('answer', sa.Text(), nullable=False),
+            sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('is_published', sa.Boolean(), nullable=False, server_default='1'),
+            sa.Column('view_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('created_by', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP')),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['created_by'], ['account.id'], ondelete='CASCADE'),
+        )
+        op.create_index('idx_faq_category_order', 'faq', ['category', 'display_order'])
+        op.create_index('idx_faq_published', 'faq', ['is_published', 'display_order'])
 
-    # Create fulltext index for search
-    op.execute('CREATE FULLTEXT INDEX idx_faq_search ON faq(question, answer)')
+    # Create fulltext index for search (create_all doesn't create it)
+    faq_indexes = {i['name'] for i in sa.inspect(op.get_bind()).get_indexes('faq')}
+    if 'idx_faq_search' not in faq_indexes:
+        op.execute('CREATE FULLTEXT INDEX idx_faq_search ON faq(question, answer)')
 
 
 def downgrade() -> None:
@@ -0,0 +1,42 @@
+"""Create chat_summary table
+
+Revision ID: 20261019_000001
+Revises: 20241227_000001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000001'
+down_revision: Union[str, None] = '20241227_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # Create chat_summary table (one cached summary per room)
+    if 'chat_summary' not in existing:
+        op.create_table(
+            'chat_summary',
+            sa.Column('room_id', sa.String(36), nullable=False),
+            sa.Column('last_message_id', sa.Integer(), nullable=False),
+            sa.Column('message_count', sa.Integer(), nullable=False),
+            sa.Column('summary_enc', sa.LargeBinary(), nullable=False),
+            sa.Column('iv', sa.LargeBinary(), nullable=False),
+            sa.Column('enc_version', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('room_id'),
+            sa.ForeignKeyConstraint(['room_id'], ['chat_room.room_id'], ondelete='CASCADE'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('chat_summary')
@@ -0,0 +1,46 @@
+"""Create chat_summary_chunk table
+
+Revision ID: 20261019_000002
+Revises: 20261019_000001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000002'
+down_revision: Union[str, None] = '20261019_000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # Create chat_summary_chunk table (cached summaries of closed conversation chunks)
+    if 'chat_summary_chunk' not in existing:
+        op.create_table(
+            'chat_summary_chunk',
+            sa.Column('id', sa.Integer(), nullable=False, autoincrement=True),
+            sa.Column('room_id', sa.String(36), nullable=False),
+            sa.Column('start_message_id', sa.Integer(), nullable=False),
+            sa.Column('end_message_id', sa.Integer(), nullable=False),
+            sa.Column('message_count', sa.Integer(), nullable=False),
+            sa.Column('summary_enc', sa.LargeBinary(), nullable=False),
+            sa.Column('iv', sa.LargeBinary(), nullable=False),
+            sa.Column('enc_version', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['room_id'], ['chat_room.room_id'], ondelete='CASCADE'),
+            sa.UniqueConstraint('room_id', 'start_message_id', 'end_message_id', name='uq_summary_chunk_range'),
+        )
+        op.create_index('idx_summary_chunk_room_start', 'chat_summary_chunk', ['room_id', 'start_message_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_summary_chunk_room_start', table_name='chat_summary_chunk')
+    op.drop_table('chat_summary_chunk')
@@ -0,0 +1,29 @@
+"""Add pdf_path to chat_summary
+
+Revision ID: 20261019_000003
+Revises: 20261019_000002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000003'
+down_revision: Union[str, None] = '20261019_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # S3 key of the PDF pre-rendered for the stored summary (skipped if create_all already added it)
+    existing = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('chat_summary')}
+    if 'pdf_path' not in existing:
+        op.add_column('chat_summary', sa.Column('pdf_path', sa.String(255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('chat_summary', 'pdf_path')
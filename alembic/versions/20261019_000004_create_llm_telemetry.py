@@ -0,0 +1,56 @@
+"""Create llm_telemetry table
+
+Revision ID: 20261019_000004
+Revises: 20261019_000003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_000004'
+down_revision: Union[str, None] = '20261019_000003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # Per-request LLM latency / token / cost records (written in batches)
+    if 'llm_telemetry' not in existing:
+        op.create_table(
+            'llm_telemetry',
+            sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+            sa.Column('use_case', sa.String(32), nullable=False),
+            sa.Column('model', sa.String(64), nullable=False),
+            sa.Column('account_id', sa.Integer(), nullable=True),
+            sa.Column('status', sa.String(16), nullable=False),
+            sa.Column('streamed', sa.Integer(), nullable=False),
+            sa.Column('ttft_ms', sa.Float(), nullable=True),
+            sa.Column('duration_ms', sa.Float(), nullable=False),
+            sa.Column('max_gap_ms', sa.Float(), nullable=True),
+            sa.Column('mean_gap_ms', sa.Float(), nullable=True),
+            sa.Column('chunk_count', sa.Integer(), nullable=False),
+            sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+            sa.Column('cached_tokens', sa.Integer(), nullable=True),
+            sa.Column('completion_tokens', sa.Integer(), nullable=True),
+            sa.Column('tokens_per_sec', sa.Float(), nullable=True),
+            sa.Column('cost_usd', sa.Float(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('idx_llm_telemetry_use_case_created', 'llm_telemetry', ['use_case', 'created_at'])
+        op.create_index('idx_llm_telemetry_model_created', 'llm_telemetry', ['model', 'created_at'])
+        op.create_index('idx_llm_telemetry_created', 'llm_telemetry', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_llm_telemetry_created', table_name='llm_telemetry')
+    op.drop_index('idx_llm_telemetry_model_created', table_name='llm_telemetry')
+    op.drop_index('idx_llm_telemetry_use_case_created', table_name='llm_telemetry')
+    op.drop_table('llm_telemetry')
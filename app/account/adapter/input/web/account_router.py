@@ -1,10 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 
-from app.auth.adapter.input.web.dependencies import (
-    get_optional_jwt_payload,
-    get_optional_session,
-)
-from app.auth.application.port.jwt_token_port import TokenPayload
+from app.auth.adapter.input.web.dependencies import get_current_account_id
 from app.auth.domain.entity.session import Session
 from app.config.database.session import get_db_session
 
@@ -17,31 +13,9 @@ from app.account.adapter.input.web.response.update_mbti_gender_response import (
 from app.account.application.usecase.account_usecase import AccountUseCase
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
 
-
-# =============================
-# DI 객체 (conversation_router 스타일)
-# =============================
-account_repo = AccountRepositoryImpl()
-account_usecase = AccountUseCase(account_repo)
-
 router = APIRouter(prefix="/account", tags=["account"])
 
 
-# =============================
-# 인증 관련
-# =============================
-def get_current_account_id(
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
-) -> int:
-
-    if jwt_payload:
-        return jwt_payload.account_id
-    if session:
-        return session.account_id
-    raise HTTPException(status_code=401, detail="Not authenticated")
-
-
 # =============================
 # PATCH 내 MBTI / Gender 수정
 # =============================
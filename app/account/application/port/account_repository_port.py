@@ -26,6 +26,21 @@ class AccountRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_by_id_cached(self, account_id: int) -> Optional[Account]:
+        """Find an account by its ID, served from cache when possible.
+
+        The result may lag a concurrent write by a few seconds and must only
+        be used for reading; load with find_by_id before updating.
+
+        Args:
+            account_id: The account's unique identifier.
+
+        Returns:
+            The Account if found, None otherwise.
+        """
+        pass
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address.
@@ -47,7 +47,7 @@ class AccountUseCase:
         return self._repository.save(account)
 
     def get_account_by_id(self, account_id: int) -> Optional[Account]:
-        """Get an account by its ID.
+        """Get an account by its ID (read-only, served from cache when possible).
 
         Args:
             account_id: The account's unique identifier.
@@ -55,7 +55,7 @@ class AccountUseCase:
         Returns:
             The account if found, None otherwise.
         """
-        return self._repository.find_by_id(account_id)
+        return self._repository.find_by_id_cached(account_id)
 
     def get_account_by_email(self, email: str) -> Optional[Account]:
         """Get an account by email address.
@@ -123,6 +123,7 @@ class AccountUseCase:
         Raises:
             AccountNotFoundException: If account doesn't exist.
         """
+        # Load from the database (not the cache); save() invalidates the cached profile
         account = self._repository.find_by_id(account_id)
         if not account:
             raise AccountNotFoundException(account_id)
@@ -0,0 +1,297 @@
+"""Read-through cache of Account entities.
+
+Two levels:
+- L1: in-process TTL LRU (per worker), so hot per-request lookups
+  (chat turns, admin checks, /auth/status) are memory reads;
+- L2: Redis, shared by all workers, so an L1 miss rarely reaches MySQL.
+
+Writes go to MySQL first, then ``invalidate`` bumps the account's generation,
+drops the Redis entry and publishes the account id; every worker's subscriber
+evicts it from its L1. A read-through ``put`` only writes L2 if the generation
+it read before querying MySQL is still current, so a reader racing a write
+cannot put the old row back. Changes that bypass ``save`` (manual DB edits)
+are picked up when the short L2 TTL expires.
+
+L2 calls are synchronous (the repositories are) and run on the event loop, so
+they use a dedicated client with a tight timeout; after an error, L2 is
+skipped for a few seconds and lookups fall back to MySQL.
+
+Entities served from the cache are for reading; updates and authorization
+decisions (admin checks) must load the account from the database.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from app.account.domain.entity.account import Account
+from app.account.domain.entity.account_enums import (
+    AccountPlan,
+    AccountRole,
+    AccountStatus, Gender, Mbti,
+)
+from app.config.redis_config import create_redis, get_async_redis
+from app.config.settings import settings
+
+# Only write L2 if nobody invalidated the account since the caller read its generation
+_PUT_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+    return redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+return 0
+"""
+
+_DATETIME_FIELDS = ("terms_agreed_at", "created_at", "updated_at", "plan_started_at", "plan_ends_at")
+
+
+def _serialize(account: Account) -> str:
+    data = {
+        "id": account.id,
+        "email": account.email,
+        "nickname": account.nickname,
+        "terms_agreed": account.terms_agreed,
+        "role": account.role.value,
+        "plan": account.plan.value,
+        "billing_customer_id": account.billing_customer_id,
+        "gender": account.gender.value if account.gender else None,
+        "mbti": account.mbti.value if account.mbti else None,
+        "status": account.status.value,
+    }
+    for name in _DATETIME_FIELDS:
+        value = getattr(account, name)
+        data[name] = value.isoformat() if value else None
+    return json.dumps(data)
+
+
+def _deserialize(raw: str) -> Account:
+    data = json.loads(raw)
+    for name in _DATETIME_FIELDS:
+        if data.get(name):
+            data[name] = datetime.fromisoformat(data[name])
+    data["role"] = AccountRole.from_string(data["role"])
+    data["plan"] = AccountPlan.from_string(data["plan"])
+    data["status"] = AccountStatus.from_string(data["status"])
+    data["gender"] = Gender.from_string(data["gender"]) if data.get("gender") else None
+    data["mbti"] = Mbti.from_string(data["mbti"]) if data.get("mbti") else None
+    return Account(**data)
+
+
+class AccountCache:
+    """Process-wide two-level account cache with pub/sub invalidation."""
+
+    KEY_PREFIX = "account:"
+    CHANNEL = "account:invalidate"
+    GENERATION_TTL_SECONDS = 86400
+    L2_BACKOFF_SECONDS = 5
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        async_redis_client: Optional[aioredis.Redis] = None,
+        local_ttl_seconds: Optional[int] = None,
+        local_max_entries: Optional[int] = None,
+        redis_ttl_seconds: Optional[int] = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            redis_client: Sync Redis client (repositories are synchronous).
+                Uses a dedicated client with ACCOUNT_CACHE_REDIS_TIMEOUT_MS if not provided.
+            async_redis_client: Async Redis client for the invalidation subscriber.
+            local_ttl_seconds: L1 entry lifetime; bounds staleness if an
+                invalidation event is missed.
+            local_max_entries: Maximum number of L1 entries.
+            redis_ttl_seconds: L2 entry lifetime.
+        """
+        self._redis = redis_client
+        self._async_redis = async_redis_client
+        self._local_ttl = local_ttl_seconds or settings.ACCOUNT_CACHE_LOCAL_TTL_SECONDS
+        self._local_max_entries = local_max_entries or settings.ACCOUNT_CACHE_LOCAL_MAX_ENTRIES
+        self._redis_ttl = redis_ttl_seconds or settings.ACCOUNT_CACHE_REDIS_TTL_SECONDS
+        self._entries: OrderedDict[int, Tuple[float, Account]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._l2_down_until = 0.0
+
+    @property
+    def redis(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = create_redis(socket_timeout=settings.ACCOUNT_CACHE_REDIS_TIMEOUT_MS / 1000)
+        return self._redis
+
+    @property
+    def async_redis(self) -> aioredis.Redis:
+        if self._async_redis is None:
+            self._async_redis = get_async_redis()
+        return self._async_redis
+
+    def _make_key(self, account_id: int) -> str:
+        return f"{self.KEY_PREFIX}{account_id}"
+
+    def _make_generation_key(self, account_id: int) -> str:
+        return f"{self.KEY_PREFIX}gen:{account_id}"
+
+    def _l2_available(self) -> bool:
+        return time.monotonic() >= self._l2_down_until
+
+    def _l2_failed(self, action: str, error: Exception) -> None:
+        self._l2_down_until = time.monotonic() + self.L2_BACKOFF_SECONDS
+        print(f"[AccountCache] redis {action} error: {error}")
+
+    def get(self, account_id: int) -> Optional[Account]:
+        """Cached account (L1, then Redis) or None on a miss."""
+        account = self._get_local(account_id)
+        if account is not None:
+            return copy.copy(account)
+
+        if not self._l2_available():
+            return None
+        try:
+            raw = self.redis.get(self._make_key(account_id))
+        except redis.RedisError as e:
+            self._l2_failed("read", e)
+            return None
+        if raw is None:
+            return None
+
+        try:
+            account = _deserialize(raw)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+        self._put_local(account)
+        return copy.copy(account)
+
+    def generation(self, account_id: int) -> Optional[str]:
+        """Current generation of an account; read it before loading the row for ``put``.
+
+        Returns None if Redis is unavailable (the row is then only cached in L1).
+        """
+        if not self._l2_available():
+            return None
+        try:
+            return self.redis.get(self._make_generation_key(account_id)) or "0"
+        except redis.RedisError as e:
+            self._l2_failed("read", e)
+            return None
+
+    def put(self, account: Account, generation: Optional[str]) -> None:
+        """Store an account loaded from the database.
+
+        Args:
+            account: Account read from MySQL.
+            generation: ``generation()`` taken before the read. L2 is only written
+                if no invalidation happened since, so a stale row can't be put back.
+        """
+        if account.id is None:
+            return
+        self._put_local(copy.copy(account))
+        if generation is None or not self._l2_available():
+            return
+        try:
+            self.redis.eval(
+                _PUT_IF_GENERATION,
+                2,
+                self._make_key(account.id),
+                self._make_generation_key(account.id),
+                generation,
+                _serialize(account),
+                self._redis_ttl,
+            )
+        except redis.RedisError as e:
+            self._l2_failed("write", e)
+
+    def invalidate(self, account_id: int) -> None:
+        """Drop an account everywhere after it was written to the database."""
+        self.evict_local(account_id)
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incr(self._make_generation_key(account_id))
+            pipe.expire(self._make_generation_key(account_id), self.GENERATION_TTL_SECONDS)
+            pipe.delete(self._make_key(account_id))
+            pipe.publish(self.CHANNEL, str(account_id))
+            pipe.execute()
+        except redis.RedisError as e:
+            # Other workers' L1 entries still expire after local_ttl_seconds
+            self._l2_failed("invalidation", e)
+
+    def evict_local(self, account_id: int) -> None:
+        with self._lock:
+            self._entries.pop(account_id, None)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_local(self, account_id: int) -> Optional[Account]:
+        with self._lock:
+            entry = self._entries.get(account_id)
+            if entry is None:
+                return None
+            expires_at, account = entry
+            if expires_at <= time.monotonic():
+                del self._entries[account_id]
+                return None
+            self._entries.move_to_end(account_id)
+            return account
+
+    def _put_local(self, account: Account) -> None:
+        with self._lock:
+            self._entries[account.id] = (time.monotonic() + self._local_ttl, account)
+            self._entries.move_to_end(account.id)
+            while len(self._entries) > self._local_max_entries:
+                self._entries.popitem(last=False)
+
+    def start(self) -> None:
+        """Start the background invalidation subscriber (called from app lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.async_redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.CHANNEL)
+                # Invalidations may have been missed while unsubscribed
+                self.clear_local()
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        try:
+                            self.evict_local(int(message["data"]))
+                        except ValueError:
+                            pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[AccountCache] subscription error: {e}")
+                self.clear_local()
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+
+# Process-wide instance
+account_cache = AccountCache()
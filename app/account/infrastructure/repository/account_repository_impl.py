@@ -3,7 +3,6 @@
 from typing import Optional
 
 from sqlalchemy.orm import Session as DBSession
-from app.config.database.session import get_db_session
 
 from app.account.domain.entity.account import Account
 from app.account.domain.entity.account_enums import (
@@ -12,6 +11,7 @@ from app.account.domain.entity.account_enums import (
     AccountStatus, Gender, Mbti,
 )
 from app.account.application.port.account_repository_port import AccountRepositoryPort
+from app.account.infrastructure.cache.account_cache import AccountCache, account_cache
 from app.account.infrastructure.orm.account_model import AccountModel
 
 
@@ -21,13 +21,19 @@ class AccountRepositoryImpl(AccountRepositoryPort):
     This adapter implements the application port using SQLAlchemy for persistence.
     """
 
-    def __init__(self, db_session: Optional[DBSession] = None):
+    def __init__(
+        self,
+        db_session: DBSession,
+        cache: Optional[AccountCache] = None,
+    ):
         """Initialize with a database session.
 
         Args:
             db_session: SQLAlchemy database session.
+            cache: Account cache. Uses the process-wide cache if not provided.
         """
-        self._session: DBSession = db_session or get_db_session()
+        self._session: DBSession = db_session
+        self._cache = cache or account_cache
 
     def find_by_id(self, account_id: int) -> Optional[Account]:
         """Find an account by its ID."""
@@ -38,6 +44,19 @@ class AccountRepositoryImpl(AccountRepositoryPort):
         )
         return self._to_entity(model) if model else None
 
+    def find_by_id_cached(self, account_id: int) -> Optional[Account]:
+        """Find an account by its ID, reading through the account cache."""
+        account = self._cache.get(account_id)
+        if account is not None:
+            return account
+
+        # Taken before the read so a concurrent invalidation makes the put a no-op
+        generation = self._cache.generation(account_id)
+        account = self.find_by_id(account_id)
+        if account is not None:
+            self._cache.put(account, generation)
+        return account
+
 
     def find_by_email(self, email: str) -> Optional[Account]:
         """Find an account by email address."""
@@ -84,6 +103,7 @@ class AccountRepositoryImpl(AccountRepositoryPort):
 
                 self._session.commit()
                 self._session.refresh(model)
+                self._cache.invalidate(account.id)
                 return self._to_entity(model)
             else:
                 # Account not found, create new
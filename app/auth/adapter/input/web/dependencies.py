@@ -1,11 +1,17 @@
 """Auth API dependencies - FastAPI dependency injection."""
 
+import secrets
 from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session as DBSession
 
 from app.account.application.usecase.account_usecase import AccountUseCase
+from app.auth.adapter.input.web.identity import (
+    Identity,
+    extract_access_token,
+    identity_resolver,
+)
 from app.auth.application.port.jwt_token_port import TokenPayload
 from app.auth.application.usecase.csrf_usecase import CSRFUseCase
 from app.auth.application.usecase.auth_usecase import AuthUseCase
@@ -17,6 +23,9 @@ from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
 from app.account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
 from app.config.database.session import SessionLocal
 
+# Marks request.state whose identity has not been resolved yet
+_UNRESOLVED = object()
+
 
 def get_db() -> Generator[DBSession, None, None]:
     """Get database session dependency."""
@@ -80,8 +89,45 @@ def get_auth_usecase(
     return AuthUseCase(session_usecase, csrf_usecase, account_usecase, jwt_service)
 
 
-def get_current_session(
+async def get_optional_identity(request: Request) -> Optional[Identity]:
+    """Get the identity resolved for this request, None if not authenticated.
+
+    Resolved on first use and memoized on request.state, so it runs once per
+    request and only for routes that depend on it.
+    """
+    identity = getattr(request.state, "identity", _UNRESOLVED)
+    if identity is _UNRESOLVED:
+        identity = await identity_resolver.resolve(request)
+        request.state.identity = identity
+    return identity
+
+
+def get_current_identity(
+    identity: Optional[Identity] = Depends(get_optional_identity),
+) -> Identity:
+    """Get the identity of the authenticated caller.
+
+    Raises:
+        HTTPException: 401 if not authenticated.
+    """
+    if identity is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    return identity
+
+
+def get_current_account_id(
+    identity: Identity = Depends(get_current_identity),
+) -> int:
+    """Get the authenticated account ID (JWT or session)."""
+    return identity.account_id
+
+
+async def get_current_session(
     request: Request,
+    identity: Optional[Identity] = Depends(get_optional_identity),
     session_usecase: SessionUseCase = Depends(get_session_usecase),
 ) -> Session:
     """Get current session from cookie.
@@ -91,6 +137,9 @@ def get_current_session(
     Raises:
         HTTPException: 401 if not authenticated or session invalid.
     """
+    if identity is not None and identity.session is not None:
+        return identity.session
+
     session_id = request.cookies.get("session_id")
 
     if not session_id:
@@ -99,7 +148,8 @@ def get_current_session(
             detail="Not authenticated",
         )
 
-    session = session_usecase.validate_session(session_id)
+    # Identity resolution stops at a valid JWT, so the session may not be loaded yet
+    session = await session_usecase.validate_session(session_id)
 
     if not session:
         raise HTTPException(
@@ -111,82 +161,51 @@ def get_current_session(
 
 
 def get_optional_session(
-    request: Request,
-    session_usecase: SessionUseCase = Depends(get_session_usecase),
+    identity: Optional[Identity] = Depends(get_optional_identity),
 ) -> Session | None:
-    """Get current session if available, None otherwise.
+    """Get current session if it is the credential that authenticated the request.
 
     Unlike get_current_session, this doesn't raise an error if not authenticated.
     """
-    session_id = request.cookies.get("session_id")
-
-    if not session_id:
-        return None
-
-    return session_usecase.validate_session(session_id)
+    return identity.session if identity else None
 
 
 def get_current_jwt_payload(
-    request: Request,
-    jwt_service: JWTTokenService = Depends(get_jwt_service),
+    identity: Optional[Identity] = Depends(get_optional_identity),
 ) -> TokenPayload:
     """Get current user from JWT token.
 
-    Validates the JWT and returns the payload if valid.
-
     Raises:
         HTTPException: 401 if not authenticated or token invalid.
     """
-    # Try to get token from cookie first, then from Authorization header
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
+    if identity is None or identity.jwt_payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
 
-    payload = jwt_service.validate_token(token)
-
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-
-    return payload
+    return identity.jwt_payload
 
 
 def get_optional_jwt_payload(
-    request: Request,
-    jwt_service: JWTTokenService = Depends(get_jwt_service),
+    identity: Optional[Identity] = Depends(get_optional_identity),
 ) -> Optional[TokenPayload]:
     """Get current user from JWT token if available, None otherwise.
 
     Unlike get_current_jwt_payload, this doesn't raise an error if not authenticated.
     """
-    token = request.cookies.get("access_token")
-
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
-        return None
-
-    return jwt_service.validate_token(token)
+    return identity.jwt_payload if identity else None
 
 
 def verify_admin_role(
     jwt_payload: TokenPayload = Depends(get_current_jwt_payload),
     account_repo: AccountRepositoryImpl = Depends(get_account_repository),
 ) -> int:
+    """Require an admin account authenticated by JWT (legacy sessions are not accepted).
+
+    The role is read from the database, not the account cache, so a revoked
+    admin loses access immediately.
+    """
     account = account_repo.find_by_id(jwt_payload.account_id)
 
     if not account or not account.is_admin():
@@ -221,23 +240,17 @@ def verify_csrf(
 
 def verify_jwt_csrf(
     request: Request,
-    jwt_service: JWTTokenService = Depends(get_jwt_service),
+    identity: Optional[Identity] = Depends(get_optional_identity),
 ) -> bool:
     """Verify CSRF token embedded in JWT.
 
-    Compares the CSRF token from the header with the one embedded in the JWT.
+    Compares the CSRF token from the header with the one embedded in the
+    JWT already validated for this request.
 
     Raises:
         HTTPException: 403 if CSRF validation fails.
     """
-    # Get token
-    token = request.cookies.get("access_token")
-    if not token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-    if not token:
+    if not extract_access_token(request):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No access token provided",
@@ -253,7 +266,8 @@ def verify_jwt_csrf(
         )
 
     # Validate CSRF token against JWT
-    if not jwt_service.validate_csrf(token, header_csrf):
+    jwt_payload = identity.jwt_payload if identity else None
+    if jwt_payload is None or not secrets.compare_digest(jwt_payload.csrf_token, header_csrf):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="CSRF token validation failed",
@@ -0,0 +1,105 @@
+"""Request-scoped identity resolution.
+
+``IdentityResolver`` works out who is calling. The auth dependencies resolve it
+lazily, on the first dependency that needs it, and memoize the result on
+``request.state.identity``, so it runs at most once per request and public
+routes never touch Redis. Credentials are tried in order and the first valid one
+wins, so a request with a valid JWT never touches the session store:
+
+1. JWT (``access_token`` cookie, then ``Authorization: Bearer``)
+2. Legacy Redis session (``session_id`` cookie)
+
+Dependencies in ``dependencies.py`` read the stored identity instead of
+building token/session services per request.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from starlette.requests import HTTPConnection
+
+from app.auth.application.port.jwt_token_port import TokenPayload
+from app.auth.application.usecase.session_usecase import SessionUseCase
+from app.auth.domain.entity.session import Session
+from app.auth.infrastructure.cache.session_repository_impl import SessionRepositoryImpl
+from app.auth.infrastructure.cache.token_blacklist_impl import TokenBlacklistImpl
+from app.auth.infrastructure.jwt.jwt_token_service import JWTTokenService
+
+
+@dataclass(frozen=True)
+class Identity:
+    """Authenticated caller of the current request."""
+
+    account_id: int
+    source: str  # "jwt" or "session"
+    jwt_payload: Optional[TokenPayload] = None
+    session: Optional[Session] = None
+
+
+def extract_access_token(conn: HTTPConnection) -> Optional[str]:
+    """Get the JWT from the cookie first, then from the Authorization header."""
+    token = conn.cookies.get("access_token")
+    if not token:
+        auth_header = conn.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header[7:]
+    return token or None
+
+
+class IdentityResolver:
+    """Resolves an Identity from request credentials using shared services."""
+
+    def __init__(
+        self,
+        jwt_service: Optional[JWTTokenService] = None,
+        session_usecase: Optional[SessionUseCase] = None,
+    ):
+        """Initialize resolver.
+
+        Args:
+            jwt_service: JWT service. Created with the Redis blacklist if not provided.
+            session_usecase: Session usecase. Created with the Redis repository if not provided.
+        """
+        self._jwt_service = jwt_service
+        self._session_usecase = session_usecase
+
+    @property
+    def jwt_service(self) -> JWTTokenService:
+        if self._jwt_service is None:
+            self._jwt_service = JWTTokenService(blacklist=TokenBlacklistImpl())
+        return self._jwt_service
+
+    @property
+    def session_usecase(self) -> SessionUseCase:
+        if self._session_usecase is None:
+            self._session_usecase = SessionUseCase(SessionRepositoryImpl())
+        return self._session_usecase
+
+    async def resolve(self, conn: HTTPConnection) -> Optional[Identity]:
+        """Return the identity of the first valid credential, or None."""
+        token = extract_access_token(conn)
+        if token:
+            # Cached tokens and bloom-filtered blacklist checks are local
+            payload = await self.jwt_service.validate_token(token)
+            if payload:
+                return Identity(
+                    account_id=payload.account_id,
+                    source="jwt",
+                    jwt_payload=payload,
+                )
+
+        session_id = conn.cookies.get("session_id")
+        if session_id:
+            session = await self.session_usecase.validate_session(session_id)
+            if session:
+                return Identity(
+                    account_id=session.account_id,
+                    source="session",
+                    session=session,
+                )
+
+        return None
+
+
+# Process-wide instance
+identity_resolver = IdentityResolver()
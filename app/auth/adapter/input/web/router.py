@@ -9,9 +9,9 @@ from app.auth.adapter.input.web.dependencies import (
     get_auth_usecase,
     get_current_session,
     get_current_jwt_payload,
-    get_optional_session,
-    get_optional_jwt_payload,
+    get_optional_identity,
 )
+from app.auth.adapter.input.web.identity import Identity
 from app.auth.adapter.input.web.response import (
     AuthStatusResponse,
     LogoutResponse,
@@ -42,8 +42,7 @@ async def get_providers(
 
 @router.get("/status", response_model=AuthStatusResponse)
 async def get_auth_status(
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
+    identity: Identity | None = Depends(get_optional_identity),
     account_usecase: AccountUseCase = Depends(get_account_usecase),
 ) -> AuthStatusResponse:
     """Check authentication status.
@@ -51,18 +50,11 @@ async def get_auth_status(
     Returns authentication status and user info if authenticated.
     Supports both JWT and session-based authentication.
     """
-    # Try JWT first, then fall back to session
-    account_id = None
-
-    if jwt_payload:
-        account_id = jwt_payload.account_id
-    elif session:
-        account_id = session.account_id
-
-    if not account_id:
+    # Identity is resolved JWT first, then session
+    if not identity:
         return AuthStatusResponse(is_authenticated=False)
 
-    account = account_usecase.get_account_by_id(account_id)
+    account = account_usecase.get_account_by_id(identity.account_id)
 
     if not account:
         return AuthStatusResponse(is_authenticated=False)
@@ -111,8 +103,6 @@ async def get_current_user_session(
 async def logout(
     request: Request,
     response: Response,
-    jwt_payload: TokenPayload | None = Depends(get_optional_jwt_payload),
-    session: Session | None = Depends(get_optional_session),
     auth_usecase: AuthUseCase = Depends(get_auth_usecase),
 ) -> LogoutResponse:
     """Logout - blacklist JWT and clear cookies.
@@ -123,11 +113,12 @@ async def logout(
     # Blacklist JWT token if exists
     token = request.cookies.get("access_token")
     if token:
-        auth_usecase.blacklist_jwt(token)
+        await auth_usecase.blacklist_jwt(token)
 
-    # Destroy session if exists
-    if session:
-        auth_usecase.logout(session.session_id)
+    # Destroy session if exists (identity stops at a valid JWT, so use the cookie)
+    session_id = request.cookies.get("session_id")
+    if session_id:
+        await auth_usecase.logout(session_id)
 
     # Clear all auth cookies
     response.delete_cookie("access_token")
@@ -347,7 +338,7 @@ async def refresh_token(
         )
 
     # Refresh the token
-    new_token_pair = auth_usecase.refresh_jwt(token)
+    new_token_pair = await auth_usecase.refresh_jwt(token)
 
     if not new_token_pair:
         raise HTTPException(
@@ -13,7 +13,7 @@ class SessionRepositoryPort(ABC):
     """
 
     @abstractmethod
-    def save(self, session: Session) -> None:
+    async def save(self, session: Session) -> None:
         """Save a session.
 
         Args:
@@ -22,7 +22,7 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def find_by_id(self, session_id: str) -> Optional[Session]:
+    async def find_by_id(self, session_id: str) -> Optional[Session]:
         """Find a session by its ID.
 
         Args:
@@ -34,7 +34,27 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def delete(self, session_id: str) -> None:
+    async def touch(
+        self,
+        session_id: str,
+        ttl_seconds: int,
+        min_interval_seconds: int = 0,
+    ) -> Optional[Session]:
+        """Find a session and slide its expiration atomically.
+
+        Args:
+            session_id: The session's unique identifier.
+            ttl_seconds: New TTL in seconds from now.
+            min_interval_seconds: Skip the renewal write if the session was
+                touched more recently than this.
+
+        Returns:
+            The (possibly renewed) Session if found and not expired, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
         """Delete a session.
 
         Args:
@@ -43,7 +63,7 @@ class SessionRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
         """Extend the TTL of a session.
 
         Args:
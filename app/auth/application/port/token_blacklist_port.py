@@ -11,7 +11,7 @@ class TokenBlacklistPort(ABC):
     """
 
     @abstractmethod
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -21,7 +21,7 @@ class TokenBlacklistPort(ABC):
         pass
 
     @abstractmethod
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -33,7 +33,7 @@ class TokenBlacklistPort(ABC):
         pass
 
     @abstractmethod
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
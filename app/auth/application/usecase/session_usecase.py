@@ -22,7 +22,7 @@ class SessionUseCase:
         """
         self._repository = session_repository
 
-    def create_session(
+    async def create_session(
         self,
         account_id: int,
         csrf_token: Optional[str] = None,
@@ -40,10 +40,10 @@ class SessionUseCase:
             account_id=account_id,
             csrf_token=csrf_token,
         )
-        self._repository.save(session)
+        await self._repository.save(session)
         return session
 
-    def validate_session(self, session_id: str) -> Optional[Session]:
+    async def validate_session(self, session_id: str) -> Optional[Session]:
         """Validate a session by its ID.
 
         Args:
@@ -52,26 +52,31 @@ class SessionUseCase:
         Returns:
             The session if valid, None otherwise.
         """
-        session = self._repository.find_by_id(session_id)
+        # Sliding expiration: renew at most once per touch interval
+        session = await self._repository.touch(
+            session_id,
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+            min_interval_seconds=settings.SESSION_TOUCH_INTERVAL_SECONDS,
+        )
 
         if session is None:
             return None
 
         if not session.is_valid():
-            self._repository.delete(session_id)
+            await self._repository.delete(session_id)
             return None
 
         return session
 
-    def destroy_session(self, session_id: str) -> None:
+    async def destroy_session(self, session_id: str) -> None:
         """Destroy (logout) a session.
 
         Args:
             session_id: The session ID to destroy.
         """
-        self._repository.delete(session_id)
+        await self._repository.delete(session_id)
 
-    def refresh_session(self, session_id: str) -> Optional[Session]:
+    async def refresh_session(self, session_id: str) -> Optional[Session]:
         """Refresh a session's expiration time.
 
         Args:
@@ -80,18 +85,17 @@ class SessionUseCase:
         Returns:
             The refreshed session if found, None otherwise.
         """
-        session = self._repository.find_by_id(session_id)
+        session = await self._repository.touch(
+            session_id,
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+        )
 
         if session is None or not session.is_valid():
             return None
 
-        # Extend session
-        session.extend(hours=settings.SESSION_TTL_SECONDS // 3600)
-        self._repository.save(session)
-
         return session
 
-    def get_session(self, session_id: str) -> Optional[Session]:
+    async def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID without validation side effects.
 
         Args:
@@ -100,4 +104,4 @@ class SessionUseCase:
         Returns:
             The session if found, None otherwise.
         """
-        return self._repository.find_by_id(session_id)
+        return await self._repository.find_by_id(session_id)
@@ -1,90 +1,184 @@
 """Session repository implementation using Redis."""
 
 import json
+import time
+from datetime import datetime
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
 from app.auth.domain.entity.session import Session
-from app.config.redis_config import get_redis
+from app.config.redis_config import get_async_redis
 from app.config.settings import settings
 
 
+# Sliding renewal in one atomic round-trip.
+# KEYS[1] = session key
+# ARGV[1] = now (epoch seconds), ARGV[2] = ttl seconds, ARGV[3] = min touch interval seconds
+# Returns the hash as a flat [field, value, ...] list, {"__legacy__", json} for
+# sessions still stored as JSON strings, or nil if missing/expired.
+_TOUCH_SCRIPT = """
+local kind = redis.call('TYPE', KEYS[1]).ok
+if kind == 'none' then
+    return nil
+end
+if kind == 'string' then
+    return {'__legacy__', redis.call('GET', KEYS[1])}
+end
+
+local now = tonumber(ARGV[1])
+local expires_at = tonumber(redis.call('HGET', KEYS[1], 'e') or '0')
+if expires_at <= now then
+    redis.call('DEL', KEYS[1])
+    return nil
+end
+
+local touched_at = tonumber(redis.call('HGET', KEYS[1], 'u') or '0')
+if now - touched_at >= tonumber(ARGV[3]) then
+    redis.call('HSET', KEYS[1], 'e', now + tonumber(ARGV[2]), 'u', now)
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+
+return redis.call('HGETALL', KEYS[1])
+"""
+
+
 class SessionRepositoryImpl(SessionRepositoryPort):
     """Redis implementation of SessionRepositoryPort.
 
-    Sessions are stored in Redis with TTL-based expiration.
+    Sessions are stored in Redis hashes with TTL-based expiration.
     Key format: session:{session_id}
+    Fields (short names, epoch-second integers; small hashes use Redis' compact listpack encoding):
+        a: account_id
+        c: created_at
+        e: expires_at
+        u: last touched at (sliding renewal)
+        t: csrf_token (omitted if None)
+
+    Sessions written by older versions as JSON strings are converted to hashes
+    the first time they are read.
     """
 
     KEY_PREFIX = "session:"
 
     def __init__(
         self,
-        redis_client: Optional[redis.Redis] = None,
+        redis_client: Optional[aioredis.Redis] = None,
         ttl_seconds: Optional[int] = None,
     ):
         """Initialize with Redis client and TTL.
 
         Args:
-            redis_client: Redis client instance. Uses default if not provided.
+            redis_client: Async Redis client instance. Uses the shared pool if not provided.
             ttl_seconds: Session TTL in seconds. Uses settings default if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis = redis_client or get_async_redis()
         self._ttl = ttl_seconds or settings.SESSION_TTL_SECONDS
+        self._touch_script = self._redis.register_script(_TOUCH_SCRIPT)
 
     def _make_key(self, session_id: str) -> str:
         """Create Redis key for session."""
         return f"{self.KEY_PREFIX}{session_id}"
 
-    def save(self, session: Session) -> None:
+    @staticmethod
+    def _to_hash(session: Session) -> dict:
+        data = {
+            "a": session.account_id,
+            "c": int(session.created_at.timestamp()),
+            "e": int(session.expires_at.timestamp()) if session.expires_at else 0,
+            "u": int(time.time()),
+        }
+        if session.csrf_token:
+            data["t"] = session.csrf_token
+        return data
+
+    @staticmethod
+    def _from_hash(session_id: str, data: dict) -> Session:
+        expires_at = int(data.get("e") or 0)
+        return Session(
+            session_id=session_id,
+            account_id=int(data["a"]),
+            created_at=datetime.fromtimestamp(int(data["c"])),
+            expires_at=datetime.fromtimestamp(expires_at) if expires_at else None,
+            csrf_token=data.get("t"),
+        )
+
+    async def save(self, session: Session) -> None:
         """Save a session to Redis with TTL."""
         key = self._make_key(session.session_id)
-        data = json.dumps(session.to_dict())
-        self._redis.setex(key, self._ttl, data)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._to_hash(session))
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
 
-    def find_by_id(self, session_id: str) -> Optional[Session]:
-        """Find a session by its ID."""
-        key = self._make_key(session_id)
-        data = self._redis.get(key)
+    async def find_by_id(self, session_id: str) -> Optional[Session]:
+        """Find a session by its ID (without renewing it)."""
+        return await self._load(session_id, ttl_seconds=self._ttl, min_interval_seconds=None)
 
-        if data is None:
+    async def touch(
+        self,
+        session_id: str,
+        ttl_seconds: int,
+        min_interval_seconds: int = 0,
+    ) -> Optional[Session]:
+        """Find a session and slide its expiration in one atomic call."""
+        return await self._load(session_id, ttl_seconds, min_interval_seconds)
+
+    async def _load(
+        self,
+        session_id: str,
+        ttl_seconds: int,
+        min_interval_seconds: Optional[int],
+    ) -> Optional[Session]:
+        key = self._make_key(session_id)
+        # Without an interval the script never renews (interval larger than any age)
+        interval = min_interval_seconds if min_interval_seconds is not None else 2 ** 62
+        result = await self._touch_script(
+            keys=[key],
+            args=[int(time.time()), ttl_seconds, interval],
+        )
+
+        if not result:
             return None
 
         try:
-            session_dict = json.loads(data)
-            session = Session.from_dict(session_dict)
-
-            # Double-check expiration (Redis TTL + session expiration)
-            if session.is_expired():
-                self.delete(session_id)
-                return None
-
-            return session
-        except (json.JSONDecodeError, KeyError, ValueError):
+            if result[0] == "__legacy__":
+                session = await self._migrate_legacy(session_id, result[1])
+                if session and min_interval_seconds is not None:
+                    return await self._load(session_id, ttl_seconds, min_interval_seconds)
+                return session
+
+            data = dict(zip(result[0::2], result[1::2]))
+            return self._from_hash(session_id, data)
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError):
             # Invalid session data, clean up
-            self.delete(session_id)
+            await self.delete(session_id)
             return None
 
-    def delete(self, session_id: str) -> None:
-        """Delete a session from Redis."""
-        key = self._make_key(session_id)
-        self._redis.delete(key)
+    async def _migrate_legacy(self, session_id: str, raw: str) -> Optional[Session]:
+        """Convert a JSON-string session into the hash format."""
+        session = Session.from_dict(json.loads(raw))
+        if session.is_expired():
+            await self.delete(session_id)
+            return None
 
-    def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
-        """Extend the TTL of a session."""
         key = self._make_key(session_id)
+        ttl = await self._redis.ttl(key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._to_hash(session))
+            pipe.expire(key, ttl if ttl and ttl > 0 else self._ttl)
+            await pipe.execute()
+        return session
+
+    async def delete(self, session_id: str) -> None:
+        """Delete a session from Redis."""
+        key = self._make_key(session_id)
+        await self._redis.delete(key)
 
-        # Check if session exists
-        if not self._redis.exists(key):
-            return False
-
-        # Update session expiration and save
-        session = self.find_by_id(session_id)
-        if session:
-            session.extend(hours=ttl_seconds // 3600)
-            self.save(session)
-            return True
-
-        return False
+    async def extend_ttl(self, session_id: str, ttl_seconds: int) -> bool:
+        """Extend the TTL of a session (single atomic round-trip)."""
+        session = await self.touch(session_id, ttl_seconds, min_interval_seconds=0)
+        return session is not None
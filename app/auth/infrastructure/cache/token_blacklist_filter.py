@@ -0,0 +1,157 @@
+"""Local bloom filter of blacklisted JWT IDs.
+
+Lets the common case ("this token was never revoked") be answered without a
+Redis round-trip. The filter is seeded from the ``blacklist:*`` keys, kept in
+sync by the pub/sub events ``TokenBlacklistImpl.add_to_blacklist`` publishes,
+and rebuilt periodically so expired entries (which a bloom filter cannot
+delete) do not accumulate. A "maybe" answer is always confirmed against Redis.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis
+from app.config.settings import settings
+
+
+class BloomFilter:
+    """Fixed-size bloom filter using double hashing over SHA-256."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Size the filter for the expected number of entries.
+
+        Args:
+            capacity: Expected number of entries.
+            error_rate: Target false-positive rate at capacity.
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TokenBlacklistFilter:
+    """Process-wide blacklist filter kept in sync with Redis.
+
+    Until the first sync completes (or while the subscription is down) the
+    filter reports ``ready = False`` and callers must fall back to Redis.
+    """
+
+    CHANNEL = "blacklist:events"
+    KEY_PATTERN = "blacklist:*"
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        rebuild_interval_seconds: Optional[int] = None,
+    ):
+        """Initialize the filter.
+
+        Args:
+            redis_client: Async Redis client instance. Uses the shared pool if not provided.
+            capacity: Expected number of live blacklist entries.
+            error_rate: Target false-positive rate.
+            rebuild_interval_seconds: How often the filter is rebuilt from Redis.
+        """
+        self._redis = redis_client
+        self._capacity = capacity or settings.BLACKLIST_BLOOM_CAPACITY
+        self._error_rate = error_rate or settings.BLACKLIST_BLOOM_ERROR_RATE
+        self._rebuild_interval = rebuild_interval_seconds or settings.BLACKLIST_BLOOM_REBUILD_SECONDS
+        self._bloom = BloomFilter(self._capacity, self._error_rate)
+        self._ready = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = get_async_redis()
+        return self._redis
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def might_contain(self, jti: str) -> bool:
+        """False means definitely not blacklisted; True must be confirmed in Redis."""
+        return jti in self._bloom
+
+    def add(self, jti: str) -> None:
+        self._bloom.add(jti)
+
+    async def rebuild(self) -> None:
+        """Rebuild the filter from the current ``blacklist:*`` keys."""
+        bloom = BloomFilter(self._capacity, self._error_rate)
+        prefix_len = len(self.KEY_PATTERN) - 1
+        async for key in self.redis.scan_iter(match=self.KEY_PATTERN, count=1000):
+            bloom.add(key[prefix_len:])
+        self._bloom = bloom
+
+    def start(self) -> None:
+        """Start the background subscriber task (called from app lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.CHANNEL)
+                # Subscribe first, then seed: entries added in between arrive as events
+                await self.rebuild()
+                self._ready = True
+                rebuilt_at = time.monotonic()
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self.add(message["data"])
+                    if time.monotonic() - rebuilt_at > self._rebuild_interval:
+                        await self.rebuild()
+                        rebuilt_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Events may have been missed - fall back to Redis until resubscribed
+                self._ready = False
+                print(f"[TokenBlacklistFilter] subscription error: {e}")
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+
+# Process-wide instance
+token_blacklist_filter = TokenBlacklistFilter()
@@ -2,10 +2,14 @@
 
 from typing import Optional
 
-import redis
+import redis.asyncio as aioredis
 
 from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
-from app.config.redis_config import get_redis
+from app.auth.infrastructure.cache.token_blacklist_filter import (
+    TokenBlacklistFilter,
+    token_blacklist_filter,
+)
+from app.config.redis_config import get_async_redis
 
 
 class TokenBlacklistImpl(TokenBlacklistPort):
@@ -17,23 +21,33 @@ class TokenBlacklistImpl(TokenBlacklistPort):
 
     The TTL should match the token's remaining validity period,
     so entries auto-expire when the token would have expired anyway.
+
+    Lookups go through the process-local bloom filter first; only a
+    "maybe" (or a filter that is not synced yet) costs a Redis EXISTS.
+    Additions are published so other workers update their filters.
     """
 
     KEY_PREFIX = "blacklist:"
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        local_filter: Optional[TokenBlacklistFilter] = None,
+    ):
         """Initialize with Redis client.
 
         Args:
-            redis_client: Redis client instance. Uses default if not provided.
+            redis_client: Async Redis client instance. Uses the shared pool if not provided.
+            local_filter: Bloom filter of blacklisted jtis. Uses the process-wide one if not provided.
         """
-        self._redis = redis_client or get_redis()
+        self._redis = redis_client or get_async_redis()
+        self._filter = local_filter or token_blacklist_filter
 
     def _make_key(self, jti: str) -> str:
         """Create Redis key for blacklisted token."""
         return f"{self.KEY_PREFIX}{jti}"
 
-    def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
+    async def add_to_blacklist(self, jti: str, ttl_seconds: int) -> None:
         """Add a token ID to the blacklist.
 
         Args:
@@ -41,9 +55,13 @@ class TokenBlacklistImpl(TokenBlacklistPort):
             ttl_seconds: Time-to-live in seconds (should match token expiry).
         """
         key = self._make_key(jti)
-        self._redis.setex(key, ttl_seconds, "1")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl_seconds, "1")
+            pipe.publish(TokenBlacklistFilter.CHANNEL, jti)
+            await pipe.execute()
+        self._filter.add(jti)
 
-    def is_blacklisted(self, jti: str) -> bool:
+    async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token ID is blacklisted.
 
         Args:
@@ -52,14 +70,17 @@ class TokenBlacklistImpl(TokenBlacklistPort):
         Returns:
             True if the token is blacklisted, False otherwise.
         """
+        if self._filter.ready and not self._filter.might_contain(jti):
+            return False
+
         key = self._make_key(jti)
-        return self._redis.exists(key) > 0
+        return await self._redis.exists(key) > 0
 
-    def remove_from_blacklist(self, jti: str) -> None:
+    async def remove_from_blacklist(self, jti: str) -> None:
         """Remove a token ID from the blacklist.
 
         Args:
             jti: The JWT ID (jti claim) to remove.
         """
         key = self._make_key(jti)
-        self._redis.delete(key)
+        await self._redis.delete(key)
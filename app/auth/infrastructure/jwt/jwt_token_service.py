@@ -5,6 +5,7 @@ Implements JWT token creation and validation with:
 - AES-encrypted user-specific keys
 - CSRF token integration
 - Token blacklisting support
+- In-process cache of validated tokens
 - Environment-aware secure cookie settings
 """
 
@@ -20,6 +21,10 @@ from app.auth.application.port.jwt_token_port import (
     TokenPayload,
 )
 from app.auth.application.port.token_blacklist_port import TokenBlacklistPort
+from app.auth.infrastructure.jwt.validated_token_cache import (
+    ValidatedTokenCache,
+    validated_token_cache,
+)
 from app.common.infrastructure.encryption import TokenKeyGenerator
 from app.config.settings import settings
 
@@ -38,11 +43,16 @@ class JWTTokenService(JWTTokenPort):
     ALGORITHM = "HS256"
     TOKEN_EXPIRY_HOURS = 12
 
-    def __init__(self, blacklist: Optional[TokenBlacklistPort] = None):
+    def __init__(
+        self,
+        blacklist: Optional[TokenBlacklistPort] = None,
+        token_cache: Optional[ValidatedTokenCache] = None,
+    ):
         """Initialize JWT token service.
 
         Args:
             blacklist: Optional token blacklist for revocation support.
+            token_cache: Cache of already validated tokens. Uses the process-wide one if not provided.
         """
         self._secret_key = settings.JWT_SECRET_KEY
         self._master_key = TokenKeyGenerator.derive_key_from_secret(
@@ -50,6 +60,7 @@ class JWTTokenService(JWTTokenPort):
         )
         self._key_generator = TokenKeyGenerator(self._master_key)
         self._blacklist = blacklist
+        self._token_cache = token_cache or validated_token_cache
 
     def create_token(
         self,
@@ -105,11 +116,11 @@ class JWTTokenService(JWTTokenPort):
             expires_at=expires_at,
         )
 
-    def validate_token(self, token: str) -> Optional[TokenPayload]:
+    async def validate_token(self, token: str) -> Optional[TokenPayload]:
         """Validate a JWT token and extract payload.
 
         Checks:
-        1. Token signature and expiration
+        1. Token signature and expiration (skipped if already validated and cached)
         2. Token not in blacklist (if blacklist is configured)
 
         Args:
@@ -118,6 +129,13 @@ class JWTTokenService(JWTTokenPort):
         Returns:
             TokenPayload if valid, None if invalid, expired, or blacklisted.
         """
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            if self._blacklist and await self._blacklist.is_blacklisted(cached.jti):
+                self._token_cache.discard(token)
+                return None
+            return cached
+
         try:
             payload = jwt.decode(
                 token,
@@ -128,10 +146,10 @@ class JWTTokenService(JWTTokenPort):
             jti = payload["jti"]
 
             # Check if token is blacklisted
-            if self._blacklist and self._blacklist.is_blacklisted(jti):
+            if self._blacklist and await self._blacklist.is_blacklisted(jti):
                 return None
 
-            return TokenPayload(
+            token_payload = TokenPayload(
                 jti=jti,
                 account_id=int(payload["sub"]),
                 encrypted_key=payload["enc_key"],
@@ -141,6 +159,8 @@ class JWTTokenService(JWTTokenPort):
                 exp=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
                 iat=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
             )
+            self._token_cache.put(token, token_payload)
+            return token_payload
         except jwt.ExpiredSignatureError:
             return None
         except jwt.InvalidTokenError:
@@ -148,7 +168,7 @@ class JWTTokenService(JWTTokenPort):
         except (KeyError, ValueError):
             return None
 
-    def blacklist_token(self, token: str) -> bool:
+    async def blacklist_token(self, token: str) -> bool:
         """Add a token to the blacklist.
 
         Args:
@@ -176,12 +196,13 @@ class JWTTokenService(JWTTokenPort):
             # Calculate remaining TTL (or minimum 1 second)
             ttl_seconds = max(int((exp - now).total_seconds()), 1)
 
-            self._blacklist.add_to_blacklist(jti, ttl_seconds)
+            await self._blacklist.add_to_blacklist(jti, ttl_seconds)
+            self._token_cache.discard(token)
             return True
         except (jwt.InvalidTokenError, KeyError, ValueError):
             return False
 
-    def validate_csrf(self, token: str, csrf_token: str) -> bool:
+    async def validate_csrf(self, token: str, csrf_token: str) -> bool:
         """Validate that the CSRF token matches the one in the JWT.
 
         Args:
@@ -191,12 +212,12 @@ class JWTTokenService(JWTTokenPort):
         Returns:
             True if CSRF tokens match, False otherwise.
         """
-        payload = self.validate_token(token)
+        payload = await self.validate_token(token)
         if payload is None:
             return False
         return secrets.compare_digest(payload.csrf_token, csrf_token)
 
-    def refresh_token(self, token: str) -> Optional[TokenPair]:
+    async def refresh_token(self, token: str) -> Optional[TokenPair]:
         """Refresh an existing token if still valid.
 
         Args:
@@ -205,7 +226,7 @@ class JWTTokenService(JWTTokenPort):
         Returns:
             New TokenPair if refresh successful, None otherwise.
         """
-        payload = self.validate_token(token)
+        payload = await self.validate_token(token)
         if payload is None:
             return None
 
@@ -0,0 +1,61 @@
+"""In-process cache of validated JWTs.
+
+A token's signature and claims never change, so once a token has been decoded
+its payload can be reused until ``exp``. Revocation is not cached here; callers
+still check the blacklist (which is local via the bloom filter).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.auth.application.port.jwt_token_port import TokenPayload
+from app.config.settings import settings
+
+
+class ValidatedTokenCache:
+    """Thread-safe LRU of token -> TokenPayload, bounded by each token's exp."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached tokens.
+        """
+        self._max_entries = max_entries or settings.JWT_CACHE_MAX_ENTRIES
+        self._entries: OrderedDict[str, TokenPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        key = self._make_key(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload.exp <= datetime.now(timezone.utc):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        key = self._make_key(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(self._make_key(token), None)
+
+
+# Process-wide instance
+validated_token_cache = ValidatedTokenCache()
@@ -1,5 +1,6 @@
 """Base OAuth provider - Abstract base for OAuth implementations."""
 
+import importlib.util
 from abc import abstractmethod
 from typing import Optional
 from urllib.parse import urlencode
@@ -8,6 +9,26 @@ import httpx
 
 from app.auth.application.port.oauth_provider_port import OAuthProviderPort, OAuthUserInfo
 from app.common.domain.exceptions import OAuthException
+from app.config.settings import settings
+
+# HTTP/2 needs the optional "h2" package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Create a pooled keep-alive client for one OAuth provider."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(
+            settings.OAUTH_HTTP_TIMEOUT_SECONDS,
+            connect=settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
 
 
 class BaseOAuthProvider(OAuthProviderPort):
@@ -39,6 +60,20 @@ class BaseOAuthProvider(OAuthProviderPort):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for this provider (built at startup, rebuilt if closed)."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = build_http_client()
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the provider's HTTP client and its pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     def get_authorization_url(self, state: str) -> str:
         """Get the OAuth authorization URL."""
@@ -67,26 +102,25 @@ class BaseOAuthProvider(OAuthProviderPort):
             "grant_type": "authorization_code",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.TOKEN_URL,
-                    data=data,
-                    headers={"Accept": "application/json"},
-                )
-                response.raise_for_status()
-                token_data = response.json()
-                return token_data.get("access_token", "")
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Token exchange failed: {str(e)}",
-                )
+        try:
+            response = await self.http_client.post(
+                self.TOKEN_URL,
+                data=data,
+                headers={"Accept": "application/json"},
+            )
+            response.raise_for_status()
+            token_data = response.json()
+            return token_data.get("access_token", "")
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Token exchange failed: {str(e)}",
+            )
 
     @abstractmethod
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
@@ -102,22 +136,21 @@ class BaseOAuthProvider(OAuthProviderPort):
         """Fetch user info from provider's userinfo endpoint."""
         url = url or self.USERINFO_URL
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {e.response.status_code}",
-                )
-            except Exception as e:
-                raise OAuthException(
-                    self.provider_name,
-                    f"Failed to fetch user info: {str(e)}",
-                )
+        try:
+            response = await self.http_client.get(
+                url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {e.response.status_code}",
+            )
+        except Exception as e:
+            raise OAuthException(
+                self.provider_name,
+                f"Failed to fetch user info: {str(e)}",
+            )
@@ -13,6 +13,8 @@ class OAuthProviderFactory:
     """Factory for creating OAuth providers.
 
     Uses a registry pattern for easy addition of new providers.
+    Provider instances are cached so each one keeps a single pooled HTTP
+    client for the lifetime of the process (see start/shutdown).
     """
 
     # Provider registry: name -> provider class
@@ -23,6 +25,9 @@ class OAuthProviderFactory:
         "meta": MetaOAuthProvider,
     }
 
+    # Provider instances: name -> provider (created on first use)
+    _instances: Dict[str, OAuthProviderPort] = {}
+
     @classmethod
     def get_provider(cls, provider_name: str) -> OAuthProviderPort:
         """Get an OAuth provider instance by name.
@@ -31,7 +36,7 @@ class OAuthProviderFactory:
             provider_name: Name of the provider (e.g., "google", "kakao", "naver", "meta").
 
         Returns:
-            An instance of the OAuth provider.
+            The shared instance of the OAuth provider.
 
         Raises:
             UnsupportedOAuthProviderException: If provider is not supported.
@@ -42,7 +47,11 @@ class OAuthProviderFactory:
         if provider_class is None:
             raise UnsupportedOAuthProviderException(provider_name)
 
-        return provider_class()
+        provider = cls._instances.get(provider_name)
+        if provider is None:
+            provider = provider_class()
+            cls._instances[provider_name] = provider
+        return provider
 
     @classmethod
     def register_provider(
@@ -57,6 +66,29 @@ class OAuthProviderFactory:
             provider_class: The provider class to register.
         """
         cls._providers[name.lower()] = provider_class
+        cls._instances.pop(name.lower(), None)
+
+    @classmethod
+    def start(cls) -> None:
+        """Create every registered provider and its HTTP client up front.
+
+        Called from the app lifespan (inside each worker, after the fork), so the
+        first OAuth callback doesn't pay for building the client.
+        """
+        for name in cls._providers:
+            provider = cls.get_provider(name)
+            # Accessing the property builds the pooled client
+            getattr(provider, "http_client", None)
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the providers' HTTP clients."""
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        for provider in instances:
+            aclose = getattr(provider, "aclose", None)
+            if aclose is not None:
+                await aclose()
 
     @classmethod
     def get_supported_providers(cls) -> list[str]:
@@ -0,0 +1,35 @@
+"""Admin views over the per-request LLM telemetry."""
+
+from datetime import datetime, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.auth.adapter.input.web.dependencies import verify_admin_role
+from app.common.infrastructure.repository.llm_telemetry_repository_impl import LLMTelemetryRepositoryImpl
+from app.config.database.session import get_read_db_session
+
+router = APIRouter(prefix="/admin/llm-telemetry", tags=["admin"])
+
+GROUPINGS = {
+    "use_case": ["use_case"],
+    "model": ["model"],
+    "use_case_model": ["use_case", "model"],
+}
+
+
+@router.get("")
+def get_llm_telemetry_summary(
+    hours: int = Query(24, ge=1, le=24 * 90),
+    group_by: Literal["use_case", "model", "use_case_model"] = Query("use_case"),
+    admin_id: int = Depends(verify_admin_role),
+    db: Session = Depends(get_read_db_session),
+):
+    """LLM 호출 지연/토큰/비용 집계 (관리자)
+
+    TTFT, 청크 간격, 출력 속도, 토큰(캐시 적중 포함), 비용을 use case / 모델별로 집계합니다.
+    """
+    since = datetime.utcnow() - timedelta(hours=hours)
+    rows = LLMTelemetryRepositoryImpl(db).aggregate(since, GROUPINGS[group_by])
+    return {"since": since, "group_by": group_by, "rows": rows}
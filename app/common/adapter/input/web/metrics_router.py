@@ -0,0 +1,33 @@
+"""Prometheus scrape endpoint for the traced stage latencies."""
+
+import hmac
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from app.common.infrastructure.metrics import metrics_registry
+from app.config.settings import settings
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(authorization: str = Header(default="")):
+    """Per-stage latency histograms of this worker process in Prometheus text format.
+
+    When METRICS_TOKEN is set, the scraper must send ``Authorization: Bearer <token>``.
+    In production the endpoint is only served when a token is configured, since
+    it sits on the public API port.
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if settings.is_production and not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if settings.METRICS_TOKEN and not hmac.compare_digest(
+        authorization, f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return PlainTextResponse(metrics_registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,87 @@
+"""Admin endpoints of the sampling profiler (this worker process only)."""
+
+import asyncio
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.auth.adapter.input.web.dependencies import verify_admin_role
+from app.common.infrastructure.sampling_profiler import (
+    render_collapsed,
+    request_profiler,
+    stack_sampler,
+    top_frames,
+)
+from app.config.settings import settings
+
+router = APIRouter(prefix="/admin/profiler", tags=["admin"])
+
+
+@router.get("")
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0),
+    interval_ms: Optional[float] = Query(None, ge=1, le=1000),
+    format: Literal["collapsed", "json"] = Query("collapsed"),
+    admin_id: int = Depends(verify_admin_role),
+):
+    """워커 프로세스 전체 스레드를 N초간 샘플링 (관리자)
+
+    collapsed는 flamegraph.pl / speedscope에 바로 넣을 수 있는 텍스트, json은 상위 프레임 + 스택 목록입니다.
+    요청을 받은 워커 하나만 프로파일링되며 워커당 동시에 하나만 실행할 수 있습니다.
+    """
+    if not settings.PROFILER_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if seconds > settings.PROFILER_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be <= {settings.PROFILER_MAX_SECONDS}",
+        )
+    if stack_sampler.busy:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Profiler is already running")
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            None, stack_sampler.sample, seconds, interval_ms or settings.PROFILER_DEFAULT_INTERVAL_MS
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    print(f"[Profiler] admin={admin_id} sampled {result['samples']} ticks over {result['duration_ms']}ms")
+    stacks = result.pop("stacks")
+    if format == "collapsed":
+        return PlainTextResponse(render_collapsed(stacks))
+    return {
+        **result,
+        "top_frames": top_frames(stacks),
+        "stacks": [{"stack": stack, "samples": count} for stack, count in stacks.most_common()],
+    }
+
+
+@router.get("/requests")
+def list_request_profiles(admin_id: int = Depends(verify_admin_role)):
+    """샘플링된 요청 중 가장 느린 프로파일 목록 (관리자)"""
+    return {
+        "sample_every": request_profiler.sample_every,
+        "profiles": [profile.summary() for profile in request_profiler.slowest()],
+    }
+
+
+@router.get("/requests/{profile_id}")
+def get_request_profile(
+    profile_id: str,
+    format: Literal["collapsed", "json"] = Query("collapsed"),
+    admin_id: int = Depends(verify_admin_role),
+):
+    """요청 프로파일 하나 (이벤트 루프에서 해당 요청 코드가 실행 중이던 샘플만)"""
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(render_collapsed(profile.stacks))
+    return {
+        **profile.summary(),
+        "top_frames": top_frames(profile.stacks),
+        "stacks": [{"stack": stack, "samples": count} for stack, count in profile.stacks.most_common()],
+    }
@@ -64,3 +64,19 @@ class UnsupportedOAuthProviderException(OAuthException):
 
     def __init__(self, provider: str):
         super().__init__(provider, f"Unsupported OAuth provider: {provider}")
+
+
+# Request exceptions
+class IdempotencyKeyConflictException(DomainException):
+    """Raised when an Idempotency-Key is reused with a different request body."""
+
+    def __init__(self, key: str):
+        super().__init__(f"Idempotency-Key already used for a different request: {key}")
+
+
+class IdempotentRequestFailedException(DomainException):
+    """Raised when the request an Idempotency-Key was claimed for failed."""
+
+    def __init__(self, key: str, error: str | None = None):
+        self.error = error
+        super().__init__(f"Request for Idempotency-Key {key} failed: {error or 'unknown error'}")
@@ -0,0 +1,284 @@
+"""Idempotency key store for streaming generation endpoints.
+
+A client that retries a send (timeout, flaky network) with the same
+``Idempotency-Key`` header must not create a second room/message or pay for a
+second LLM generation. The first request claims the key in Redis and records
+every streamed chunk; retries inside the window replay the recorded chunks and,
+if the generation is still running, keep following it until it completes. The
+generation runs detached from the request, so a client disconnect doesn't
+abort it (or free the key). A generation that fails after its room/message
+exists is kept as FAILED with the room it created, so retries get the stored
+error and the room id instead of creating a second room or re-posting the
+message; the key is freed only when the request failed before creating anything.
+
+Key format:
+    idempotency:{account_id}:{key}          -> JSON record (fingerprint, status, resource_id, error)
+    idempotency:{account_id}:{key}:chunks   -> list of streamed chunks
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Optional, Set
+
+import redis.asyncio as aioredis
+
+from app.common.domain.exceptions import IdempotencyKeyConflictException, IdempotentRequestFailedException
+from app.config.redis_config import get_async_redis
+from app.config.settings import settings
+
+_DONE = object()
+
+# Detached generations (strong references so they aren't garbage collected mid-run)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+@dataclass
+class IdempotencyRecord:
+    """State of a claimed idempotency key."""
+
+    fingerprint: str
+    status: str = "IN_PROGRESS"  # IN_PROGRESS, COMPLETED, FAILED
+    resource_id: Optional[str] = None  # room_id / chat_id created by the request
+    claimed_at: float = 0.0
+    error: Optional[str] = None  # set when FAILED
+
+    @property
+    def is_completed(self) -> bool:
+        return self.status == "COMPLETED"
+
+    @property
+    def is_failed(self) -> bool:
+        return self.status == "FAILED"
+
+
+class IdempotencyStore:
+    """Redis-backed idempotency store with request fingerprinting."""
+
+    KEY_PREFIX = "idempotency:"
+    POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        ttl_seconds: Optional[int] = None,
+        wait_timeout_seconds: Optional[int] = None,
+    ):
+        """Initialize with Redis client and retention window.
+
+        Args:
+            redis_client: Async Redis client instance. Uses the shared pool (resolved on
+                first use, so module-level instances are fork-safe) if not provided.
+            ttl_seconds: How long a key (and its recorded response) is kept.
+            wait_timeout_seconds: How long a retry follows an in-flight generation
+                that stops producing chunks before giving up.
+        """
+        self._redis = redis_client
+        self._ttl = ttl_seconds or settings.IDEMPOTENCY_TTL_SECONDS
+        self._wait_timeout = wait_timeout_seconds or settings.IDEMPOTENCY_WAIT_TIMEOUT_SECONDS
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = get_async_redis()
+        return self._redis
+
+    def _make_key(self, account_id: int, key: str) -> str:
+        return f"{self.KEY_PREFIX}{account_id}:{key}"
+
+    def _make_chunks_key(self, account_id: int, key: str) -> str:
+        return f"{self._make_key(account_id, key)}:chunks"
+
+    @staticmethod
+    def fingerprint(scope: str, payload: dict) -> str:
+        """Hash the request so a reused key with a different body can be rejected."""
+        canonical = json.dumps(
+            {"scope": scope, "payload": payload},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def claim(self, account_id: int, key: str, fingerprint: str) -> Optional[IdempotencyRecord]:
+        """Claim a key for a new generation.
+
+        Returns:
+            None if this request claimed the key and must run the generation,
+            otherwise the existing record (replay it, or report its error if FAILED).
+
+        Raises:
+            IdempotencyKeyConflictException: If the key was used for a different request.
+        """
+        record = IdempotencyRecord(fingerprint=fingerprint, claimed_at=time.time())
+        claimed = await self.redis.set(
+            self._make_key(account_id, key),
+            json.dumps(asdict(record)),
+            nx=True,
+            ex=self._ttl,
+        )
+        if claimed:
+            return None
+
+        existing = await self.get(account_id, key)
+        if existing is None:
+            # Released between SET NX and GET (failed generation) - try once more
+            return await self.claim(account_id, key, fingerprint)
+
+        if existing.fingerprint != fingerprint:
+            raise IdempotencyKeyConflictException(key)
+
+        return existing
+
+    async def get(self, account_id: int, key: str) -> Optional[IdempotencyRecord]:
+        data = await self.redis.get(self._make_key(account_id, key))
+        if data is None:
+            return None
+        try:
+            return IdempotencyRecord(**json.loads(data))
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    async def _update(self, account_id: int, key: str, record: IdempotencyRecord) -> None:
+        await self.redis.set(
+            self._make_key(account_id, key),
+            json.dumps(asdict(record)),
+            xx=True,
+            keepttl=True,
+        )
+
+    async def set_resource_id(self, account_id: int, key: str, resource_id: str) -> None:
+        """Remember the room/chat created by the request so replays can report it."""
+        record = await self.get(account_id, key)
+        if record is None:
+            return
+        record.resource_id = resource_id
+        await self._update(account_id, key, record)
+
+    async def append_chunk(self, account_id: int, key: str, chunk: str | bytes) -> None:
+        chunks_key = self._make_chunks_key(account_id, key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(chunks_key, chunk)
+            pipe.expire(chunks_key, self._ttl)
+            await pipe.execute()
+
+    async def complete(self, account_id: int, key: str) -> None:
+        record = await self.get(account_id, key)
+        if record is None:
+            return
+        record.status = "COMPLETED"
+        await self._update(account_id, key, record)
+
+    async def fail(self, account_id: int, key: str, error: str) -> None:
+        """Keep the key (and the room/chat it created) as FAILED so retries don't redo side effects."""
+        record = await self.get(account_id, key)
+        if record is None:
+            return
+        record.status = "FAILED"
+        record.error = error
+        await self._update(account_id, key, record)
+
+    async def release(self, account_id: int, key: str) -> None:
+        """Forget a request that created nothing so the client can retry with the same key."""
+        await self.redis.delete(
+            self._make_key(account_id, key),
+            self._make_chunks_key(account_id, key),
+        )
+
+    async def abort(self, account_id: int, key: str, error: str) -> None:
+        """Handle a request that failed before its generation started.
+
+        The key is released if no room/chat was recorded yet, otherwise it is
+        kept as FAILED pointing at the resource that already exists.
+        """
+        record = await self.get(account_id, key)
+        if record is None:
+            return
+        if record.resource_id is None:
+            await self.release(account_id, key)
+        else:
+            await self.fail(account_id, key, error)
+
+    async def record(
+        self,
+        account_id: int,
+        key: str,
+        generator: AsyncIterator,
+    ) -> AsyncIterator:
+        """Run the claiming request's generation in a detached task, recording every chunk.
+
+        The generation outlives the client connection: if the client disconnects
+        (timeout, flaky network), it still runs to completion so a retry with the
+        same key replays the full response instead of generating a second one.
+        If the generation fails, the key is kept as FAILED (see ``fail``).
+
+        The request's Session may be closed by its dependency while the task is
+        still running; a closed Session simply begins a new transaction on next use.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self._produce(account_id, key, generator, queue))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    async def _produce(self, account_id: int, key: str, generator: AsyncIterator, queue: asyncio.Queue) -> None:
+        try:
+            async for chunk in generator:
+                await self.append_chunk(account_id, key, chunk)
+                queue.put_nowait(chunk)
+        except asyncio.CancelledError:
+            # Worker shutdown: keep the key (IN_PROGRESS with the partial output)
+            # so a retry replays instead of starting a second generation
+            queue.put_nowait(_DONE)
+            raise
+        except Exception as e:
+            # The user message / room may already be saved - never let a retry redo them
+            await self.fail(account_id, key, str(e) or type(e).__name__)
+            queue.put_nowait(e)
+            return
+        await self.complete(account_id, key)
+        queue.put_nowait(_DONE)
+
+    async def replay(self, account_id: int, key: str) -> AsyncIterator[str]:
+        """Stream the recorded response, following an in-flight generation.
+
+        Raises:
+            IdempotentRequestFailedException: If the followed generation fails,
+                so the stream is aborted like the original instead of ending cleanly.
+        """
+        chunks_key = self._make_chunks_key(account_id, key)
+        offset = 0
+        last_progress = time.monotonic()
+
+        while True:
+            chunks = await self.redis.lrange(chunks_key, offset, -1)
+            if chunks:
+                offset += len(chunks)
+                last_progress = time.monotonic()
+                for chunk in chunks:
+                    yield chunk
+
+            record = await self.get(account_id, key)
+            if record is None:
+                # Original request failed before creating anything and released the key
+                return
+            if record.is_completed or record.is_failed:
+                # Drain anything appended between LRANGE and the status read
+                for chunk in await self.redis.lrange(chunks_key, offset, -1):
+                    yield chunk
+                if record.is_failed:
+                    raise IdempotentRequestFailedException(key, record.error)
+                return
+            if time.monotonic() - last_progress > self._wait_timeout:
+                return
+
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
@@ -0,0 +1,256 @@
+"""Per-request LLM telemetry.
+
+``LLMCallTracker`` follows one completion call: time to first token,
+inter-chunk gaps, the token usage reported by the API (for streams, the
+``stream_options={"include_usage": True}`` frame) and the resolved model.
+Finished records are queued to ``LLMTelemetryWriter``, which inserts them
+into ``llm_telemetry`` in batches from a background task, so the request
+path never waits on the database. When the queue is full records are dropped
+(and counted) rather than applying backpressure to generations.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+
+from app.common.infrastructure.metrics import metrics_registry
+from app.config.settings import settings
+
+# USD per 1M tokens: (input, cached input, output). Matched by longest model prefix.
+MODEL_PRICING_USD_PER_MTOK = {
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+}
+
+
+def estimate_cost_usd(
+    model: str,
+    prompt_tokens: Optional[int],
+    cached_tokens: Optional[int],
+    completion_tokens: Optional[int],
+) -> Optional[float]:
+    """Cost of one call from its usage, or None for unknown models / missing usage."""
+    if prompt_tokens is None or completion_tokens is None:
+        return None
+    matches = [prefix for prefix in MODEL_PRICING_USD_PER_MTOK if model.startswith(prefix)]
+    if not matches:
+        return None
+    input_price, cached_price, output_price = MODEL_PRICING_USD_PER_MTOK[max(matches, key=len)]
+    cached = cached_tokens or 0
+    return (
+        (prompt_tokens - cached) * input_price
+        + cached * cached_price
+        + completion_tokens * output_price
+    ) / 1_000_000
+
+
+@dataclass
+class LLMTelemetryRecord:
+    """One LLM call (row of ``llm_telemetry``)."""
+
+    use_case: str
+    model: str
+    status: str
+    duration_ms: float
+    streamed: int = 1
+    account_id: Optional[int] = None
+    ttft_ms: Optional[float] = None
+    max_gap_ms: Optional[float] = None
+    mean_gap_ms: Optional[float] = None
+    chunk_count: int = 0
+    prompt_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    tokens_per_sec: Optional[float] = None
+    cost_usd: Optional[float] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class LLMCallTracker:
+    """Collects timings and usage of one completion call."""
+
+    def __init__(self, use_case: str, model: str, account_id: Optional[int] = None, streamed: bool = True):
+        self.use_case = use_case
+        self.model = model
+        self.account_id = account_id
+        self.streamed = streamed
+        self._started = time.perf_counter()
+        self._first_at: Optional[float] = None
+        self._last_at: Optional[float] = None
+        self._max_gap = 0.0
+        self._gap_total = 0.0
+        self.chunk_count = 0
+        self.prompt_tokens: Optional[int] = None
+        self.cached_tokens: Optional[int] = None
+        self.completion_tokens: Optional[int] = None
+
+    def on_chunk(self) -> None:
+        """A content chunk arrived."""
+        now = time.perf_counter()
+        if self._first_at is None:
+            self._first_at = now
+        else:
+            gap = now - self._last_at
+            self._gap_total += gap
+            if gap > self._max_gap:
+                self._max_gap = gap
+        self._last_at = now
+        self.chunk_count += 1
+
+    def on_usage(self, usage: Any, model: Optional[str] = None) -> None:
+        """Usage object of the response (or of the final stream frame)."""
+        if model:
+            self.model = model
+        if usage is None:
+            return
+        self.prompt_tokens = getattr(usage, "prompt_tokens", None)
+        self.completion_tokens = getattr(usage, "completion_tokens", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.cached_tokens = getattr(details, "cached_tokens", None) if details is not None else None
+
+    def finish(self, status: str = "ok") -> LLMTelemetryRecord:
+        """Build the record, feed the stage histograms and queue it for the DB."""
+        ended = time.perf_counter()
+        duration_ms = (ended - self._started) * 1000
+        ttft_ms = (self._first_at - self._started) * 1000 if self.streamed and self._first_at else None
+        gaps = self.chunk_count - 1
+        tokens_per_sec = None
+        if self.completion_tokens and self._first_at and self._last_at and self._last_at > self._first_at:
+            tokens_per_sec = self.completion_tokens / (self._last_at - self._first_at)
+
+        record = LLMTelemetryRecord(
+            use_case=self.use_case,
+            model=self.model,
+            status=status,
+            duration_ms=duration_ms,
+            streamed=int(self.streamed),
+            account_id=self.account_id,
+            ttft_ms=ttft_ms,
+            max_gap_ms=self._max_gap * 1000 if gaps > 0 else None,
+            mean_gap_ms=self._gap_total / gaps * 1000 if gaps > 0 else None,
+            chunk_count=self.chunk_count,
+            prompt_tokens=self.prompt_tokens,
+            cached_tokens=self.cached_tokens,
+            completion_tokens=self.completion_tokens,
+            tokens_per_sec=tokens_per_sec,
+            cost_usd=estimate_cost_usd(
+                self.model, self.prompt_tokens, self.cached_tokens, self.completion_tokens
+            ),
+        )
+
+        metrics_registry.observe(f"llm.{self.use_case}.duration", duration_ms)
+        if ttft_ms is not None:
+            metrics_registry.observe(f"llm.{self.use_case}.ttft", ttft_ms)
+        if status != "ok":
+            metrics_registry.count_error(f"llm.{self.use_case}")
+
+        llm_telemetry_writer.submit(record)
+        return record
+
+
+class LLMTelemetryWriter:
+    """Batches telemetry records into ``llm_telemetry`` from a background task."""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            batch_size: Records per INSERT (a full batch is flushed immediately).
+            flush_interval_seconds: Upper bound on how long a record waits in memory.
+            max_queue: Records kept in memory before new ones are dropped.
+        """
+        self._batch_size = batch_size or settings.LLM_TELEMETRY_BATCH_SIZE
+        self._flush_interval = flush_interval_seconds or settings.LLM_TELEMETRY_FLUSH_SECONDS
+        self._max_queue = max_queue or settings.LLM_TELEMETRY_MAX_QUEUE
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def submit(self, record: LLMTelemetryRecord) -> None:
+        """Queue a record (never blocks; dropped when disabled, not started or full)."""
+        if not settings.LLM_TELEMETRY_ENABLED or self._queue is None:
+            return
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """Start the background flush task (called from app lifespan)."""
+        if settings.LLM_TELEMETRY_ENABLED and self._task is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                await self._flush(self._drain())
+            self._queue = None
+
+    def _drain(self) -> List[LLMTelemetryRecord]:
+        batch = []
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            try:
+                # Collect up to a full batch or until the flush interval has passed
+                while len(batch) < self._batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopping: don't lose what was already taken off the queue
+                await asyncio.shield(self._flush(batch))
+                raise
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[LLMTelemetryRecord]) -> None:
+        if not batch:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._insert, [asdict(r) for r in batch])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[LLMTelemetry] failed to write {len(batch)} records: {e}")
+
+    @staticmethod
+    def _insert(rows: List[dict]) -> None:
+        from app.common.infrastructure.orm.llm_telemetry_orm import LLMTelemetryOrm
+        from app.config.database.session import SessionLocal
+
+        with SessionLocal() as session:
+            session.execute(LLMTelemetryOrm.__table__.insert(), rows)
+            session.commit()
+
+
+# Process-wide instance
+llm_telemetry_writer = LLMTelemetryWriter()
@@ -0,0 +1,161 @@
+"""In-process latency metrics with Prometheus text exposition.
+
+Latencies are recorded into HDR-style histograms: values (in microseconds)
+fall into log-linear buckets, 2**SUB_BUCKET_BITS buckets per power of two,
+so every recorded value keeps ~3% relative precision at any magnitude with a
+small, bounded number of buckets. Percentiles are computed from those buckets;
+the Prometheus histogram is exported on a fixed set of ``le`` bounds.
+
+Metrics are per worker process (each gunicorn worker serves its own
+``/metrics``) and every series carries a ``worker`` (pid) label, so a scrape
+landing on a different worker shows up as a different series instead of a
+counter reset. Aggregate across workers in PromQL, e.g.
+``sum by (stage, le) (rate(..._bucket[5m]))``.
+"""
+
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+# Prometheus ``le`` bounds in seconds
+EXPORT_BUCKETS_SECONDS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+EXPORT_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram (thread-safe)."""
+
+    SUB_BUCKET_BITS = 5  # 32 buckets per power of two -> <= 1/32 relative error
+
+    def __init__(self):
+        self._counts: Dict[int, int] = defaultdict(int)  # bucket lower bound (us) -> count
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    @classmethod
+    def _bucket(cls, value_us: int) -> Tuple[int, int]:
+        """(lower bound, width) of the bucket holding value_us."""
+        shift = max(value_us.bit_length() - cls.SUB_BUCKET_BITS - 1, 0)
+        return (value_us >> shift) << shift, 1 << shift
+
+    def record(self, elapsed_ms: float) -> None:
+        value_us = max(int(elapsed_ms * 1000), 0)
+        lower, _ = self._bucket(value_us)
+        with self._lock:
+            self._counts[lower] += 1
+            self.count += 1
+            self.sum_us += value_us
+            if value_us > self.max_us:
+                self.max_us = value_us
+
+    def _snapshot(self) -> Tuple[List[Tuple[int, int]], int, int]:
+        with self._lock:
+            return sorted(self._counts.items()), self.count, self.sum_us
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-quantile (0..1) in milliseconds (bucket upper bound)."""
+        buckets, count, _ = self._snapshot()
+        if count == 0:
+            return 0.0
+        rank = max(int(q * count + 0.5), 1)
+        seen = 0
+        for lower, n in buckets:
+            seen += n
+            if seen >= rank:
+                _, width = self._bucket(lower)
+                return min(lower + width - 1, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def cumulative(self, bounds_us: Iterable[int]) -> List[int]:
+        """Counts of recorded values <= each bound (buckets straddling a bound count as above it)."""
+        buckets, _, _ = self._snapshot()
+        result = []
+        for bound in bounds_us:
+            result.append(sum(n for lower, n in buckets if lower + self._bucket(lower)[1] - 1 <= bound))
+        return result
+
+
+class MetricsRegistry:
+    """Process-wide named latency histograms and counters."""
+
+    def __init__(self, namespace: str = "gugudan"):
+        self.namespace = namespace
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def observe(self, name: str, elapsed_ms: float) -> None:
+        self.histogram(name).record(elapsed_ms)
+
+    def count_error(self, name: str) -> None:
+        with self._lock:
+            self._errors[name] += 1
+
+    def stage_summary(self) -> Dict[str, dict]:
+        """Per-stage count and percentiles in ms (for logs / admin views)."""
+        return {
+            name: {
+                "count": histogram.count,
+                "p50_ms": histogram.percentile(0.5),
+                "p90_ms": histogram.percentile(0.9),
+                "p99_ms": histogram.percentile(0.99),
+                "max_ms": histogram.max_us / 1000,
+            }
+            for name, histogram in sorted(self._histograms.items())
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        latency = f"{self.namespace}_stage_latency_seconds"
+        quantiles = f"{self.namespace}_stage_latency_quantile_seconds"
+        errors = f"{self.namespace}_stage_errors_total"
+        bounds_us = [int(b * 1_000_000) for b in EXPORT_BUCKETS_SECONDS]
+        # Resolved per render: the registry is created before gunicorn forks the workers
+        worker = os.getpid()
+
+        lines = [
+            f"# HELP {latency} Latency of traced stages.",
+            f"# TYPE {latency} histogram",
+        ]
+        histograms = sorted(self._histograms.items())
+        for name, histogram in histograms:
+            for bound, cumulative in zip(EXPORT_BUCKETS_SECONDS, histogram.cumulative(bounds_us)):
+                lines.append(f'{latency}_bucket{{worker="{worker}",stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{latency}_bucket{{worker="{worker}",stage="{name}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{latency}_sum{{worker="{worker}",stage="{name}"}} {histogram.sum_us / 1_000_000:.6f}')
+            lines.append(f'{latency}_count{{worker="{worker}",stage="{name}"}} {histogram.count}')
+
+        lines += [
+            f"# HELP {quantiles} Latency percentiles of traced stages (HDR histogram, this process).",
+            f"# TYPE {quantiles} gauge",
+        ]
+        for name, histogram in histograms:
+            for q in EXPORT_QUANTILES:
+                lines.append(
+                    f'{quantiles}{{worker="{worker}",stage="{name}",quantile="{q}"}} {histogram.percentile(q) / 1000:.6f}'
+                )
+
+        lines += [
+            f"# HELP {errors} Traced stages that raised.",
+            f"# TYPE {errors} counter",
+        ]
+        for name, count in sorted(self._errors.items()):
+            lines.append(f'{errors}{{worker="{worker}",stage="{name}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide instance
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,40 @@
+from sqlalchemy import BigInteger, Column, DateTime, Float, Index, Integer, String
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class LLMTelemetryOrm(Base):
+    """
+    LLM 호출 1건의 지연/토큰/비용 기록 (배치로 비동기 저장).
+    use_case: chat / summary / simulation
+    """
+    __tablename__ = "llm_telemetry"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    use_case = Column(String(32), nullable=False)
+    model = Column(String(64), nullable=False)
+    account_id = Column(Integer, nullable=True)
+    status = Column(String(16), nullable=False)  # ok / error
+    streamed = Column(Integer, nullable=False, default=1)
+
+    ttft_ms = Column(Float, nullable=True)  # 첫 토큰까지 (스트리밍만)
+    duration_ms = Column(Float, nullable=False)
+    max_gap_ms = Column(Float, nullable=True)  # 토큰(청크) 사이 최대 간격
+    mean_gap_ms = Column(Float, nullable=True)
+    chunk_count = Column(Integer, nullable=False, default=0)
+
+    prompt_tokens = Column(Integer, nullable=True)
+    cached_tokens = Column(Integer, nullable=True)  # 프롬프트 캐시 적중 토큰
+    completion_tokens = Column(Integer, nullable=True)
+    tokens_per_sec = Column(Float, nullable=True)  # 첫 토큰 이후 출력 속도
+    cost_usd = Column(Float, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # --- 인덱스 설정 ---
+    __table_args__ = (
+        # 기간 + use case / 모델별 집계
+        Index('idx_llm_telemetry_use_case_created', 'use_case', 'created_at'),
+        Index('idx_llm_telemetry_model_created', 'model', 'created_at'),
+        Index('idx_llm_telemetry_created', 'created_at'),
+    )
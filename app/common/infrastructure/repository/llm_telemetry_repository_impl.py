@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.common.infrastructure.orm.llm_telemetry_orm import LLMTelemetryOrm
+
+GROUP_COLUMNS = {
+    "use_case": LLMTelemetryOrm.use_case,
+    "model": LLMTelemetryOrm.model,
+}
+
+
+class LLMTelemetryRepositoryImpl:
+
+    def __init__(self, session: Session):
+        self.db = session
+
+    def aggregate(self, since: datetime, group_by: List[str]) -> List[dict]:
+        """since 이후 호출을 group_by(use_case / model) 단위로 집계"""
+        keys = [GROUP_COLUMNS[g] for g in group_by]
+        t = LLMTelemetryOrm
+        rows = (
+            self.db.query(
+                *keys,
+                func.count(t.id).label("calls"),
+                func.sum(case((t.status == "error", 1), else_=0)).label("errors"),
+                func.avg(t.ttft_ms).label("avg_ttft_ms"),
+                func.max(t.ttft_ms).label("max_ttft_ms"),
+                func.avg(t.duration_ms).label("avg_duration_ms"),
+                func.avg(t.mean_gap_ms).label("avg_gap_ms"),
+                func.max(t.max_gap_ms).label("max_gap_ms"),
+                func.avg(t.tokens_per_sec).label("avg_tokens_per_sec"),
+                func.sum(t.prompt_tokens).label("prompt_tokens"),
+                func.sum(t.cached_tokens).label("cached_tokens"),
+                func.sum(t.completion_tokens).label("completion_tokens"),
+                func.sum(t.cost_usd).label("cost_usd"),
+            )
+            .filter(t.created_at >= since)
+            .group_by(*keys)
+            .order_by(*keys)
+            .all()
+        )
+
+        result = []
+        for row in rows:
+            item = row._asdict()
+            for key in ("avg_ttft_ms", "max_ttft_ms", "avg_duration_ms", "avg_gap_ms",
+                        "max_gap_ms", "avg_tokens_per_sec", "cost_usd"):
+                item[key] = round(float(item[key]), 4) if item[key] is not None else None
+            for key in ("errors", "prompt_tokens", "cached_tokens", "completion_tokens"):
+                item[key] = int(item[key] or 0)
+            item["cache_hit_ratio"] = (
+                round(item["cached_tokens"] / item["prompt_tokens"], 4) if item["prompt_tokens"] else None
+            )
+            result.append(item)
+        return result
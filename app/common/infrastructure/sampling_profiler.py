@@ -0,0 +1,277 @@
+"""Statistical sampling profiler.
+
+A daemon thread periodically snapshots every thread's Python stack with
+``sys._current_frames()`` and counts collapsed stacks (``a;b;c count``), the
+format flamegraph.pl / speedscope / inferno read directly. Nothing is hooked
+into the profiled code, so the overhead is one stack walk per thread per
+interval and only while a profile is running.
+
+Two modes:
+- ``StackSampler.sample(seconds)``: every thread of this worker for a fixed
+  window (admin endpoint).
+- ``RequestProfilingMiddleware``: 1 in PROFILER_REQUEST_SAMPLE_EVERY requests
+  per route is profiled. Only samples where the event loop thread is executing
+  that request's code count (the request's ASGI frame is on the loop stack), so
+  concurrent requests don't pollute each other. The slowest profiles are kept in
+  memory for the admin endpoint.
+
+Work running in process pools (PDF rendering, image compression) happens in
+other processes and is not visible here; sync endpoints run on threadpool
+threads and only show up in the whole-process mode.
+"""
+
+import heapq
+import itertools
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Dict, List, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import settings
+
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+
+def _collapse(frame: Optional[FrameType], stop: Optional[FrameType] = None) -> List[str]:
+    """Frame labels root-first, optionally cut just above ``stop``."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        if frame is stop:
+            break
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def render_collapsed(stacks: Counter) -> str:
+    """Brendan Gregg's folded format (one ``frame;frame;frame count`` per line)."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def top_frames(stacks: Counter, limit: int = 20) -> List[dict]:
+    """Leaf frames by self samples (where the time was actually spent)."""
+    total = sum(stacks.values()) or 1
+    leaves = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    return [
+        {"frame": frame, "samples": count, "ratio": round(count / total, 4)}
+        for frame, count in leaves.most_common(limit)
+    ]
+
+
+class StackSampler:
+    """Whole-process sampler (one profile at a time per worker)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def sample(self, seconds: float, interval_ms: float) -> dict:
+        """Sample all threads (blocking; run it in a thread). Raises RuntimeError if busy."""
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running in this worker")
+        try:
+            own_id = threading.get_ident()
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stacks: Counter = Counter()
+            samples = 0
+            interval = interval_ms / 1000
+            started = time.perf_counter()
+            deadline = started + seconds
+
+            while time.perf_counter() < deadline:
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_id:
+                        continue
+                    thread_name = names.get(thread_id)
+                    if thread_name is None:
+                        names = {t.ident: t.name for t in threading.enumerate()}
+                        thread_name = names.get(thread_id, str(thread_id))
+                    stacks[";".join([f"thread:{thread_name}"] + _collapse(frame))] += 1
+                samples += 1
+                time.sleep(interval)
+
+            return {
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "interval_ms": interval_ms,
+                "samples": samples,
+                "stacks": stacks,
+            }
+        finally:
+            self._lock.release()
+
+
+@dataclass
+class RequestProfile:
+    profile_id: str
+    route: str
+    method: str
+    path: str
+    started_at: float
+    anchor: FrameType = field(repr=False)
+    duration_ms: float = 0.0
+    status: Optional[int] = None
+    stacks: Counter = field(default_factory=Counter)
+
+    def summary(self) -> dict:
+        return {
+            "profile_id": self.profile_id,
+            "route": self.route,
+            "path": self.path,
+            "status": self.status,
+            "duration_ms": round(self.duration_ms, 1),
+            "on_cpu_samples": sum(self.stacks.values()),
+            "top_frames": top_frames(self.stacks, limit=5),
+        }
+
+
+class RequestProfiler:
+    """Samples the event loop thread on behalf of the requests being profiled.
+
+    One sampler thread runs while at least one request is profiled; each sample
+    is credited to every active request whose anchor frame is on the loop stack.
+    """
+
+    def __init__(self, sample_every: Optional[int] = None, keep: Optional[int] = None):
+        self.sample_every = settings.PROFILER_REQUEST_SAMPLE_EVERY if sample_every is None else sample_every
+        self._keep = keep or settings.PROFILER_REQUEST_KEEP
+        self._interval = settings.PROFILER_REQUEST_INTERVAL_MS / 1000
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._active: Dict[str, RequestProfile] = {}
+        self._slowest: List[tuple] = []  # min-heap of (duration_ms, seq, profile)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_every > 0
+
+    def should_profile(self, route: str) -> bool:
+        with self._lock:
+            self._counters[route] += 1
+            return self._counters[route] % self.sample_every == 0
+
+    def begin(self, route: str, method: str, path: str, anchor: FrameType) -> RequestProfile:
+        profile = RequestProfile(
+            profile_id=uuid.uuid4().hex[:12],
+            route=route,
+            method=method,
+            path=path,
+            started_at=time.time(),
+            anchor=anchor,
+        )
+        with self._lock:
+            self._loop_thread_id = threading.get_ident()
+            self._active[profile.profile_id] = profile
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def end(self, profile: RequestProfile, duration_ms: float, status: Optional[int]) -> None:
+        profile.duration_ms = duration_ms
+        profile.status = status
+        profile.anchor = None  # don't keep the request's frames alive
+        with self._lock:
+            self._active.pop(profile.profile_id, None)
+            entry = (duration_ms, next(self._seq), profile)
+            if len(self._slowest) < self._keep:
+                heapq.heappush(self._slowest, entry)
+            elif duration_ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+                active = list(self._active.values())
+                loop_thread_id = self._loop_thread_id
+
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is not None:
+                on_stack = set()
+                cursor = frame
+                while cursor is not None:
+                    on_stack.add(id(cursor))
+                    cursor = cursor.f_back
+                for profile in active:
+                    anchor = profile.anchor
+                    if anchor is not None and id(anchor) in on_stack:
+                        profile.stacks[";".join(_collapse(frame, stop=anchor))] += 1
+            time.sleep(self._interval)
+
+    def slowest(self) -> List[RequestProfile]:
+        with self._lock:
+            return [entry[2] for entry in sorted(self._slowest, key=lambda e: e[0], reverse=True)]
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((p for p in self.slowest() if p.profile_id == profile_id), None)
+
+
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-fA-F-]{16,})(?=/|$)")
+
+
+def route_key(method: str, path: str) -> str:
+    """Route bucket for 1-in-N sampling (numeric / UUID path segments collapsed)."""
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class RequestProfilingMiddleware:
+    """Pure ASGI middleware profiling 1 in N requests per route."""
+
+    def __init__(self, app: ASGIApp, profiler: Optional[RequestProfiler] = None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope.get("method", ""), scope.get("path", "")
+        route = route_key(method, path)
+        if not self.profiler.should_profile(route):
+            await self.app(scope, receive, send)
+            return
+
+        status: Dict[str, int] = {}
+
+        async def send_with_status(message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        # This coroutine's frame anchors the request's work on the loop thread
+        profile = self.profiler.begin(route, method, path, sys._getframe())
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.profiler.end(profile, (time.perf_counter() - started) * 1000, status.get("code"))
+
+
+# Process-wide instances
+stack_sampler = StackSampler()
+request_profiler = RequestProfiler()
@@ -0,0 +1,124 @@
+"""Single-flight execution for expensive, cacheable work.
+
+Concurrent callers asking for the same key share one execution:
+- within a worker process they await the same asyncio task, which runs to
+  completion even if the caller that started it is cancelled;
+- across worker processes a Redis lock elects one runner, and the others poll
+  a ``lookup`` callback (usually a cache read) until the result shows up. A
+  caller that wins the lock checks ``lookup`` once more before running, so a
+  result stored by the previous holder is never recomputed.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis
+
+
+class SingleFlight:
+    """Deduplicates concurrent executions of the same keyed coroutine."""
+
+    KEY_PREFIX = "singleflight:"
+    POLL_INTERVAL_SECONDS = 0.2
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        lock_timeout_seconds: int = 120,
+    ):
+        """Initialize single-flight group.
+
+        Args:
+            redis_client: Async Redis client instance. Uses the shared pool (resolved on
+                first use, so module-level instances are fork-safe) if not provided.
+            lock_timeout_seconds: Upper bound for one execution. The cross-process
+                lock expires after this, so a crashed runner cannot block others.
+        """
+        self._redis = redis_client
+        self._lock_timeout = lock_timeout_seconds
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = get_async_redis()
+        return self._redis
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        lookup: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """Run ``fn`` once for ``key`` and share its result with concurrent callers.
+
+        Args:
+            key: Identity of the work (e.g. ``summary:{room_id}:{last_message_id}``).
+            fn: Coroutine factory performing the work.
+            lookup: Coroutine factory returning the stored result or None. Used by
+                callers in other processes while another process holds the lock, so
+                it must read committed state (not a cached/snapshotted session view).
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            # The execution is a task of its own, so a caller that is cancelled
+            # (client disconnect) doesn't cancel it for the other waiters
+            task = asyncio.create_task(self._run_exclusive(key, fn, lookup))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Retrieve it so a task whose callers all went away doesn't log "exception never retrieved"
+            task.exception()
+
+    async def _run_exclusive(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        lookup: Optional[Callable[[], Awaitable[Any]]],
+    ) -> Any:
+        lock_key = f"{self.KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self._lock_timeout
+
+        while True:
+            if await self.redis.set(lock_key, token, nx=True, ex=self._lock_timeout):
+                try:
+                    # The previous holder may have stored the result between our
+                    # last lookup and the lock release - don't redo its work
+                    return await self._lookup_or_run(fn, lookup)
+                finally:
+                    # Release only our own lock (it may have expired and been re-taken)
+                    if await self.redis.get(lock_key) == token:
+                        await self.redis.delete(lock_key)
+
+            if time.monotonic() > deadline:
+                # The holder is stuck or gone; run it ourselves unless the result landed meanwhile
+                return await self._lookup_or_run(fn, lookup)
+
+            # Another process is running it - wait for its result
+            if lookup is not None:
+                result = await lookup()
+                if result is not None:
+                    return result
+
+            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+
+    @staticmethod
+    async def _lookup_or_run(
+        fn: Callable[[], Awaitable[Any]],
+        lookup: Optional[Callable[[], Awaitable[Any]]],
+    ) -> Any:
+        if lookup is not None:
+            result = await lookup()
+            if result is not None:
+                return result
+        return await fn()
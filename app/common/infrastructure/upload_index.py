@@ -0,0 +1,122 @@
+"""Content-addressed index of uploaded files.
+
+Uploads are identified by the sha256 of the bytes the client sent, so a user
+re-uploading the same screenshot gets the already stored object back without
+another compression pass or S3 write. Derived data (text extracted from a
+file) is cached by the same hash and shared by every copy of the content.
+
+Key format:
+    upload:sha:{account_id}:{sha256}  -> S3 key of the stored object (per account)
+    upload:path:{s3_key}              -> sha256 of the object's content
+    upload:text:{sha256}              -> extracted text
+    upload:vision:{s3_key}            -> S3 key of the image's vision variant ("" if it has none)
+    upload:intent:{upload_id}         -> JSON of a pending direct (presigned) upload
+"""
+
+import hashlib
+import json
+from typing import BinaryIO, Optional
+
+import redis.asyncio as aioredis
+
+from app.config.redis_config import get_async_redis
+from app.config.settings import settings
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_fileobj(fileobj: BinaryIO) -> str:
+    """Hash a file object from the start and rewind it (blocking; run in a thread)."""
+    digest = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+class UploadIndex:
+    """Redis-backed sha256 -> S3 key index with an extraction cache."""
+
+    KEY_PREFIX = "upload:"
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        ttl_seconds: Optional[int] = None,
+        text_ttl_seconds: Optional[int] = None,
+    ):
+        """Initialize with Redis client and retention windows.
+
+        Args:
+            redis_client: Async Redis client instance. Uses the shared pool (resolved on
+                first use, so module-level instances are fork-safe) if not provided.
+            ttl_seconds: How long an upload stays deduplicable. Keep it below the
+                bucket's lifecycle expiration so the index never points at a deleted object.
+            text_ttl_seconds: How long extracted text is cached.
+        """
+        self._redis = redis_client
+        self._ttl = ttl_seconds or settings.UPLOAD_INDEX_TTL_SECONDS
+        self._text_ttl = text_ttl_seconds or settings.UPLOAD_TEXT_CACHE_TTL_SECONDS
+
+    @property
+    def redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = get_async_redis()
+        return self._redis
+
+    def _make_key(self, account_id: int, digest: str) -> str:
+        return f"{self.KEY_PREFIX}sha:{account_id}:{digest}"
+
+    def _make_path_key(self, path: str) -> str:
+        return f"{self.KEY_PREFIX}path:{path}"
+
+    def _make_text_key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}text:{digest}"
+
+    def _make_vision_key(self, path: str) -> str:
+        return f"{self.KEY_PREFIX}vision:{path}"
+
+    def _make_intent_key(self, upload_id: str) -> str:
+        return f"{self.KEY_PREFIX}intent:{upload_id}"
+
+    async def find(self, account_id: int, digest: str) -> Optional[str]:
+        """S3 key of content the account already uploaded, or None."""
+        return await self.redis.get(self._make_key(account_id, digest))
+
+    async def save(self, account_id: int, digest: str, path: str) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._make_key(account_id, digest), path, ex=self._ttl)
+            pipe.set(self._make_path_key(path), digest, ex=self._ttl)
+            await pipe.execute()
+
+    async def digest_of(self, path: str) -> Optional[str]:
+        return await self.redis.get(self._make_path_key(path))
+
+    async def get_text(self, digest: str) -> Optional[str]:
+        return await self.redis.get(self._make_text_key(digest))
+
+    async def set_text(self, digest: str, text: str) -> None:
+        if len(text) > settings.UPLOAD_TEXT_CACHE_MAX_CHARS:
+            return
+        await self.redis.set(self._make_text_key(digest), text, ex=self._text_ttl)
+
+    async def get_vision(self, path: str) -> Optional[str]:
+        """Vision variant key of an image, "" if it has none, None if unknown."""
+        return await self.redis.get(self._make_vision_key(path))
+
+    async def set_vision(self, path: str, variant: Optional[str]) -> None:
+        await self.redis.set(self._make_vision_key(path), variant or "", ex=self._ttl)
+
+    async def save_intent(self, upload_id: str, intent: dict, ttl_seconds: int) -> None:
+        await self.redis.set(self._make_intent_key(upload_id), json.dumps(intent), ex=ttl_seconds)
+
+    async def pop_intent(self, upload_id: str) -> Optional[dict]:
+        """Consume a pending upload intent (a completion can only be reported once)."""
+        data = await self.redis.getdel(self._make_intent_key(upload_id))
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
@@ -0,0 +1,87 @@
+"""Import-time profiler for application startup.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter and
+reports the slowest modules, so regressions in cold-start time (autoscaling,
+rolling deploys) are visible before they ship.
+
+Usage:
+    python -m app.common.startup_profiler [--module app.main] [--top 25] [--budget-ms 2000]
+
+Exits with status 1 when the total import time exceeds ``--budget-ms``.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile_imports(module: str) -> List[ImportTiming]:
+    """Import ``module`` in a subprocess and parse ``-X importtime`` output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        # import time:       self [us] |  cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return timings
+
+
+def top_level_packages(timings: List[ImportTiming]) -> dict:
+    """Self time aggregated by top-level package (e.g. openai, boto3, app)."""
+    totals: dict = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        totals[package] = totals.get(package, 0) + timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to show")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    timings = profile_imports(args.module)
+    root = next((t for t in timings if t.module == args.module), None)
+    total_ms = (root.cumulative_us if root else sum(t.self_us for t in timings)) / 1000
+
+    print(f"Total import time of {args.module}: {total_ms:.1f} ms ({len(timings)} modules)\n")
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[: args.top]:
+        print(f"{timing.cumulative_us / 1000:>14.1f} {timing.self_us / 1000:>9.1f}  {timing.module}")
+
+    print(f"\n{'self ms':>14}  top-level package")
+    for package, self_us in list(top_level_packages(timings).items())[: args.top]:
+        print(f"{self_us / 1000:>14.1f}  {package}")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,40 +1,97 @@
 """OpenAI GPT API 호출 모듈."""
 
+import asyncio
 import os
-from typing import Optional, AsyncIterator, List, Any
+from typing import TYPE_CHECKING, Optional, AsyncIterator, List, Any
 
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+
+from app.common.infrastructure.llm_telemetry import LLMCallTracker
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 load_dotenv()
 
-# 환경 변수 검증
-MAX_TOKENS_ENV = os.getenv("MAX_TOKENS")
-if not MAX_TOKENS_ENV:
-    raise ValueError("MAX_TOKENS environment variable is required")
+# OpenAI 클라이언트 / 환경 변수는 첫 호출 시 초기화 (import 시점에는 openai를 로드하지 않음)
+_async_client: Optional["AsyncOpenAI"] = None
+_admission: Optional[asyncio.Semaphore] = None
+_max_tokens: Optional[int] = None
+
+DEFAULT_MODEL = "gpt-4.1"
 
-try:
-    MAX_TOKENS = int(MAX_TOKENS_ENV)
-except ValueError as e:
-    raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
 
-# OpenAI 클라이언트 초기화
-_async_client: Optional[AsyncOpenAI] = None
+def get_max_tokens() -> int:
+    """MAX_TOKENS 환경 변수 (첫 사용 시 검증)"""
+    global _max_tokens
+    if _max_tokens is None:
+        max_tokens_env = os.getenv("MAX_TOKENS")
+        if not max_tokens_env:
+            raise ValueError("MAX_TOKENS environment variable is required")
+        try:
+            _max_tokens = int(max_tokens_env)
+        except ValueError as e:
+            raise ValueError(f"MAX_TOKENS must be a valid integer: {e}") from e
+    return _max_tokens
 
 
-def get_async_client() -> AsyncOpenAI:
+def get_async_client() -> "AsyncOpenAI":
     """비동기 클라이언트 싱글톤 인스턴스 반환"""
     global _async_client
     if _async_client is None:
+        from openai import AsyncOpenAI
+
         _async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     return _async_client
 
 
-async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
+def get_admission_semaphore() -> asyncio.Semaphore:
+    """비스트리밍 LLM 호출(요약 map/reduce 등) 동시 실행 제한 세마포어 (이벤트 루프 안에서 지연 생성)
+
+    요약 fan-out이 OpenAI rate limit을 소진하지 않도록 묶는 용도이며, 사용자 대화 스트림에는 적용하지 않는다.
+    """
+    global _admission
+    if _admission is None:
+        # 프로세스당 동시 비스트리밍 LLM 호출 수 제한 (admission limit)
+        _admission = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "16")))
+    return _admission
+
+
+def _build_user_content(prompt: str, file_urls: list[str], image_detail: Optional[str]) -> Any:
+    """텍스트 + 이미지 메시지 구성
+
+    image_detail: "low" / "high" / "auto" (None이면 모델 기본값).
+    "low"는 이미지를 타일링하지 않고 고정 토큰으로 처리한다.
+    """
+    if not file_urls:
+        return prompt
+    content: List[Any] = [{"type": "text", "text": prompt}]
+    for url in file_urls:
+        image_url = {"url": url}
+        if image_detail:
+            image_url["detail"] = image_detail
+        content.append({
+            "type": "image_url",
+            "image_url": image_url
+        })
+    return content
+
+
+async def _create_chat_completion_stream(
+    prompt: str,
+    file_urls: list[str] = None,
+    image_detail: Optional[str] = None,
+    use_case: str = "chat",
+    account_id: Optional[int] = None,
+) -> AsyncIterator[str]:
     """비동기 방식으로 GPT API를 호출합니다 (스트리밍).
+
+    TTFT, 청크 간격, 토큰 사용량(include_usage 프레임)은 LLM 텔레메트리로 기록된다.
     
     Args:
         prompt: 사용자 프롬프트
+        use_case: 텔레메트리 집계 단위 (chat / summary / simulation)
+        account_id: 호출한 계정 (선택)
         
     Returns:
         GPT 응답 텍스트
@@ -55,43 +112,61 @@ async def _create_chat_completion_stream(prompt: str, file_urls: list[str] = Non
     file_urls = file_urls or []
 
     # 1. 텍스트와 이미지를 포함한 메시지 구성
-    if not file_urls:
-        content = actual_prompt
-    else:
-        content = [{"type": "text", "text": actual_prompt}]
-        for url in file_urls:
-            content.append({
-                "type": "image_url",
-                "image_url": {"url": url}
-            })
+    content = _build_user_content(actual_prompt, file_urls, image_detail)
     
     # 타입 안전성을 위해 딕셔너리를 명시적으로 구성
     messages: List[Any] = [
         {"role": "user", "content": content}
     ]
+    tracker = None
+    status = "ok"
     try:
+        # 사용자 대화 스트림은 admission limit을 적용하지 않는다 (대기열에서 조용히 밀리지 않도록)
+        tracker = LLMCallTracker(use_case, DEFAULT_MODEL, account_id=account_id)
         response = await client.chat.completions.create(
-            model="gpt-4.1",
+            model=DEFAULT_MODEL,
             messages=messages,
-            max_tokens=MAX_TOKENS,
+            max_tokens=get_max_tokens(),
             temperature=0,
-            stream=True
+            stream=True,
+            # 마지막에 choices가 빈 usage 프레임이 온다 (출력/캐시 토큰 수)
+            stream_options={"include_usage": True},
         )
 
         async for chunk in response:
+            if chunk.usage is not None:
+                tracker.on_usage(chunk.usage, chunk.model)
             if chunk.choices and chunk.choices[0].delta.content:
+                tracker.on_chunk()
                 yield chunk.choices[0].delta.content
 
+    except (asyncio.CancelledError, GeneratorExit):
+        # 클라이언트 연결 종료 등으로 스트림이 중단됨
+        status = "cancelled"
+        raise
     except Exception as e:
+        status = "error"
         raise Exception(f"Failed to call GPT API: {str(e)}") from e
+    finally:
+        if tracker is not None:
+            tracker.finish(status)
 
 
-async def _create_chat_completion_non_stream(prompt: str, file_urls: list[str] = None) -> str:
+async def _create_chat_completion_non_stream(
+    prompt: str,
+    file_urls: list[str] = None,
+    image_detail: Optional[str] = None,
+    use_case: str = "summary",
+    account_id: Optional[int] = None,
+) -> str:
     """비스트리밍 방식으로 GPT API를 호출합니다.
     
     Args:
         prompt: 사용자 프롬프트
         file_urls: 이미지 URL 목록 (선택)
+        image_detail: 이미지 해상도 힌트 ("low" / "high" / "auto", 선택)
+        use_case: 텔레메트리 집계 단위 (chat / summary / simulation)
+        account_id: 호출한 계정 (선택)
         
     Returns:
         완성된 응답 텍스트
@@ -107,45 +182,55 @@ async def _create_chat_completion_non_stream(prompt: str, file_urls: list[str] =
     file_urls = file_urls or []
     
     # 메시지 구성 (스트리밍과 동일)
-    if not file_urls:
-        content = prompt
-    else:
-        content = [{"type": "text", "text": prompt}]
-        for url in file_urls:
-            content.append({
-                "type": "image_url",
-                "image_url": {"url": url}
-            })
+    content = _build_user_content(prompt, file_urls, image_detail)
     
     messages: List[Any] = [
         {"role": "user", "content": content}
     ]
     
+    tracker = None
+    status = "ok"
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4.1",
-            messages=messages,
-            max_tokens=MAX_TOKENS,
-            temperature=0,
-            stream=False  # 비스트리밍
-        )
+        async with get_admission_semaphore():
+            tracker = LLMCallTracker(use_case, DEFAULT_MODEL, account_id=account_id, streamed=False)
+            response = await client.chat.completions.create(
+                model=DEFAULT_MODEL,
+                messages=messages,
+                max_tokens=get_max_tokens(),
+                temperature=0,
+                stream=False  # 비스트리밍
+            )
+        tracker.on_usage(response.usage, response.model)
         
         return response.choices[0].message.content or ""
         
     except Exception as e:
+        status = "error"
         raise Exception(f"Failed to call GPT API: {str(e)}") from e
+    finally:
+        if tracker is not None:
+            tracker.finish(status)
 
 
 class CallGPT:
     """OpenAI GPT API를 비동기로 호출하는 클래스."""
 
     @staticmethod
-    async def call_gpt(prompt: str, file_urls: list[str] = None) -> AsyncIterator[str]:
+    async def call_gpt(
+        prompt: str,
+        file_urls: list[str] = None,
+        image_detail: Optional[str] = None,
+        use_case: str = "chat",
+        account_id: Optional[int] = None,
+    ) -> AsyncIterator[str]:
         """비동기 방식으로 GPT API를 호출합니다 (스트리밍).
         
         Args:
             prompt: 사용자 프롬프트
             file_urls: 이미지 URL 목록 (선택)
+            image_detail: 이미지 해상도 힌트 ("low" / "high" / "auto", 선택)
+            use_case: 텔레메트리 집계 단위 (chat / summary / simulation)
+            account_id: 호출한 계정 (선택)
             
         Returns:
             GPT 응답 텍스트 (스트리밍)
@@ -155,18 +240,29 @@ class CallGPT:
             Exception: OpenAI API 호출 실패 시
         """
         try:
-            async for chunk in _create_chat_completion_stream(prompt, file_urls):
+            async for chunk in _create_chat_completion_stream(
+                prompt, file_urls, image_detail, use_case=use_case, account_id=account_id
+            ):
                 yield chunk
         except Exception as e:
             raise Exception(f"CallGPT 중계 에러: {str(e)}")
 
     @staticmethod
-    async def call_gpt_non_stream(prompt: str, file_urls: list[str] = None) -> str:
+    async def call_gpt_non_stream(
+        prompt: str,
+        file_urls: list[str] = None,
+        image_detail: Optional[str] = None,
+        use_case: str = "summary",
+        account_id: Optional[int] = None,
+    ) -> str:
         """비스트리밍 방식으로 GPT API를 호출합니다.
         
         Args:
             prompt: 사용자 프롬프트
             file_urls: 이미지 URL 목록 (선택)
+            image_detail: 이미지 해상도 힌트 ("low" / "high" / "auto", 선택)
+            use_case: 텔레메트리 집계 단위 (chat / summary / simulation)
+            account_id: 호출한 계정 (선택)
             
         Returns:
             완성된 GPT 응답 텍스트
@@ -176,6 +272,8 @@ class CallGPT:
             Exception: OpenAI API 호출 실패 시
         """
         try:
-            return await _create_chat_completion_non_stream(prompt, file_urls)
+            return await _create_chat_completion_non_stream(
+                prompt, file_urls, image_detail, use_case=use_case, account_id=account_id
+            )
         except Exception as e:
             raise Exception(f"CallGPT 중계 에러: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Dependency container.
+
+Process scope: stateless services that are expensive to build (env/key
+parsing, boto3 client, private key loading, font registration). They are
+created once per worker process, on first use or in ``init()`` from the app
+lifespan, and shared by every request. Only the web/worker adapters (routers)
+read the container; they pass the services into use cases and repositories,
+so the application layer never imports it.
+
+Request scope: DB sessions and repositories stay per request. They come from
+``get_db_session`` / ``get_read_db_session`` and are built in the routers,
+so FastAPI closes them when the request ends.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    from app.config.call_gpt import CallGPT
+    from app.config.prompt_loader import PromptLoader
+    from app.config.s3_service import S3Service
+    from app.config.security.message_crypto import AESEncryption
+    from app.conversation.infrastructure.pdf.pdf_renderer import PDFRenderer
+
+
+class Container:
+    """Registry of process-wide singletons (created lazily, thread-safe)."""
+
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _singleton(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    def crypto(self) -> "AESEncryption":
+        from app.config.security.message_crypto import AESEncryption
+
+        return self._singleton("crypto", AESEncryption)
+
+    def s3(self) -> "S3Service":
+        """S3 client + CloudFront signer (private key loaded once)."""
+        from app.config.s3_service import S3Service
+
+        return self._singleton("s3", S3Service)
+
+    def llm(self) -> "CallGPT":
+        from app.config.call_gpt import CallGPT
+
+        return self._singleton("llm", CallGPT)
+
+    def pdf_renderer(self) -> "PDFRenderer":
+        from app.conversation.infrastructure.pdf.pdf_renderer import pdf_renderer
+
+        return pdf_renderer
+
+    def prompt_loader(self) -> "PromptLoader":
+        from app.config.prompt_loader import prompt_loader
+
+        return prompt_loader
+
+    def init(self) -> None:
+        """Build the cheap singletons up front so misconfiguration fails at startup.
+
+        The S3 client (boto3 import) is left to first use to keep boot fast.
+        """
+        self.crypto()
+        self.llm()
+
+    def reset(self, close: bool = True) -> None:
+        """Drop all instances (after fork, or on shutdown).
+
+        Args:
+            close: Shut down the instances' thread pools. Pass False right after
+                fork, where the parent's pools must be left alone.
+        """
+        with self._lock:
+            if close:
+                for instance in self._instances.values():
+                    shutdown = getattr(instance, "shutdown", None)
+                    if callable(shutdown):
+                        shutdown()
+            self._instances.clear()
+
+
+# Process-wide instance
+container = Container()
+
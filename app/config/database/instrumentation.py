@@ -0,0 +1,137 @@
+"""Per-request SQL instrumentation.
+
+SQLAlchemy cursor events record every statement into the QueryStats of the
+current request (a contextvar set by SQLInstrumentationMiddleware):
+- statement count and total DB time;
+- the slowest statements;
+- statements repeated many times within one request (likely N+1 patterns).
+
+Statements slower than SQL_SLOW_QUERY_MS are logged whether or not a
+request is active. Outside production the totals are returned as
+``X-DB-*`` response headers.
+"""
+
+import heapq
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import settings
+
+
+@dataclass
+class QueryStats:
+    """SQL statistics of one request."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: List[Tuple[float, str]] = field(default_factory=list)  # min-heap of (ms, statement)
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+        entry = (elapsed_ms, statement)
+        if len(self.slowest) < settings.SQL_STATS_TOP_N:
+            heapq.heappush(self.slowest, entry)
+        elif elapsed_ms > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def top_statements(self) -> List[Tuple[float, str]]:
+        """Slowest statements, slowest first."""
+        return sorted(self.slowest, reverse=True)
+
+    def n_plus_one(self) -> List[Tuple[str, int]]:
+        """Statements executed at least SQL_N_PLUS_ONE_THRESHOLD times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= settings.SQL_N_PLUS_ONE_THRESHOLD
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """QueryStats of the current request (None outside a request)."""
+    return _current_stats.get()
+
+
+def _shorten(statement: str, limit: int = 300) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+
+    if elapsed_ms >= settings.SQL_SLOW_QUERY_MS:
+        print(f"[SQL] slow query ({elapsed_ms:.1f} ms): {_shorten(statement)}")
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the cursor event listeners to an engine (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLInstrumentationMiddleware:
+    """Pure ASGI middleware collecting QueryStats per request.
+
+    The stats are available as ``request.state.query_stats``. Outside
+    production the response carries X-DB-Query-Count, X-DB-Time-Ms and
+    X-DB-N-Plus-One headers (counted up to the moment headers are sent,
+    so streaming responses only include the queries made before streaming).
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: Optional[bool] = None):
+        self.app = app
+        self.expose_headers = (
+            not settings.is_production if expose_headers is None else expose_headers
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        scope.setdefault("state", {})["query_stats"] = stats
+        token = _current_stats.set(stats)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.total_ms:.1f}"
+                headers["X-DB-N-Plus-One"] = str(len(stats.n_plus_one()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            for statement, count in stats.n_plus_one():
+                print(
+                    f"[SQL] possible N+1 on {scope.get('method')} {scope.get('path')}: "
+                    f"{count}x {_shorten(statement)}"
+                )
@@ -0,0 +1,25 @@
+"""Registry of every ORM model.
+
+Routers import only the models they use; Alembic autogenerate and the optional
+``create_all`` on startup need the complete ``Base.metadata``.
+"""
+
+
+def import_all_models() -> None:
+    """Import every ORM module so its tables are registered on Base.metadata."""
+    from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
+    from app.common.infrastructure.orm.llm_telemetry_orm import LLMTelemetryOrm  # noqa: F401
+    from app.conversation.infrastructure.orm.chat_room_orm import ChatRoomOrm  # noqa: F401
+    from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm  # noqa: F401
+    from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm  # noqa: F401
+    from app.conversation.infrastructure.orm.chat_summary_orm import ChatSummaryOrm  # noqa: F401
+    from app.conversation.infrastructure.orm.chat_summary_chunk_orm import ChatSummaryChunkOrm  # noqa: F401
+    from app.inquiry.infrastructure.orm.inquiry_model import InquiryModel  # noqa: F401
+    from app.inquiry.infrastructure.orm.inquiry_reply_model import InquiryReplyModel  # noqa: F401
+    from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: F401
+    from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM  # noqa: F401
+    from app.survey.infrastructure.orm.survey_model import SurveyTemplateModel  # noqa: F401
+    from app.survey.infrastructure.orm.survey_response_orm import SurveyResponseOrm  # noqa: F401
+    from app.survey.infrastructure.orm.survey_response_item_orm import SurveyResponseItemOrm  # noqa: F401
+    # ChatMessageAnalysisModel (app/ml) is not registered: its foreign keys point
+    # at tables that do not exist (chat_message, chat_room.id) and no table was ever created for it.
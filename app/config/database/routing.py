@@ -0,0 +1,112 @@
+"""Primary / read-replica routing for SQLAlchemy sessions.
+
+A read-only session (see ``get_read_db_session``) sends SELECTs to a replica
+and everything else to the primary. Once it has written (flush, DML or any
+non-SELECT statement) it stays on the primary for the rest of its life, so
+a request reads its own writes. Replicas whose replication lag exceeds the
+threshold (or cannot be measured) are skipped until the next check; with no
+healthy replica, reads go to the primary.
+"""
+
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+class ReplicaSet:
+    """Replica engines with a cached replication-lag check."""
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 5.0,
+    ):
+        """Initialize replica set.
+
+        Args:
+            engines: One engine per replica.
+            max_lag_seconds: Replicas lagging more than this are not used.
+            check_interval_seconds: How long a lag measurement is trusted.
+        """
+        self._engines = engines
+        self._max_lag = max_lag_seconds
+        self._check_interval = check_interval_seconds
+        self._health: Dict[int, Tuple[float, bool]] = {}  # index -> (checked_at, healthy)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    @property
+    def engines(self) -> List[Engine]:
+        return self._engines
+
+    def pick(self) -> Optional[Engine]:
+        """Next healthy replica (round-robin), or None to use the primary."""
+        if not self._engines:
+            return None
+        start = next(self._counter)
+        for offset in range(len(self._engines)):
+            index = (start + offset) % len(self._engines)
+            if self._is_healthy(index):
+                return self._engines[index]
+        return None
+
+    def _is_healthy(self, index: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._health.get(index)
+            if cached is not None and now - cached[0] < self._check_interval:
+                return cached[1]
+            # Mark as checked so concurrent callers don't all measure at once
+            self._health[index] = (now, cached[1] if cached else False)
+
+        lag = self._measure_lag(self._engines[index])
+        healthy = lag is not None and lag <= self._max_lag
+        with self._lock:
+            self._health[index] = (time.monotonic(), healthy)
+        return healthy
+
+    @staticmethod
+    def _measure_lag(engine: Engine) -> Optional[float]:
+        try:
+            with engine.connect() as conn:
+                try:
+                    row = conn.execute(text("SHOW REPLICA STATUS")).mappings().first()
+                except Exception:
+                    # MySQL < 8.0.22
+                    row = conn.execute(text("SHOW SLAVE STATUS")).mappings().first()
+        except Exception as e:
+            print(f"[ReplicaSet] lag check failed for {engine.url.host}: {e}")
+            return None
+
+        if row is None:
+            # Not configured as a replica
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+
+class RoutingSession(Session):
+    """Session routing SELECTs of read-only sessions to replicas."""
+
+    def __init__(self, *args, replicas: Optional[ReplicaSet] = None, read_only: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._read_only = read_only
+        self._sticky_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._read_only and self._replicas is not None and not self._sticky_primary:
+            if not self._flushing and isinstance(clause, Select) and clause._for_update_arg is None:
+                replica = self._replicas.pick()
+                if replica is not None:
+                    return replica
+            else:
+                # Writes (or statements we can't classify) pin the session to the primary
+                self._sticky_primary = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
@@ -5,27 +5,64 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+from app.config.database.instrumentation import instrument_engine
+from app.config.database.routing import ReplicaSet, RoutingSession
+from app.config.settings import settings
+
 load_dotenv()
 
 password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
 
-DATABASE_URL = (
-    f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
-    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
-    f"?charset=utf8mb4"
-)
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True,
-    pool_size = 10,
-    max_overflow = 20,
-    pool_timeout = 30,
-    pool_recycle = 1800,
+def _database_url(host: str, port: str) -> str:
+    return (
+        f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
+        f"@{host}:{port}/{os.getenv('MYSQL_DATABASE')}"
+        f"?charset=utf8mb4"
+    )
+
+
+def _create_engine(url: str):
+    created = create_engine(
+        url,
+        echo=settings.SQL_ECHO,
+        pool_pre_ping=True,
+        pool_size = 10,
+        max_overflow = 20,
+        pool_timeout = 30,
+        pool_recycle = 1800,
+    )
+    instrument_engine(created)
+    return created
+
+
+DATABASE_URL = _database_url(os.getenv("MYSQL_HOST"), os.getenv("MYSQL_PORT"))
+
+engine = _create_engine(DATABASE_URL)
+
+# Read replicas: MYSQL_REPLICA_HOSTS="replica1,replica2:3307" (same user/database as the primary)
+replica_engines = []
+for _replica in filter(None, (h.strip() for h in os.getenv("MYSQL_REPLICA_HOSTS", "").split(","))):
+    _host, _, _port = _replica.partition(":")
+    replica_engines.append(_create_engine(_database_url(_host, _port or os.getenv("MYSQL_PORT"))))
+
+replica_set = ReplicaSet(
+    replica_engines,
+    max_lag_seconds=float(os.getenv("MYSQL_REPLICA_MAX_LAG_SECONDS", "5")),
+    check_interval_seconds=float(os.getenv("MYSQL_REPLICA_LAG_CHECK_SECONDS", "5")),
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+# Read-only intent: SELECTs go to a replica until the session writes
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=replica_set,
+    read_only=True,
+)
 
 Base = declarative_base()
 
@@ -36,3 +73,12 @@ def get_db_session():
         yield db
     finally:
         db.close()
+
+
+def get_read_db_session():
+    """Session for read-mostly endpoints (replica reads, primary after a write)."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
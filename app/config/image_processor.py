@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Optional
+
+from app.config.settings import settings
+
+COMPRESSIBLE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+def compress_image(image_bytes: bytes, max_size: int = 2048, quality: int = 95) -> bytes:
+    """이미지 용량을 줄여서 S3 비용 및 GPT 토큰 사용량을 아낍니다.
+
+    프로세스 풀 워커에서 실행되므로 모듈 최상위 함수로 둔다 (pickle 가능해야 함).
+    """
+    from PIL import Image
+
+    try:
+        img = Image.open(BytesIO(image_bytes))
+
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+
+        # GPT Vision 모델 권장 해상도에 맞춰 리사이징
+        try:
+            # 최신 버전 (Pillow 10+)
+            resampling_method = Image.Resampling.LANCZOS
+        except AttributeError:
+            # 이전 버전
+            resampling_method = Image.LANCZOS
+
+        img.thumbnail((max_size, max_size), resampling_method)
+
+        buffer = BytesIO()
+        img.save(buffer, format="JPEG", quality=quality, optimize=True)
+        return buffer.getvalue()
+    except Exception:
+        # 압축 실패 시 원본 반환 (이미지가 아닌 파일 대비)
+        return image_bytes
+
+
+class ImageProcessor:
+    """
+    프로세스 단위 이미지 처리기 (싱글톤)
+    - Pillow 디코딩/리사이즈/JPEG 인코딩은 CPU 작업이므로 이벤트 루프 밖에서 실행
+    - 프로세스 풀(설정이 0이면 스레드)에서 처리해 GIL 경합으로 스트림이 멈추지 않게 한다
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = settings.IMAGE_PROCESS_MAX_WORKERS if max_workers is None else max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        """처리 풀을 띄운다 (앱 시작 시 호출)"""
+        if self._max_workers > 0 and self._process_pool is None:
+            # spawn: 이벤트 루프/DB 커넥션을 가진 부모 프로세스를 fork하지 않음
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-process")
+        return self._thread_pool
+
+    async def compress(self, image_bytes: bytes, max_size: int = 2048, quality: int = 95) -> bytes:
+        """이미지 압축 (실패 시 원본 반환)"""
+        loop = asyncio.get_running_loop()
+        if self._process_pool is not None:
+            try:
+                return await loop.run_in_executor(
+                    self._process_pool, compress_image, image_bytes, max_size, quality
+                )
+            except BrokenProcessPool:
+                # 워커가 죽으면 이후 요청은 스레드에서 처리
+                self._process_pool = None
+        return await loop.run_in_executor(
+            self._get_thread_pool(), compress_image, image_bytes, max_size, quality
+        )
+
+
+# 싱글톤 인스턴스
+image_processor = ImageProcessor()
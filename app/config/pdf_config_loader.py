@@ -1,4 +1,3 @@
-import yaml
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -14,98 +13,103 @@ class PDFConfigLoader:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._config is None:
+    def _load(self) -> dict:
+        """yaml 파일은 첫 조회 시 한 번만 로드 (import/부팅 시점에는 읽지 않음)"""
+        cls = type(self)
+        if cls._config is None:
+            import yaml
+
             # 프로젝트 루트에서 pdf_config.yaml 찾기
             project_root = Path(__file__).parent.parent.parent
             config_path = project_root / "pdf_config.yaml"
 
             with open(config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                cls._config = yaml.safe_load(f)
+        return cls._config
 
     # 브랜딩 정보
     def get_service_name(self) -> str:
-        return self._config['branding']['service_name']
+        return self._load()['branding']['service_name']
     
     def get_service_name_en(self) -> str:
-        return self._config['branding']['service_name_en']
+        return self._load()['branding']['service_name_en']
     
     def get_tagline(self) -> str:
-        return self._config['branding']['tagline']
+        return self._load()['branding']['tagline']
     
     def get_footer_text(self) -> str:
-        return self._config['branding']['footer_text']
+        return self._load()['branding']['footer_text']
 
     # 색상 정보
     def get_color(self, color_name: str) -> str:
         """색상 가져오기"""
-        return self._config['colors'].get(color_name, '#000000')
+        return self._load()['colors'].get(color_name, '#000000')
     
     def get_colors(self) -> Dict[str, str]:
         """모든 색상 가져오기"""
-        return self._config['colors']
+        return self._load()['colors']
 
     # 폰트 정보
     def get_font_paths(self) -> List[str]:
         """폰트 경로 목록 가져오기"""
-        return self._config['fonts']['paths']
+        return self._load()['fonts']['paths']
     
     def get_default_font(self) -> str:
         """기본 폰트 가져오기"""
-        return self._config['fonts']['default']
+        return self._load()['fonts']['default']
 
     # 페이지 설정
     def get_page_config(self) -> Dict[str, Any]:
         """페이지 설정 가져오기"""
-        return self._config['page']
+        return self._load()['page']
 
     # 스타일 설정 (구버전 호환)
     def get_style(self, style_name: str) -> Dict[str, Any]:
         """특정 스타일 설정 가져오기 (구버전 호환)"""
-        return self._config.get('styles', {}).get(style_name, {})
+        return self._load().get('styles', {}).get(style_name, {})
 
     def get_all_styles(self) -> Dict[str, Any]:
         """모든 스타일 가져오기 (구버전 호환)"""
-        return self._config.get('styles', {})
+        return self._load().get('styles', {})
 
     # Paragraph 스타일 설정
     def get_paragraph_style(self, style_name: str) -> Dict[str, Any]:
         """특정 Paragraph 스타일 설정 가져오기"""
-        return self._config['paragraph_styles'].get(style_name, {})
+        return self._load()['paragraph_styles'].get(style_name, {})
 
     def get_all_paragraph_styles(self) -> Dict[str, Any]:
         """모든 Paragraph 스타일 가져오기"""
-        return self._config['paragraph_styles']
+        return self._load()['paragraph_styles']
 
     # 로고 설정
     def get_logo_config(self) -> Dict[str, Any]:
         """로고 설정 가져오기"""
-        return self._config.get('logo', {})
+        return self._load().get('logo', {})
 
     # 워터마크 설정
     def get_watermark_config(self) -> Dict[str, Any]:
         """워터마크 설정 가져오기"""
-        return self._config['watermark']
+        return self._load()['watermark']
 
     # 헤더 설정
     def get_header_config(self) -> Dict[str, Any]:
         """헤더 설정 가져오기"""
-        return self._config['header']
+        return self._load()['header']
 
     # 푸터 설정
     def get_footer_config(self) -> Dict[str, Any]:
         """푸터 설정 가져오기"""
-        return self._config['footer']
+        return self._load()['footer']
 
     # 구분선 설정
     def get_divider_config(self) -> Dict[str, Any]:
         """구분선 설정 가져오기"""
-        return self._config['divider']
+        return self._load()['divider']
 
     # 테이블 설정
     def get_table_style_config(self) -> Dict[str, Any]:
         """테이블 스타일 설정 가져오기"""
-        return self._config['table_style']
+        return self._load()['table_style']
 
 
 # 싱글톤 인스턴스
@@ -1,6 +1,5 @@
 # app/config/prompt_loader.py
 
-import yaml
 from pathlib import Path
 
 
@@ -13,29 +12,44 @@ class PromptLoader:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._prompts is None:
+    def _load(self) -> dict:
+        """yaml 파일은 첫 조회 시 한 번만 로드 (import/부팅 시점에는 읽지 않음)"""
+        cls = type(self)
+        if cls._prompts is None:
+            import yaml
+
             # 프로젝트 루트에서 찾기
-            project_root = Path(__file__).parent.parent.parent  # app/config에서 3단계 위로
+            project_root = Path(__file__).parent.parent.parent
             config_path = project_root / "prompts.yaml"
 
             with open(config_path, 'r', encoding='utf-8') as f:
-                self._prompts = yaml.safe_load(f)
+                cls._prompts = yaml.safe_load(f)
+        return cls._prompts
 
     def get_base_prompt(self) -> str:
-        return self._prompts['system_prompt']['base']
+        return self._load()['system_prompt']['base']
 
     def get_mbti_guide(self, mbti: str) -> str:
-        return self._prompts['mbti_guides'].get(
+        return self._load()['mbti_guides'].get(
             mbti,
-            self._prompts['default_guide']
+            self._load()['default_guide']
         )
 
     def get_summary_prompt(self, conversation_text: str) -> str:
         """채팅 요약 프롬프트 가져오기"""
-        template = self._prompts['summary_prompt']['template']
+        template = self._load()['summary_prompt']['template']
+        return template.format(conversation_text=conversation_text)
+
+    def get_chunk_summary_prompt(self, conversation_text: str) -> str:
+        """긴 대화의 구간(청크) 요약 프롬프트 가져오기"""
+        template = self._load()['chunk_summary_prompt']['template']
         return template.format(conversation_text=conversation_text)
 
+    def get_reduce_summary_prompt(self, partial_summaries: str) -> str:
+        """구간 요약들을 하나로 합치는 프롬프트 가져오기"""
+        template = self._load()['reduce_summary_prompt']['template']
+        return template.format(partial_summaries=partial_summaries)
+
 
 # 싱글톤 인스턴스
 prompt_loader = PromptLoader()
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
+from typing import Optional
 
 import redis
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,10 +11,18 @@ REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+# 비동기 풀은 워커 프로세스마다 하나: 전체 커넥션 수 = 워커 수 x REDIS_MAX_CONNECTIONS
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+# 풀이 가득 찼을 때 빈 커넥션을 기다리는 최대 시간 (초과하면 redis ConnectionError)
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "5"))
 
 # Redis 인스턴스 생성 (Singleton)
 _redis_instance = None
 
+# 비동기 Redis (이벤트 루프를 막지 않음, 프로세스 공용 커넥션 풀)
+_async_pool: Optional[aioredis.ConnectionPool] = None
+_async_redis_instance: Optional[aioredis.Redis] = None
+
 def get_redis() -> redis.Redis:
     global _redis_instance
     if _redis_instance is None:
@@ -24,3 +34,69 @@ def get_redis() -> redis.Redis:
             decode_responses=True
         )
     return _redis_instance
+
+
+def create_redis(socket_timeout: Optional[float] = None) -> redis.Redis:
+    """별도 커넥션 풀을 쓰는 동기 Redis 클라이언트 (이벤트 루프에서 호출되어 타임아웃을 짧게 둬야 하는 경우)"""
+    return redis.Redis(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=socket_timeout,
+    )
+
+
+def get_async_redis() -> aioredis.Redis:
+    """비동기 Redis 클라이언트 싱글톤 (공유 커넥션 풀 사용)
+
+    순간적으로 요청이 몰려 풀이 가득 차면 "Too many connections"로 바로 실패하지 않고
+    REDIS_POOL_TIMEOUT_SECONDS까지 반환되는 커넥션을 기다린다 (BlockingConnectionPool).
+    """
+    global _async_pool, _async_redis_instance
+    if _async_redis_instance is None:
+        _async_pool = aioredis.BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT_SECONDS,
+            health_check_interval=30,
+        )
+        _async_redis_instance = aioredis.Redis(connection_pool=_async_pool)
+    return _async_redis_instance
+
+
+def get_async_pool_stats() -> dict:
+    """비동기 커넥션 풀 상태 (헬스체크/모니터링용)"""
+    if _async_pool is None:
+        return {"max_connections": REDIS_MAX_CONNECTIONS, "created": 0, "in_use": 0, "available": 0}
+    return {
+        "max_connections": _async_pool.max_connections,
+        "created": getattr(_async_pool, "_created_connections", 0),
+        "in_use": len(getattr(_async_pool, "_in_use_connections", ())),
+        "available": len(getattr(_async_pool, "_available_connections", ())),
+    }
+
+
+async def close_async_redis() -> None:
+    """앱 종료 시 비동기 커넥션 풀 정리"""
+    global _async_pool, _async_redis_instance
+    if _async_redis_instance is not None:
+        await _async_redis_instance.aclose()
+        _async_redis_instance = None
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+        _async_pool = None
+
+
+def reset_redis_clients() -> None:
+    """fork 직후(워커 프로세스) 부모에게서 물려받은 클라이언트/풀을 버린다 (다음 사용 시 새로 생성)"""
+    global _redis_instance, _async_pool, _async_redis_instance
+    _redis_instance = None
+    _async_pool = None
+    _async_redis_instance = None
@@ -1,25 +1,87 @@
-import boto3
 import asyncio
+import base64
+import hashlib
+import json
+import time
 import uuid
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from PIL import Image
 from pathlib import Path
+from typing import Optional
 from fastapi import UploadFile
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
-from botocore.signers import CloudFrontSigner
+from app.common.infrastructure.upload_index import UploadIndex, sha256_fileobj
+from app.config.image_processor import COMPRESSIBLE_EXTENSIONS, image_processor
 from app.config.settings import settings
 
+_MB = 1024 * 1024
+VISION_VARIANT_SUFFIX = ".vision.jpg"
+
+
+def vision_variant_key(file_path: str) -> str:
+    """원본 이미지 키 옆에 저장되는 Vision 모델용 축소본 키 (a/b/uuid.png -> a/b/uuid.vision.jpg)"""
+    path = Path(file_path)
+    return str(path.with_name(f"{path.stem}{VISION_VARIANT_SUFFIX}"))
+
+# boto3 / botocore / PIL은 무거우므로 실제로 사용할 때 import 한다
+
 
 class S3Service:
-    def __init__(self):
+    """S3 업로드/조회 + CloudFront 서명 URL.
+
+    boto3 클라이언트 생성과 키 파일 로드가 무거우므로 요청마다 만들지 말고
+    DI 컨테이너(container.s3())의 프로세스 싱글톤을 사용한다.
+
+    - 클라이언트 커넥션 풀(max_pool_connections)은 업로드/조회 스레드 수에 맞춰 설정
+    - boto3 호출은 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않는다
+    - 큰 파일은 메모리에 올리지 않고 멀티파트로 스트리밍 업로드
+    - 같은 계정이 같은 내용을 다시 올리면 sha256 인덱스로 기존 키를 바로 반환
+    """
+
+    def __init__(self, upload_index: Optional[UploadIndex] = None):
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
         self.s3 = boto3.client(
             "s3",
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
+            region_name=settings.AWS_REGION,
+            # 로컬 S3 대체(MinIO, moto server) 사용 시 지정 (서버 -> S3 주소)
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                connect_timeout=settings.S3_CONNECT_TIMEOUT_SECONDS,
+                read_timeout=settings.S3_READ_TIMEOUT_SECONDS,
+                retries={"max_attempts": settings.S3_MAX_ATTEMPTS, "mode": "standard"},
+                tcp_keepalive=True,
+            ),
+        )
+        # 브라우저가 직접 호출하는 presigned URL은 브라우저 기준 주소로 서명 (서명만 하므로 네트워크 호출 없음)
+        public_endpoint = settings.AWS_S3_PUBLIC_ENDPOINT_URL or settings.AWS_S3_ENDPOINT_URL
+        if public_endpoint and public_endpoint != settings.AWS_S3_ENDPOINT_URL:
+            self.presign_s3 = boto3.client(
+                "s3",
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_REGION,
+                endpoint_url=public_endpoint,
+            )
+        else:
+            self.presign_s3 = self.s3
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * _MB,
+            multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE_MB * _MB,
+            max_concurrency=settings.S3_TRANSFER_MAX_CONCURRENCY,
+            use_threads=True,
         )
+        # 동시에 진행하는 업로드 수 제한 (초과분은 대기)
+        self._upload_semaphore = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self.upload_index = upload_index or UploadIndex()
         self.bucket = settings.AWS_S3_BUCKET
 
         self.cf_domain = settings.CLOUDFRONT_DOMAIN
@@ -34,18 +96,100 @@ class S3Service:
             print(f"❌ Key Load Error: {str(e)}")
             self.private_key_content = ""
 
+        self._private_key = None
+        self._cf_signer = None
+
     def _rsa_signer(self, message):
-        """환경 변수로부터 프라이빗 키를 로드하여 메시지에 서명합니다."""
-        private_key = serialization.load_pem_private_key(
-            self.private_key_content.encode('utf-8'),
-            password=None
-        )
-        return private_key.sign(
+        """프라이빗 키로 메시지에 서명합니다 (키는 최초 1회만 파싱)."""
+        if self._private_key is None:
+            self._private_key = serialization.load_pem_private_key(
+                self.private_key_content.encode('utf-8'),
+                password=None
+            )
+        return self._private_key.sign(
             message,
             padding.PKCS1v15(),
             hashes.SHA1()
         )
 
+    @property
+    def cf_signer(self):
+        """CloudFront 서명기 (프로세스당 1개)"""
+        if self._cf_signer is None:
+            from botocore.signers import CloudFrontSigner
+
+            self._cf_signer = CloudFrontSigner(self.cf_key_id, self._rsa_signer)
+        return self._cf_signer
+
+    # --- CloudFront signed cookie 모드 (CLOUDFRONT_MEDIA_AUTH_MODE=cookie) ---
+    # 파일마다 URL에 서명하는 대신, 계정 폴더 전체에 대한 정책을 쿠키로 한 번 발급하고
+    # 응답에는 서명 없는 고정 URL을 넣는다 (브라우저/CDN 캐시 가능).
+
+    COOKIE_POLICY = "CloudFront-Policy"
+    COOKIE_SIGNATURE = "CloudFront-Signature"
+    COOKIE_KEY_PAIR_ID = "CloudFront-Key-Pair-Id"
+
+    @property
+    def uses_signed_cookies(self) -> bool:
+        return settings.CLOUDFRONT_MEDIA_AUTH_MODE == "cookie"
+
+    @staticmethod
+    def _cf_b64encode(data: bytes) -> str:
+        # CloudFront URL-safe base64 (+ -> -, = -> _, / -> ~)
+        return base64.b64encode(data).decode("ascii").replace("+", "-").replace("=", "_").replace("/", "~")
+
+    @staticmethod
+    def _cf_b64decode(value: str) -> bytes:
+        return base64.b64decode(value.replace("-", "+").replace("_", "=").replace("~", "/"))
+
+    def media_resource(self, account_id: int) -> str:
+        """계정이 올린 파일 전체를 가리키는 정책 리소스
+
+        키 구조가 chat/YYYY/MM/DD/{account_id}/파일 이므로 날짜 깊이를 고정한다.
+        (CloudFront의 *는 '/'도 매칭하므로 chat/*/{account_id}/* 로 쓰면
+        계정 10의 정책이 10월에 올라온 다른 계정의 파일까지 허용한다)
+        """
+        return f"https://{self.cf_domain}/chat/*/*/*/{account_id}/*"
+
+    def get_signed_cookies(self, account_id: int) -> dict:
+        """계정 폴더용 CloudFront signed cookie 값 (쿠키 이름 -> 값)"""
+        expires = int(time.time()) + settings.CLOUDFRONT_COOKIE_TTL_SECONDS
+        policy = json.dumps({
+            "Statement": [{
+                "Resource": self.media_resource(account_id),
+                "Condition": {"DateLessThan": {"AWS:EpochTime": expires}},
+            }]
+        }, separators=(",", ":")).encode("utf-8")
+
+        return {
+            self.COOKIE_POLICY: self._cf_b64encode(policy),
+            self.COOKIE_SIGNATURE: self._cf_b64encode(self._rsa_signer(policy)),
+            self.COOKIE_KEY_PAIR_ID: self.cf_key_id,
+        }
+
+    def needs_cookie_refresh(self, policy_cookie: Optional[str], account_id: int) -> bool:
+        """기존 정책 쿠키가 없거나, 다른 계정 것이거나, 곧 만료되면 True"""
+        if not policy_cookie:
+            return True
+        try:
+            statement = json.loads(self._cf_b64decode(policy_cookie))["Statement"][0]
+            expires = statement["Condition"]["DateLessThan"]["AWS:EpochTime"]
+        except Exception:
+            return True
+        if statement.get("Resource") != self.media_resource(account_id):
+            return True
+        return expires - time.time() < settings.CLOUDFRONT_COOKIE_REFRESH_SECONDS
+
+    def get_media_url(self, file_path: str) -> str:
+        """화면에 보여줄 파일 URL (cookie 모드면 서명 없는 고정 URL, 아니면 서명 URL)"""
+        if not self.uses_signed_cookies or not file_path:
+            return self.get_signed_url(file_path)
+        if file_path.startswith("http"):
+            if self.cf_domain not in file_path:
+                return file_path
+            file_path = file_path.split(f"{self.cf_domain}/")[-1].split("?")[0]
+        return f"https://{self.cf_domain}/{file_path.lstrip('/')}"
+
     def get_signed_url(self, file_path: str, expire_minutes: int = 60) -> str:
         if not file_path:
             return ""
@@ -64,9 +208,7 @@ class S3Service:
             url = f"https://{self.cf_domain}/{path}"
 
             expire_date = datetime.datetime.utcnow() + datetime.timedelta(minutes=expire_minutes)
-            signer = CloudFrontSigner(self.cf_key_id, self._rsa_signer)
-
-            signed_url = signer.generate_presigned_url(url, date_less_than=expire_date)
+            signed_url = self.cf_signer.generate_presigned_url(url, date_less_than=expire_date)
 
             print(f"--- Generated Signed URL: {signed_url}")
 
@@ -76,85 +218,341 @@ class S3Service:
             print(f"--- Signed URL Error: {str(e)}")
             return file_path
 
-    async def upload_file(self, file: UploadFile, account_id: int) -> str:
-        file_ext = Path(file.filename).suffix.lower()
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=settings.S3_MAX_POOL_CONNECTIONS,
+                thread_name_prefix="s3-io",
+            )
+        return self._io_pool
+
+    async def _run_io(self, fn, *args):
+        """블로킹 boto3 호출을 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_io_pool(), fn, *args)
+
+    def shutdown(self) -> None:
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
+
+    def _upload_fileobj(self, fileobj, key: str, content_type: str) -> None:
+        fileobj.seek(0)
+        self.s3.upload_fileobj(
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type, "StorageClass": "INTELLIGENT_TIERING"},
+            Config=self.transfer_config,
+        )
+
+    @staticmethod
+    def _file_ext(filename: str) -> str:
         # 확장자가 없는 경우 처리
-        if not file_ext:
-            file_ext = ".jpg"
+        return Path(filename or "").suffix.lower() or ".jpg"
 
+    @staticmethod
+    def _new_upload_key(account_id: int, file_ext: str) -> str:
         from datetime import timezone, timedelta
         kst = timezone(timedelta(hours=9))
         now = datetime.datetime.now(kst)
 
         partition_path = now.strftime("%Y/%m/%d")
         file_name = f"{uuid.uuid4()}{file_ext}"
-        full_path = f"chat/{partition_path}/{account_id}/{file_name}"
+        return f"chat/{partition_path}/{account_id}/{file_name}"
+
+    async def _store_image(self, raw: bytes, full_path: str, content_type: str) -> None:
+        """원본을 압축해 full_path에, Vision용 축소본을 그 옆에 저장"""
+        # 이미지 압축은 프로세스 풀에서 (이벤트 루프 밖)
+        content, vision_content = await asyncio.gather(
+            image_processor.compress(raw),
+            image_processor.compress(
+                raw,
+                max_size=settings.VISION_IMAGE_MAX_SIZE,
+                quality=settings.VISION_IMAGE_QUALITY,
+            ),
+        )
+        variant = None
+        if vision_content != raw:
+            # 상담 중 Vision 모델에는 축소본을 보낸다 (압축 실패 시 원본만 저장)
+            variant = vision_variant_key(full_path)
+            await self._run_io(self._upload_fileobj, BytesIO(vision_content), variant, "image/jpeg")
+        # S3에 Private하게 업로드 (기본값이 Private입니다)
+        await self._run_io(self._upload_fileobj, BytesIO(content), full_path, content_type)
+        # 채팅 턴마다 HEAD로 확인하지 않도록 축소본 유무를 기록
+        await self._remember_vision(full_path, variant)
+
+    async def upload_file(self, file: UploadFile, account_id: int) -> str:
+        file_ext = self._file_ext(file.filename)
+        full_path = self._new_upload_key(account_id, file_ext)
 
-        # 이미지 압축 로직
-        content = await file.read()
-        if file_ext in ['.jpg', '.jpeg', '.png', '.webp']:
-            content = self._compress_image(content)
+        content_type = file.content_type or "image/jpeg"
 
         try:
-            # 1. S3에 Private하게 업로드 (기본값이 Private입니다)
-            self.s3.put_object(
-                Bucket=self.bucket,
-                Key=full_path,
-                Body=content,
-                ContentType=file.content_type or "image/jpeg",
-                StorageClass='INTELLIGENT_TIERING'
-            )
+            async with self._upload_semaphore:
+                # 원본 바이트 기준 해시 -> 같은 계정의 중복 업로드면 압축/업로드 생략
+                digest = await self._run_io(sha256_fileobj, file.file)
+                if settings.UPLOAD_DEDUP_ENABLED:
+                    existing = await self._find_uploaded(account_id, digest)
+                    if existing:
+                        return existing
+
+                if file_ext in COMPRESSIBLE_EXTENSIONS:
+                    await self._store_image(await file.read(), full_path, content_type)
+                else:
+                    # 그 외 파일은 스풀된 임시 파일을 그대로 스트리밍 (임계값 이상은 멀티파트)
+                    await self._run_io(self._upload_fileobj, file.file, full_path, content_type)
 
+            await self._index_upload(account_id, digest, full_path)
             return full_path
 
         except Exception as e:
             print(f"S3 Upload Error Detail: {str(e)}")
             raise Exception(f"S3 업로드 및 서명 생성 실패: {str(e)}")
 
-    def _compress_image(self, image_bytes: bytes) -> bytes:
-        """이미지 용량을 줄여서 S3 비용 및 GPT 토큰 사용량을 아낍니다."""
+    # --- 직접 업로드 (클라이언트 -> S3 presigned POST, API는 메타데이터만 처리) ---
+
+    @staticmethod
+    def _is_allowed_content_type(content_type: str) -> bool:
+        allowed = [t.strip() for t in settings.UPLOAD_ALLOWED_CONTENT_TYPES.split(",") if t.strip()]
+        return any(content_type == t or (t.endswith("/") and content_type.startswith(t)) for t in allowed)
+
+    async def create_upload_intent(
+        self,
+        account_id: int,
+        filename: str,
+        content_type: str,
+        size: int,
+        sha256: Optional[str] = None,
+    ) -> dict:
+        """업로드 의도 등록 + presigned POST 발급
+
+        sha256을 함께 보내면 이미 올린 내용일 때 업로드 없이 기존 키를 돌려준다.
+
+        Raises:
+            ValueError: 허용되지 않는 타입이거나 크기 제한 초과
+        """
+        if not self._is_allowed_content_type(content_type):
+            raise ValueError(f"허용되지 않는 파일 형식입니다: {content_type}")
+        if size <= 0 or size > settings.UPLOAD_DIRECT_MAX_BYTES:
+            raise ValueError(f"파일 크기는 {settings.UPLOAD_DIRECT_MAX_BYTES} 바이트 이하여야 합니다.")
+
+        if sha256 and settings.UPLOAD_DEDUP_ENABLED:
+            existing = await self._find_uploaded(account_id, sha256.lower())
+            if existing:
+                return {
+                    "duplicate": True,
+                    "file_path": existing,
+                    "file_url": self.get_media_url(existing),
+                }
+
+        upload_id = uuid.uuid4().hex
+        full_path = self._new_upload_key(account_id, self._file_ext(filename))
+        expires_in = settings.UPLOAD_INTENT_EXPIRE_SECONDS
+
+        presigned = await self._run_io(lambda: self.presign_s3.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=full_path,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, size],
+            ],
+            ExpiresIn=expires_in,
+        ))
+        await self.upload_index.save_intent(upload_id, {
+            "account_id": account_id,
+            "file_path": full_path,
+            "content_type": content_type,
+            "size": size,
+        }, expires_in)
+
+        return {
+            "duplicate": False,
+            "upload_id": upload_id,
+            "file_path": full_path,
+            "upload_url": presigned["url"],
+            "fields": presigned["fields"],
+            "expires_in": expires_in,
+        }
+
+    async def complete_direct_upload(self, account_id: int, upload_id: str) -> dict:
+        """클라이언트가 S3에 올린 객체를 확인 (크기/타입 검증)
+
+        후처리(압축, Vision 축소본, 해시 인덱스, 텍스트 추출)는 process_direct_upload로
+        응답 이후에 수행한다.
+
+        Raises:
+            ValueError: 의도가 없거나 만료됨, 객체가 없음, 크기/타입 불일치
+        """
+        intent = await self.upload_index.pop_intent(upload_id)
+        if intent is None or intent.get("account_id") != account_id:
+            raise ValueError("업로드 요청을 찾을 수 없거나 만료되었습니다.")
+
+        full_path = intent["file_path"]
+        try:
+            head = await self._run_io(lambda: self.s3.head_object(Bucket=self.bucket, Key=full_path))
+        except Exception:
+            raise ValueError("업로드된 파일을 찾을 수 없습니다.")
+
+        if head.get("ContentLength", 0) > intent["size"] or head.get("ContentType") != intent["content_type"]:
+            # 선언과 다른 객체는 남기지 않는다
+            await self._run_io(lambda: self.s3.delete_object(Bucket=self.bucket, Key=full_path))
+            raise ValueError("업로드된 파일의 크기 또는 형식이 요청과 다릅니다.")
+
+        return {
+            "file_path": full_path,
+            "file_url": self.get_media_url(full_path),
+            "content_type": intent["content_type"],
+        }
+
+    async def process_direct_upload(self, account_id: int, full_path: str, content_type: str) -> None:
+        """직접 업로드된 객체의 후처리 (백그라운드)
+
+        - 이미지: 압축본으로 교체 + Vision 축소본 생성 (끝나기 전에는 원본이 그대로 쓰임)
+        - 그 외: 텍스트 추출 결과를 미리 캐시
+        """
         try:
-            img = Image.open(BytesIO(image_bytes))
+            async with self._upload_semaphore:
+                raw = await self._run_io(
+                    lambda: self.s3.get_object(Bucket=self.bucket, Key=full_path)['Body'].read()
+                )
+                digest = hashlib.sha256(raw).hexdigest()
+                await self._index_upload(account_id, digest, full_path)
+
+                if Path(full_path).suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+                    await self._store_image(raw, full_path, content_type)
+                    return
+
+            await self.read_file_content(full_path)
+        except Exception as e:
+            print(f"--- Direct Upload Post-processing Error: {str(e)}")
+
+    async def _find_uploaded(self, account_id: int, digest: str) -> Optional[str]:
+        try:
+            return await self.upload_index.find(account_id, digest)
+        except Exception as e:
+            # 인덱스 장애 시에는 중복 제거 없이 업로드
+            print(f"--- Upload Index Error: {str(e)}")
+            return None
+
+    async def _index_upload(self, account_id: int, digest: str, full_path: str) -> None:
+        try:
+            await self.upload_index.save(account_id, digest, full_path)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
+
+    async def get_vision_image_url(self, file_path: str) -> str:
+        """Vision 모델에 보낼 이미지의 서명 URL (축소본이 없으면 원본)
+
+        축소본 유무는 업로드 시 인덱스에 기록된다. 기록이 없는 이미지(축소본 도입 이전 업로드,
+        인덱스 만료)만 HEAD로 확인하고 그 결과를 다시 기록한다.
+        """
+        if not file_path:
+            return ""
+        path = file_path
+        if path.startswith("http"):
+            if self.cf_domain not in path:
+                return path
+            path = path.split(f"{self.cf_domain}/")[-1].split("?")[0]
+        path = path.lstrip("/")
 
-            if img.mode in ("RGBA", "P"):
-                img = img.convert("RGB")
+        variant = await self._known_vision(path)
+        if variant is None:
+            from botocore.exceptions import ClientError
 
-            # GPT Vision 모델 권장 해상도에 맞춰 리사이징
+            variant = vision_variant_key(path)
             try:
-                # 최신 버전 (Pillow 10+)
-                resampling_method = Image.Resampling.LANCZOS
-            except AttributeError:
-                # 이전 버전
-                resampling_method = Image.LANCZOS
+                await self._run_io(lambda: self.s3.head_object(Bucket=self.bucket, Key=variant))
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                    await self._remember_vision(path, None)
+                return self.get_signed_url(file_path)
+            except Exception:
+                return self.get_signed_url(file_path)
+            await self._remember_vision(path, variant)
 
-            img.thumbnail((2048, 2048), resampling_method)
+        return self.get_signed_url(variant) if variant else self.get_signed_url(file_path)
 
-            buffer = BytesIO()
-            img.save(buffer, format="JPEG", quality=95, optimize=True)
-            return buffer.getvalue()
-        except Exception:
-            # 압축 실패 시 원본 반환 (이미지가 아닌 파일 대비)
-            return image_bytes
+    async def _known_vision(self, path: str) -> Optional[str]:
+        try:
+            return await self.upload_index.get_vision(path)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
+            return None
+
+    async def _remember_vision(self, path: str, variant: Optional[str]) -> None:
+        try:
+            await self.upload_index.set_vision(path, variant)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
+
+    async def upload_bytes(self, key: str, content: bytes, content_type: str) -> str:
+        """서버에서 생성한 파일(요약 PDF 등)을 지정한 키로 업로드합니다."""
+        async with self._upload_semaphore:
+            await self._run_io(self._upload_fileobj, BytesIO(content), key, content_type)
+        return key
+
+    async def read_bytes(self, key: str) -> bytes | None:
+        """저장된 파일을 바이트로 읽어옵니다. 없거나 실패하면 None"""
+        try:
+            return await self._run_io(
+                lambda: self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+            )
+        except Exception as e:
+            print(f"--- S3 Read Error: {str(e)}")
+            return None
 
     async def read_file_content(self, file_path: str) -> str:
-        """확장자 불문, 텍스트 기반 파일의 내용을 최대한 읽어옵니다."""
+        """확장자 불문, 텍스트 기반 파일의 내용을 최대한 읽어옵니다.
+
+        추출 결과는 내용 해시 기준으로 캐시한다 (같은 파일이 여러 턴/계정에서 쓰여도 한 번만 읽음).
+        """
         if not file_path: return ""
         try:
             path = file_path.split(f"{self.cf_domain}/")[-1] if self.cf_domain in file_path else file_path
             path = path.lstrip("/")
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, lambda: self.s3.get_object(Bucket=self.bucket, Key=path))
-            raw_content = response['Body'].read()
+            digest = await self._cached_digest(path)
+            cached = await self._cached_text(digest) if digest else None
+            if cached is not None:
+                return cached
+
+            raw_content = await self._run_io(
+                lambda: self.s3.get_object(Bucket=self.bucket, Key=path)['Body'].read()
+            )
 
             # 인코딩 자동 감지 시도 (utf-8 -> cp949 -> euc-kr)
             for enc in ['utf-8', 'cp949', 'euc-kr']:
                 try:
-                    return raw_content.decode(enc)
+                    text = raw_content.decode(enc)
                 except UnicodeDecodeError:
                     continue
+                if digest:
+                    await self._cache_text(digest, text)
+                return text
 
             # 텍스트로 읽기 실패 시 (바이너리 등)
             return f"[알림: {file_path} 파일은 텍스트로 읽을 수 없는 형식이거나 손상되었습니다.]"
         except Exception as e:
-            return f"[파일 로드 실패: {str(e)}]"
\ No newline at end of file
+            return f"[파일 로드 실패: {str(e)}]"
+
+    async def _cached_digest(self, path: str) -> Optional[str]:
+        try:
+            return await self.upload_index.digest_of(path)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
+            return None
+
+    async def _cached_text(self, digest: str) -> Optional[str]:
+        try:
+            return await self.upload_index.get_text(digest)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
+            return None
+
+    async def _cache_text(self, digest: str, text: str) -> None:
+        try:
+            await self.upload_index.set_text(digest, text)
+        except Exception as e:
+            print(f"--- Upload Index Error: {str(e)}")
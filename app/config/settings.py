@@ -14,6 +14,11 @@ class Settings(BaseSettings):
     MYSQL_USER: str
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str
+    DB_CREATE_ALL_ON_STARTUP: bool = False  # Schema is managed by Alembic; enable only for throwaway local DBs
+    SQL_ECHO: bool = False  # Log every statement as text (debugging only)
+    SQL_SLOW_QUERY_MS: int = 200  # Statements slower than this are logged
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # Same statement this many times in one request = N+1 warning
+    SQL_STATS_TOP_N: int = 3  # Slowest statements kept per request
 
     # Redis
     REDIS_HOST: str
@@ -44,6 +49,13 @@ class Settings(BaseSettings):
     META_CLIENT_SECRET: str = ""
     META_REDIRECT_URI: str = ""
 
+    # OAuth - shared HTTP client (one pooled keep-alive client per provider)
+    OAUTH_HTTP_TIMEOUT_SECONDS: float = 10.0
+    OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 20
+    OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    OAUTH_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
     # Security
     CSRF_SECRET_KEY: str
     COOKIE_SECURE: bool = False  # Set True in production (HTTPS)
@@ -54,12 +66,56 @@ class Settings(BaseSettings):
     JWT_ENCRYPTION_KEY: str = ""  # Key for AES encryption of user-specific keys
     JWT_EXPIRY_HOURS: int = 12  # Token validity period in hours
     JWT_HTTPONLY: bool = True  # HttpOnly flag for JWT cookie
+    JWT_CACHE_MAX_ENTRIES: int = 10000  # Validated tokens kept in-process (each until its exp)
+
+    # Account cache (L1 in-process TTL LRU + L2 Redis, pub/sub invalidation)
+    ACCOUNT_CACHE_LOCAL_TTL_SECONDS: int = 60  # Upper bound on staleness if an invalidation is missed
+    ACCOUNT_CACHE_LOCAL_MAX_ENTRIES: int = 10000
+    ACCOUNT_CACHE_REDIS_TTL_SECONDS: int = 300  # Bounds staleness after writes that bypass save() (e.g. manual DB edits)
+    ACCOUNT_CACHE_REDIS_TIMEOUT_MS: int = 50  # L2 calls run on the event loop; a slow Redis falls back to MySQL
+
+    # Token blacklist bloom filter
+    BLACKLIST_BLOOM_CAPACITY: int = 100000  # Expected live blacklist entries
+    BLACKLIST_BLOOM_ERROR_RATE: float = 0.001  # False positives fall back to Redis EXISTS
+    BLACKLIST_BLOOM_REBUILD_SECONDS: int = 3600  # Rebuild to drop expired jtis
 
     # Environment
     ENVIRONMENT: str = "local"  # local, staging, production
 
     # Session (legacy - kept for backward compatibility)
     SESSION_TTL_SECONDS: int = 86400  # 24 hours
+    SESSION_TOUCH_INTERVAL_SECONDS: int = 300  # Minimum gap between sliding renewals of one session
+
+    # Idempotency-Key (chat / simulation sends)
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # 재시도 허용 윈도우
+    IDEMPOTENCY_WAIT_TIMEOUT_SECONDS: int = 120  # 진행 중인 생성을 기다리는 최대 무응답 시간
+
+    # Chat summary (map-reduce)
+    SUMMARY_CHUNK_TOKEN_BUDGET: int = 6000  # 청크 하나에 담을 대화 토큰 수 (초과 시 청크 요약 후 reduce)
+    SUMMARY_REDUCE_FAN_IN: int = 8  # reduce 한 번에 합치는 부분 요약 수
+
+    # Tracing / metrics (per-stage latency histograms on /metrics)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""  # 설정 시 /metrics 요청에 Authorization: Bearer <token> 필요 (운영에서는 미설정 시 /metrics 비활성)
+    TRACE_LOG_SLOW_MS: int = 0  # 이 시간 이상 걸린 span은 로그 (0이면 로그 안 함)
+
+    # LLM telemetry (per-call TTFT / tokens / cost, batched into llm_telemetry)
+    LLM_TELEMETRY_ENABLED: bool = True
+    LLM_TELEMETRY_BATCH_SIZE: int = 100  # INSERT 1회당 레코드 수
+    LLM_TELEMETRY_FLUSH_SECONDS: float = 5.0  # 레코드가 메모리에 머무는 최대 시간
+    LLM_TELEMETRY_MAX_QUEUE: int = 10000  # 초과 시 새 레코드는 버림
+
+    # Sampling profiler (admin: /api/v1/admin/profiler, per worker process)
+    PROFILER_ENABLED: bool = True
+    PROFILER_MAX_SECONDS: int = 60  # 한 번에 샘플링할 수 있는 최대 시간
+    PROFILER_DEFAULT_INTERVAL_MS: float = 10.0  # 스택 샘플 간격 (작을수록 정밀, 오버헤드 증가)
+    PROFILER_REQUEST_SAMPLE_EVERY: int = 0  # 라우트별 N개 요청 중 1개를 프로파일링 (0이면 끔)
+    PROFILER_REQUEST_INTERVAL_MS: float = 5.0  # 요청 프로파일링 샘플 간격
+    PROFILER_REQUEST_KEEP: int = 20  # 보관할 가장 느린 요청 프로파일 수
+
+    # PDF rendering
+    PDF_RENDER_MAX_WORKERS: int = 2  # 렌더링 프로세스 수 (0이면 스레드에서 렌더링)
+    PDF_CACHE_MAX_ENTRIES: int = 64  # 렌더링 결과 LRU 캐시 크기
 
     # Frontend URL for redirects after OAuth
     FRONTEND_URL: str
@@ -80,6 +136,39 @@ class Settings(BaseSettings):
     CLOUDFRONT_DOMAIN: str
     CLOUDFRONT_KEY_ID: str
     CLOUDFRONT_PRIVATE_KEY_PATH: str
+    CLOUDFRONT_MEDIA_AUTH_MODE: str = "url"  # url: 파일마다 서명 URL / cookie: 계정 폴더 signed cookie + 고정 URL
+    CLOUDFRONT_COOKIE_DOMAIN: str = ""  # API와 CloudFront 도메인의 공통 상위 도메인 (e.g. .gugudan.net)
+    CLOUDFRONT_COOKIE_TTL_SECONDS: int = 43200  # 정책 유효 시간
+    CLOUDFRONT_COOKIE_REFRESH_SECONDS: int = 3600  # 남은 시간이 이보다 짧으면 재발급
+    AWS_S3_ENDPOINT_URL: str = ""  # 로컬 S3 대체(MinIO 등) 엔드포인트 (서버가 접근하는 주소), 비우면 AWS
+    AWS_S3_PUBLIC_ENDPOINT_URL: str = ""  # presigned 업로드에 쓰는 브라우저 기준 주소, 비우면 AWS_S3_ENDPOINT_URL
+
+    # Direct (presigned) upload
+    UPLOAD_DIRECT_MAX_BYTES: int = 20 * 1024 * 1024  # 직접 업로드 최대 크기
+    UPLOAD_INTENT_EXPIRE_SECONDS: int = 600  # presigned POST / 업로드 의도 유효 시간
+    UPLOAD_ALLOWED_CONTENT_TYPES: str = "image/,text/,application/pdf,application/json"  # '/'로 끝나면 접두어 매칭
+
+    # S3 upload pipeline
+    S3_MAX_POOL_CONNECTIONS: int = 32  # 프로세스당 S3 커넥션 풀 크기 (= boto3 호출 스레드 수)
+    S3_MAX_ATTEMPTS: int = 3  # 재시도 포함 최대 시도 횟수
+    S3_CONNECT_TIMEOUT_SECONDS: int = 5
+    S3_READ_TIMEOUT_SECONDS: int = 60
+    S3_UPLOAD_CONCURRENCY: int = 8  # 워커당 동시 업로드 수 (초과분은 대기)
+    S3_MULTIPART_THRESHOLD_MB: int = 8  # 이 크기 이상은 멀티파트 업로드
+    S3_MULTIPART_CHUNKSIZE_MB: int = 8  # 멀티파트 파트 크기
+    S3_TRANSFER_MAX_CONCURRENCY: int = 4  # 파일 하나당 병렬 파트 업로드 수
+    IMAGE_PROCESS_MAX_WORKERS: int = 2  # 이미지 압축 프로세스 수 (0이면 스레드에서 처리)
+
+    # Upload dedup (sha256 content index in Redis)
+    UPLOAD_DEDUP_ENABLED: bool = True
+    UPLOAD_INDEX_TTL_SECONDS: int = 2592000  # 30일 (버킷 lifecycle 만료보다 짧게)
+    UPLOAD_TEXT_CACHE_TTL_SECONDS: int = 604800  # 추출 텍스트 캐시 7일
+    UPLOAD_TEXT_CACHE_MAX_CHARS: int = 200000  # 이보다 긴 텍스트는 캐시하지 않음
+
+    # Vision image variant (업로드 시 함께 저장, 상담 중 모델에는 이것을 전송)
+    VISION_IMAGE_MAX_SIZE: int = 768  # 긴 변 기준 픽셀
+    VISION_IMAGE_QUALITY: int = 80  # JPEG 품질
+    VISION_IMAGE_DETAIL: str = "low"  # OpenAI image_url detail 힌트 (low / high / auto)
 
     @property
     def is_production(self) -> bool:
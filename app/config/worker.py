@@ -0,0 +1,26 @@
+"""Per-worker initialization for pre-forking servers.
+
+With ``preload_app`` the application is imported once in the gunicorn master
+and workers are forked from it. Anything holding sockets that the master may
+have created must not be shared across processes, so each worker drops the
+inherited database connection pools, Redis clients and container singletons
+right after fork.
+Everything else that owns connections, threads or tasks (OAuth HTTP clients,
+PDF render pool, pub/sub subscribers) is started in the app lifespan, which
+runs inside each worker.
+"""
+
+from app.config.container import container
+from app.config.database.session import engine, replica_engines
+from app.config.redis_config import reset_redis_clients
+
+
+def init_worker_process() -> None:
+    """Reset connection pools inherited from the parent process."""
+    # close=False: leave the parent's sockets alone, just stop using them here
+    engine.dispose(close=False)
+    for replica_engine in replica_engines:
+        replica_engine.dispose(close=False)
+    reset_redis_clients()
+    # Singletons (S3 client etc.) built in the master, if any, are rebuilt per worker
+    container.reset(close=False)
@@ -1,49 +1,78 @@
-from fastapi import APIRouter, Depends, Body, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, Body, Header, HTTPException, Request, Response, UploadFile, File
 from fastapi.responses import StreamingResponse
+from io import BytesIO
 import uuid
 
 from app.account.adapter.input.web.account_router import get_current_account_id
-from app.config.database.session import get_db_session
+from app.config.database.session import SessionLocal, get_db_session, get_read_db_session
 from sqlalchemy.orm import Session
 
-# 전역 객체는 상태가 없는 것들만 유지
-from app.config.call_gpt import CallGPT
-from app.config.s3_service import S3Service
+# 상태가 없는 서비스(암호화, S3, LLM, PDF 렌더러)는 DI 컨테이너의 프로세스 싱글톤 사용
+from app.config.container import container
+from app.config.settings import settings
 from app.conversation.adapter.input.web.request.chat_feedback_request import ChatFeedbackRequest
+from app.conversation.adapter.input.web.request.upload_request import UploadCompleteRequest, UploadIntentRequest
 from app.conversation.application.usecase.end_chat_usecase import EndChatUseCase
+from app.conversation.application.usecase.export_chat_transcript_usecase import ExportChatTranscriptUseCase
 from app.conversation.application.usecase.get_chat_room_status_usecase import GetChatRoomStatusUseCase
 from app.conversation.application.usecase.delete_chat_usecase import DeleteChatUseCase
 from app.conversation.application.usecase.get_chat_message_usecase import GetChatMessagesUseCase
 from app.conversation.application.usecase.get_chat_room_usecase import GetChatRoomsUseCase
+from app.conversation.application.usecase.get_chat_summary_pdf_usecase import GetChatSummaryPdfUseCase
 from app.conversation.application.usecase.insert_chat_feedback_usecase import ChatFeedbackUsecase
 from app.conversation.application.usecase.summarize_chat_usecase import SummarizeChatUseCase
 from app.conversation.infrastructure.repository.chat_feedback_repository_impl import ChatFeedbackRepositoryImpl
 from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
 from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
+from app.conversation.infrastructure.repository.chat_summary_repository_impl import ChatSummaryRepositoryImpl
 from app.conversation.infrastructure.repository.usage_meter_impl import UsageMeterImpl
-from app.config.security.message_crypto import AESEncryption
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
-from app.conversation.infrastructure.pdf.pdf_generator_service import PDFGeneratorService
+from app.common.domain.exceptions import IdempotencyKeyConflictException
+from app.common.infrastructure.idempotency import IdempotencyStore
+from app.common.infrastructure.single_flight import SingleFlight
 
-crypto_service = AESEncryption()
-llm_chat_port = CallGPT()
 usage_meter = UsageMeterImpl()
+idempotency_store = IdempotencyStore()
+summary_single_flight = SingleFlight()
 
 conversation_router = APIRouter(tags=["conversation"])
 
 
+def _apply_media_cookies(request: Request, response: Response, account_id: int) -> None:
+    """cookie 모드일 때 계정 폴더용 CloudFront signed cookie 발급 (유효한 쿠키가 있으면 생략)"""
+    s3_service = container.s3()
+    if not s3_service.uses_signed_cookies:
+        return
+    if not s3_service.needs_cookie_refresh(request.cookies.get(s3_service.COOKIE_POLICY), account_id):
+        return
+    for key, value in s3_service.get_signed_cookies(account_id).items():
+        response.set_cookie(
+            key=key,
+            value=value,
+            httponly=True,
+            secure=settings.effective_cookie_secure,
+            samesite=settings.COOKIE_SAMESITE,
+            path="/",
+            domain=settings.CLOUDFRONT_COOKIE_DOMAIN or None,
+            max_age=settings.CLOUDFRONT_COOKIE_TTL_SECONDS,
+        )
+
+
 @conversation_router.post("/upload")
 async def upload_file(
+    request: Request,
+    response: Response,
     file: UploadFile = File(...),
     account_id: int = Depends(get_current_account_id)
 ):
     """
     S3에 저장 후, 화면에서 보여줄 수 있는 URL을 반환합니다.
     """
-    s3_service = S3Service()
+    s3_service = container.s3()
     try:
         file_path = await s3_service.upload_file(file, account_id)
-        signed_url = s3_service.get_signed_url(file_path)
+        signed_url = s3_service.get_media_url(file_path)
+        _apply_media_cookies(request, response, account_id)
         return {
             "file_url": signed_url,
             "file_path": file_path
@@ -51,10 +80,80 @@ async def upload_file(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
 
+
+@conversation_router.post("/upload/intent")
+async def create_upload_intent(
+    request: UploadIntentRequest,
+    http_request: Request,
+    response: Response,
+    account_id: int = Depends(get_current_account_id)
+):
+    """
+    S3 직접 업로드용 presigned POST를 발급합니다 (파일 바이트는 API 서버를 거치지 않음).
+    sha256이 이미 올린 파일과 같으면 duplicate=true와 기존 파일 경로를 반환합니다.
+    """
+    try:
+        result = await container.s3().create_upload_intent(
+            account_id=account_id,
+            filename=request.filename,
+            content_type=request.content_type,
+            size=request.size,
+            sha256=request.sha256,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result["duplicate"]:
+        _apply_media_cookies(http_request, response, account_id)
+    return result
+
+
+@conversation_router.post("/upload/complete")
+async def complete_upload(
+    request: UploadCompleteRequest,
+    http_request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    account_id: int = Depends(get_current_account_id)
+):
+    """
+    직접 업로드 완료 보고. 크기/형식을 검증하고 후처리(압축, Vision 축소본, 텍스트 추출)는 응답 후 수행합니다.
+    """
+    s3_service = container.s3()
+    try:
+        result = await s3_service.complete_direct_upload(account_id, request.upload_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    background_tasks.add_task(
+        s3_service.process_direct_upload,
+        account_id,
+        result["file_path"],
+        result["content_type"],
+    )
+    _apply_media_cookies(http_request, response, account_id)
+    return {
+        "file_url": result["file_url"],
+        "file_path": result["file_path"]
+    }
+
+@conversation_router.get("/media/cookies")
+async def refresh_media_cookies(
+    request: Request,
+    response: Response,
+    account_id: int = Depends(get_current_account_id)
+):
+    """
+    CloudFront signed cookie 발급/갱신 (cookie 모드에서 로그인 직후나 만료 전에 호출).
+    """
+    _apply_media_cookies(request, response, account_id)
+    return {"mode": settings.CLOUDFRONT_MEDIA_AUTH_MODE}
+
+
 @conversation_router.get("/rooms")
 async def get_my_rooms(
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)  # 1. 세션 주입 필요
+        db: Session = Depends(get_read_db_session)  # 1. 세션 주입 필요 (읽기 전용 -> 레플리카)
 ):
     # 2. 레포지토리에 현재 세션을 넣어서 생성
     room_repo = ChatRoomRepositoryImpl(db)
@@ -71,7 +170,68 @@ async def stream_chat_auto(
         room_id: str | None = Body(default=None, embed=True),
         file_urls: list[str] = Body(default=[], embed=True),
         contents_type: str = Body(default="TEXT", embed=True),
+        idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
         db: Session = Depends(get_db_session)
+):
+    # 0. Idempotency-Key: 같은 키의 재시도는 새 방/메시지/LLM 호출 없이 기존 생성 결과에 붙는다
+    if idempotency_key:
+        fingerprint = IdempotencyStore.fingerprint("chat:stream-auto", {
+            "message": message,
+            "room_id": room_id,
+            "file_urls": file_urls,
+            "contents_type": contents_type,
+        })
+        try:
+            existing = await idempotency_store.claim(account_id, idempotency_key, fingerprint)
+        except IdempotencyKeyConflictException as e:
+            raise HTTPException(status_code=422, detail=e.message)
+
+        if existing and existing.is_failed:
+            # 이미 방/메시지가 만들어진 뒤 실패한 요청: 다시 만들지 않고 저장된 오류와 방 ID를 돌려준다
+            raise HTTPException(
+                status_code=409,
+                detail=existing.error,
+                headers=_room_headers(existing.resource_id, replayed=True),
+            )
+        if existing:
+            return StreamAdapter.to_streaming_response(
+                idempotency_store.replay(account_id, idempotency_key),
+                headers=_room_headers(existing.resource_id, replayed=True),
+            )
+
+    try:
+        return await _start_chat_stream(
+            account_id=account_id,
+            message=message,
+            room_id=room_id,
+            file_urls=file_urls,
+            contents_type=contents_type,
+            idempotency_key=idempotency_key,
+            db=db,
+        )
+    except Exception as e:
+        if idempotency_key:
+            await idempotency_store.abort(account_id, idempotency_key, str(e) or type(e).__name__)
+        raise
+
+
+def _room_headers(room_id: str | None, replayed: bool = False) -> dict:
+    headers = {"Access-Control-Expose-Headers": "X-Room-Id, Idempotent-Replayed"}
+    if room_id:
+        headers["X-Room-Id"] = room_id
+    if replayed:
+        headers["Idempotent-Replayed"] = "true"
+    return headers
+
+
+async def _start_chat_stream(
+        account_id: int,
+        message: str,
+        room_id: str | None,
+        file_urls: list[str],
+        contents_type: str,
+        idempotency_key: str | None,
+        db: Session,
 ):
     from app.conversation.infrastructure.repository.chat_room_repository_impl import ChatRoomRepositoryImpl
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
@@ -80,7 +240,7 @@ async def stream_chat_auto(
     chat_room_repo = ChatRoomRepositoryImpl(db)
     chat_message_repo = ChatMessageRepositoryImpl(db)
     account_repo = AccountRepositoryImpl(db)  # 추가
-    s3_service = S3Service()
+    s3_service = container.s3()
 
     # 1. room_id 판단 로직 보정
     # 프론트에서 'null' 문자열이 오거나 아예 없을 때를 대비
@@ -105,14 +265,18 @@ async def stream_chat_auto(
         if not room_exists:
             raise HTTPException(status_code=404, detail="Room not found")
 
+    # 방이 정해진 즉시 기록해야 이후 단계가 실패해도 재시도가 새 방을 만들지 않는다
+    if idempotency_key:
+        await idempotency_store.set_resource_id(account_id, idempotency_key, current_room_id)
+
     # 2. UseCase 생성 (이미 검증된 current_room_id 사용)
     usecase = StreamChatUsecase(
         chat_room_repo=chat_room_repo,
         chat_message_repo=chat_message_repo,
         account_repo=account_repo,  # mbti, gender 활용 위한 추가
-        llm_chat_port=llm_chat_port,
+        llm_chat_port=container.llm(),
         usage_meter=usage_meter,
-        crypto_service=crypto_service,
+        crypto_service=container.crypto(),
         s3_service=s3_service
     )
 
@@ -124,7 +288,10 @@ async def stream_chat_auto(
         file_urls=file_urls,
     )
 
-    return StreamAdapter.to_streaming_response(generator)
+    if idempotency_key:
+        generator = idempotency_store.record(account_id, idempotency_key, generator)
+
+    return StreamAdapter.to_streaming_response(generator, headers=_room_headers(current_room_id))
 
 
 # 피드백 생성 (POST)
@@ -187,6 +354,7 @@ async def delete_chat_room(
 @conversation_router.patch("/rooms/{room_id}/end")
 async def end_chat(
     room_id: str,
+    background_tasks: BackgroundTasks,
     account_id: int = Depends(get_current_account_id),
     db: Session = Depends(get_db_session),
 ):
@@ -194,8 +362,43 @@ async def end_chat(
     uc = EndChatUseCase(room_repo)
 
     await uc.execute(room_id=room_id, account_id=account_id)
+
+    # 요약/PDF를 미리 생성해 두어 다운로드 요청은 저장본으로 바로 응답
+    background_tasks.add_task(_precompute_chat_summary, room_id, account_id)
     return {"room_id": room_id, "status": "ENDED"}
 
+
+async def _precompute_chat_summary(room_id: str, account_id: int):
+    """대화 종료 후 백그라운드에서 요약과 PDF 생성 (요청 세션이 닫힌 뒤 실행되므로 별도 세션 사용)"""
+    db = SessionLocal()
+    try:
+        usecase = _build_summary_pdf_usecase(db)
+        await usecase.execute(room_id=room_id, account_id=account_id)
+    except Exception as e:
+        # 실패해도 다운로드 시 on-demand 생성으로 대체됨
+        print(f"--- Summary Precompute Error: {str(e)}")
+    finally:
+        db.close()
+
+
+def _build_summary_pdf_usecase(db: Session) -> GetChatSummaryPdfUseCase:
+    chat_summary_repo = ChatSummaryRepositoryImpl(db)
+    summarize_usecase = SummarizeChatUseCase(
+        chat_room_repo=ChatRoomRepositoryImpl(db),
+        chat_message_repo=ChatMessageRepositoryImpl(db),
+        crypto_service=container.crypto(),
+        llm_service=container.llm(),
+        chat_summary_repo=chat_summary_repo,
+        single_flight=summary_single_flight,
+    )
+    return GetChatSummaryPdfUseCase(
+        summarize_usecase=summarize_usecase,
+        chat_summary_repo=chat_summary_repo,
+        pdf_renderer=container.pdf_renderer(),
+        s3_service=container.s3(),
+    )
+
+
 @conversation_router.get("/rooms/{room_id}/status")
 async def get_room_status(
     room_id: str,
@@ -210,14 +413,16 @@ async def get_room_status(
 @conversation_router.get("/rooms/{room_id}/messages")
 async def get_room_messages(
         room_id: str,
+        request: Request,
+        response: Response,
         account_id: int = Depends(get_current_account_id),
-        db: Session = Depends(get_db_session)
+        db: Session = Depends(get_read_db_session)
 ):
     from app.conversation.infrastructure.repository.chat_message_repository_impl import ChatMessageRepositoryImpl
     chat_message_repo = ChatMessageRepositoryImpl(db)
-    s3_service = S3Service()
+    s3_service = container.s3()
 
-    uc = GetChatMessagesUseCase(chat_message_repo, crypto_service)
+    uc = GetChatMessagesUseCase(chat_message_repo, container.crypto())
     messages = await uc.execute(room_id, account_id)
 
     result = []
@@ -237,7 +442,8 @@ async def get_room_messages(
 
         converted_urls = []
         if raw_urls and isinstance(raw_urls, list):
-            converted_urls = [s3_service.get_signed_url(u) for u in raw_urls]
+            # cookie 모드면 서명 없는 고정 URL (쿠키 하나로 모든 파일 접근)
+            converted_urls = [s3_service.get_media_url(u) for u in raw_urls]
 
         result.append({
             "message_id": message_id,
@@ -247,6 +453,7 @@ async def get_room_messages(
             "file_urls": converted_urls
         })
 
+    _apply_media_cookies(request, response, account_id)
     return result
 
 
@@ -263,7 +470,10 @@ async def get_chat_summary(
     usecase = SummarizeChatUseCase(
         chat_room_repo=chat_room_repo,
         chat_message_repo=chat_message_repo,
-        crypto_service=crypto_service,
+        crypto_service=container.crypto(),
+        llm_service=container.llm(),
+        chat_summary_repo=ChatSummaryRepositoryImpl(db),
+        single_flight=summary_single_flight,
     )
     
     result = await usecase.execute(room_id=room_id, account_id=account_id)
@@ -276,37 +486,48 @@ async def download_chat_summary_pdf(
     account_id: int = Depends(get_current_account_id),
     db: Session = Depends(get_db_session)
 ):
-    """채팅 요약 PDF 다운로드"""
-    chat_room_repo = ChatRoomRepositoryImpl(db)
-    chat_message_repo = ChatMessageRepositoryImpl(db)
+    """채팅 요약 PDF 다운로드 (대화 종료 시 미리 만들어 둔 PDF가 있으면 그대로 제공)"""
+    usecase = _build_summary_pdf_usecase(db)
+    summary_result, pdf_bytes = await usecase.execute(room_id=room_id, account_id=account_id)
     
-    # 요약 생성
-    usecase = SummarizeChatUseCase(
-        chat_room_repo=chat_room_repo,
-        chat_message_repo=chat_message_repo,
-        crypto_service=crypto_service,
-    )
-    
-    summary_result = await usecase.execute(room_id=room_id, account_id=account_id)
+    # 파일명 생성 (한글 호환을 위한 URL 인코딩)
+    from urllib.parse import quote
+    safe_title = quote(summary_result["room_title"][:30], safe='')
+    filename = f"chat_summary_{safe_title}_{room_id[:8]}.pdf"
     
-    # PDF 생성
-    pdf_service = PDFGeneratorService()
-    pdf_buffer = pdf_service.generate_summary_pdf(
-        room_title=summary_result["room_title"],
-        summary_text=summary_result["summary"],
-        created_at=summary_result["created_at"],
-        message_count=summary_result["message_count"]
+    return StreamingResponse(
+        BytesIO(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"'
+        }
     )
+
+
+@conversation_router.get("/rooms/{room_id}/transcript/pdf")
+async def download_chat_transcript_pdf(
+    room_id: str,
+    account_id: int = Depends(get_current_account_id),
+    db: Session = Depends(get_db_session)
+):
+    """대화 기록 전체 PDF 다운로드 (메시지를 페이지 단위로 읽어 렌더링 후 스트리밍)"""
+    usecase = ExportChatTranscriptUseCase(
+        chat_room_repo=ChatRoomRepositoryImpl(db),
+        chat_message_repo=ChatMessageRepositoryImpl(db),
+        crypto_service=container.crypto(),
+        pdf_renderer=container.pdf_renderer(),
+    )
+    room_title, pdf_stream = await usecase.execute(room_id=room_id, account_id=account_id)
     
     # 파일명 생성 (한글 호환을 위한 URL 인코딩)
     from urllib.parse import quote
-    safe_title = quote(summary_result["room_title"][:30], safe='')
-    filename = f"chat_summary_{safe_title}_{room_id[:8]}.pdf"
+    safe_title = quote(room_title[:30], safe='')
+    filename = f"chat_transcript_{safe_title}_{room_id[:8]}.pdf"
     
     return StreamingResponse(
-        pdf_buffer,
+        pdf_stream,
         media_type="application/pdf",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
         }
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,13 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class UploadIntentRequest(BaseModel):
+    filename: str
+    content_type: str
+    size: int = Field(..., gt=0)  # 바이트
+    sha256: Optional[str] = None  # 클라이언트가 계산한 내용 해시 (있으면 중복 업로드 생략)
+
+
+class UploadCompleteRequest(BaseModel):
+    upload_id: str
@@ -4,5 +4,5 @@ from fastapi.responses import StreamingResponse
 class StreamAdapter:
 
     @staticmethod
-    def to_streaming_response(generator):
-        return StreamingResponse(generator, media_type="text/plain")
+    def to_streaming_response(generator, headers: dict | None = None):
+        return StreamingResponse(generator, media_type="text/plain", headers=headers)
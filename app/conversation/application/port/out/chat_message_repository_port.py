@@ -11,6 +11,16 @@ class ChatMessageRepositoryPort(ABC):
     async def find_by_room_id(self, room_id: str):
         pass
 
+    @abstractmethod
+    async def find_page_by_room_id(self, room_id: str, after_id: int, limit: int):
+        """id > after_id 인 메시지를 id 오름차순으로 최대 limit개 (keyset pagination)"""
+        pass
+
+    @abstractmethod
+    async def find_last_message_id(self, room_id: str) -> int | None:
+        """방의 마지막 메시지 ID (요약 캐시의 high-water mark)"""
+        pass
+
     @abstractmethod
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
         pass
\ No newline at end of file
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+
+
+class ChatSummaryRepositoryPort(ABC):
+
+    @abstractmethod
+    async def find_by_room_id(self, room_id: str):
+        """저장된 요약 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def find_latest_by_room_id(self, room_id: str):
+        """다른 워커가 방금 커밋한 요약까지 보이도록 새로 읽은 요약 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def save(
+        self,
+        room_id: str,
+        last_message_id: int,
+        message_count: int,
+        summary_enc: bytes,
+        iv: bytes,
+        enc_version: int,
+    ) -> None:
+        """방 단위로 요약을 덮어쓴다 (room_id당 최신 요약 1건)"""
+        pass
+
+    @abstractmethod
+    async def save_pdf_path(self, room_id: str, last_message_id: int, pdf_path: str) -> None:
+        """렌더링된 PDF 위치 기록 (요약이 그 사이 갱신됐다면 무시)"""
+        pass
+
+    @abstractmethod
+    async def find_chunks_by_room_id(self, room_id: str) -> list:
+        """저장된 구간(청크) 요약 목록 (start_message_id 오름차순)"""
+        pass
+
+    @abstractmethod
+    async def save_chunk(
+        self,
+        room_id: str,
+        start_message_id: int,
+        end_message_id: int,
+        message_count: int,
+        summary_enc: bytes,
+        iv: bytes,
+        enc_version: int,
+    ) -> None:
+        """닫힌 구간의 요약 저장 (이미 있으면 무시)"""
+        pass
@@ -0,0 +1,96 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+
+from fastapi import HTTPException
+
+from app.config.security.message_crypto import AESEncryption
+from app.conversation.application.port.out.chat_message_repository_port import ChatMessageRepositoryPort
+from app.conversation.application.port.out.chat_room_repository_port import ChatRoomRepositoryPort
+from app.conversation.infrastructure.pdf.pdf_renderer import PDFRenderer
+
+
+class ExportChatTranscriptUseCase:
+    """대화 기록 전체 PDF 내보내기 UseCase
+
+    메시지는 PAGE_SIZE 단위로 keyset 조회하여 렌더링 스레드가 필요할 때만 가져오고,
+    복호화와 flowable 변환도 배치 단위로 렌더링 스레드에서 수행한다.
+    """
+
+    PAGE_SIZE = 200
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        chat_room_repo: ChatRoomRepositoryPort,
+        chat_message_repo: ChatMessageRepositoryPort,
+        crypto_service: AESEncryption,
+        pdf_renderer: PDFRenderer,
+    ):
+        self.chat_room_repo = chat_room_repo
+        self.chat_message_repo = chat_message_repo
+        self.crypto_service = crypto_service
+        self.pdf_renderer = pdf_renderer
+
+    async def execute(self, room_id: str, account_id: int) -> tuple[str, AsyncIterator[bytes]]:
+        """
+        권한 확인 후 (대화방 제목, PDF 바이트 스트림)을 반환합니다.
+        권한/존재 오류는 스트리밍 시작 전에 발생합니다.
+        """
+        room_orm = await self.chat_room_repo.find_by_id(room_id)
+        if not room_orm:
+            raise HTTPException(status_code=404, detail="대화방을 찾을 수 없습니다.")
+
+        if room_orm.account_id != account_id:
+            raise HTTPException(status_code=403, detail="권한이 없습니다.")
+
+        room_title = room_orm.title or "제목 없음"
+        return room_title, self._stream(room_id, room_title, room_orm.created_at)
+
+    async def _stream(self, room_id: str, room_title: str, created_at) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+
+        def render() -> bytes:
+            return self.pdf_renderer.service.generate_transcript_pdf(
+                room_title=room_title,
+                created_at=created_at,
+                message_batches=self._iter_batches(room_id, loop),
+            ).getvalue()
+
+        pdf_bytes = await self.pdf_renderer.run_in_thread(render)
+
+        for offset in range(0, len(pdf_bytes), self.STREAM_CHUNK_SIZE):
+            yield pdf_bytes[offset:offset + self.STREAM_CHUNK_SIZE]
+
+    def _iter_batches(self, room_id: str, loop: asyncio.AbstractEventLoop) -> Iterator[list]:
+        """렌더링 스레드에서 호출: 다음 페이지를 이벤트 루프(요청 세션)에서 조회 후 배치 복호화"""
+        after_id = 0
+        while True:
+            page = asyncio.run_coroutine_threadsafe(
+                self._fetch_page(room_id, after_id), loop
+            ).result()
+            if not page:
+                return
+
+            after_id = page[-1][0]
+            yield self._decrypt_batch(page)
+
+            if len(page) < self.PAGE_SIZE:
+                return
+
+    async def _fetch_page(self, room_id: str, after_id: int) -> list[tuple]:
+        msgs = await self.chat_message_repo.find_page_by_room_id(room_id, after_id, self.PAGE_SIZE)
+        # 스레드로 ORM 객체를 넘기지 않도록 필요한 값만 추출
+        return [(m.id, m.role, m.content_enc, m.iv, m.created_at) for m in msgs]
+
+    def _decrypt_batch(self, page: list[tuple]) -> list[tuple]:
+        batch = []
+        for _, role, content_enc, iv, created_at in page:
+            try:
+                text = self.crypto_service.decrypt(
+                    ciphertext=content_enc,
+                    iv=iv if (iv and len(iv) == 16) else None
+                )
+            except Exception:
+                text = "[복호화 실패]"
+            batch.append((role, text, created_at))
+        return batch
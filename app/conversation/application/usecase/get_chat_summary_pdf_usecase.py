@@ -0,0 +1,59 @@
+from app.config.s3_service import S3Service
+from app.conversation.application.port.out.chat_summary_repository_port import ChatSummaryRepositoryPort
+from app.conversation.application.usecase.summarize_chat_usecase import SummarizeChatUseCase
+from app.conversation.infrastructure.pdf.pdf_renderer import PDFRenderer
+
+
+class GetChatSummaryPdfUseCase:
+    """채팅 요약 PDF UseCase
+
+    현재 요약과 같은 시점(last_message_id)으로 렌더링해 둔 PDF가 있으면 S3에서 바로 내려주고,
+    없으면 렌더링 후 저장한다. 대화 종료 시 백그라운드 작업도 이 UseCase로 PDF를 미리 만들어 둔다.
+    """
+
+    PDF_KEY_FORMAT = "summary/{room_id}/{last_message_id}.pdf"
+
+    def __init__(
+        self,
+        summarize_usecase: SummarizeChatUseCase,
+        chat_summary_repo: ChatSummaryRepositoryPort,
+        pdf_renderer: PDFRenderer,
+        s3_service: S3Service,
+    ):
+        self.summarize_usecase = summarize_usecase
+        self.chat_summary_repo = chat_summary_repo
+        self.pdf_renderer = pdf_renderer
+        self.s3_service = s3_service
+
+    async def execute(self, room_id: str, account_id: int) -> tuple[dict, bytes]:
+        """
+        Returns:
+            (요약 결과 dict, PDF 바이트)
+        """
+        # 1. 요약 (저장된 요약이 있으면 LLM 호출 없음, 권한 확인 포함)
+        summary_result = await self.summarize_usecase.execute(room_id=room_id, account_id=account_id)
+        last_message_id = summary_result["last_message_id"]
+
+        # 2. 같은 시점으로 미리 렌더링된 PDF가 있으면 그대로 반환
+        stored = await self.chat_summary_repo.find_by_room_id(room_id)
+        if stored and stored.pdf_path and stored.last_message_id == last_message_id:
+            pdf_bytes = await self.s3_service.read_bytes(stored.pdf_path)
+            if pdf_bytes:
+                return summary_result, pdf_bytes
+
+        # 3. 없으면 렌더링 후 저장 (저장 실패는 다운로드에 영향 없음)
+        pdf_bytes = await self.pdf_renderer.render_summary_pdf(
+            room_title=summary_result["room_title"],
+            summary_text=summary_result["summary"],
+            created_at=summary_result["created_at"],
+            message_count=summary_result["message_count"]
+        )
+
+        pdf_path = self.PDF_KEY_FORMAT.format(room_id=room_id, last_message_id=last_message_id)
+        try:
+            await self.s3_service.upload_bytes(pdf_path, pdf_bytes, "application/pdf")
+            await self.chat_summary_repo.save_pdf_path(room_id, last_message_id, pdf_path)
+        except Exception as e:
+            print(f"--- Summary PDF Store Error: {str(e)}")
+
+        return summary_result, pdf_bytes
@@ -1,7 +1,12 @@
+import asyncio
+import time
 from typing import AsyncIterator, Optional
 from fastapi import HTTPException
 from pathlib import Path
 
+from app.config.settings import settings
+from app.conversation.infrastructure.observability.tracing import Span, observe, start_span, trace_span
+
 class StreamChatUsecase:
     def __init__(
             self,
@@ -29,12 +34,34 @@ class StreamChatUsecase:
             contents_type: str,
             file_urls: Optional[list] = None,
     ) -> AsyncIterator[bytes]:
+        # 턴 전체 span (단계별 span은 이 span의 자식으로 기록되어 /metrics 히스토그램에 집계됨)
+        turn = start_span("chat.turn", room_id=room_id, account_id=account_id)
+        try:
+            async for chunk in self._execute(turn, room_id, account_id, message, contents_type, file_urls):
+                yield chunk
+        except Exception:
+            turn.error = True
+            raise
+        finally:
+            turn.end()
+
+    async def _execute(
+            self,
+            turn: Span,
+            room_id: str,
+            account_id: int,
+            message: str,
+            contents_type: str,
+            file_urls: Optional[list] = None,
+    ) -> AsyncIterator[bytes]:
 
-        await self.usage_meter.check_available(account_id)
+        with trace_span("chat.quota_check", parent=turn):
+            await self.usage_meter.check_available(account_id)
 
         # 1. 데이터 로드 및 애그리거트 생성
-        room_orm = await self.chat_room_repo.find_by_id(room_id)
-        msg_orms = await self.chat_message_repo.find_by_room_id(room_id)
+        with trace_span("chat.load_history", parent=turn):
+            room_orm = await self.chat_room_repo.find_by_id(room_id)
+            msg_orms = await self.chat_message_repo.find_by_room_id(room_id)
 
         from app.conversation.domain.conversation.aggregate import Conversation
         conversation = Conversation(room=room_orm, messages=msg_orms)
@@ -47,17 +74,19 @@ class StreamChatUsecase:
         gpt_image_urls = []
         combined_file_texts = []
 
-        if file_urls:
-            for url in file_urls:
-                ext = Path(url).suffix.lower()
-
-                if ext in IMAGE_EXTENSIONS:
-                    # [Case 1] 이미지 파일: Vision용 Signed URL 생성
-                    signed_url = self.s3_service.get_signed_url(url)
-                    gpt_image_urls.append(signed_url)
-                else:
-                    # [Case 2] 범용 파일: 텍스트 추출 시도 (txt, script, log, md, py 등)
-                    text_content = await self.s3_service.read_file_content(url)
+        with trace_span("chat.attachments", parent=turn, files=len(file_urls or [])):
+            if file_urls:
+                # [Case 1] 이미지 파일: Vision용 축소본의 Signed URL 생성 (없으면 원본)
+                # [Case 2] 범용 파일: 텍스트 추출 시도 (txt, script, log, md, py 등)
+                # 첨부가 여러 개면 S3/인덱스 조회를 동시에 수행 (순서는 유지)
+                image_urls = [url for url in file_urls if Path(url).suffix.lower() in IMAGE_EXTENSIONS]
+                text_urls = [url for url in file_urls if Path(url).suffix.lower() not in IMAGE_EXTENSIONS]
+                signed_urls, text_contents = await asyncio.gather(
+                    asyncio.gather(*(self.s3_service.get_vision_image_url(url) for url in image_urls)),
+                    asyncio.gather(*(self.s3_service.read_file_content(url) for url in text_urls)),
+                )
+                gpt_image_urls.extend(signed_urls)
+                for url, text_content in zip(text_urls, text_contents):
                     if text_content:
                         combined_file_texts.append(f"\n[파일명: {url}]\n{text_content}\n")
 
@@ -65,19 +94,26 @@ class StreamChatUsecase:
         file_content_to_append = "".join(combined_file_texts)
 
         # 3. 유저 메시지 저장
-        user_encrypted, user_iv = self.crypto_service.encrypt(message)
-        saved_user = await self.chat_message_repo.save_message(
-            room_id=room_id,
-            account_id=account_id,
-            role="USER",
-            content_enc=user_encrypted,
-            iv=user_iv,
-            parent_id=conversation.get_last_id(),
-            enc_version=self.crypto_service.get_version(),
-            contents_type=contents_type,
-            file_urls=file_urls,
-        )
-        user_profile = self.account_repo.find_by_id(account_id)
+        with trace_span("chat.persist_user", parent=turn):
+            user_encrypted, user_iv = self.crypto_service.encrypt(message)
+            saved_user = await self.chat_message_repo.save_message(
+                room_id=room_id,
+                account_id=account_id,
+                role="USER",
+                content_enc=user_encrypted,
+                iv=user_iv,
+                parent_id=conversation.get_last_id(),
+                enc_version=self.crypto_service.get_version(),
+                contents_type=contents_type,
+                file_urls=file_urls,
+            )
+
+        # 이전 대화 복호화
+        with trace_span("chat.decrypt", parent=turn, messages=len(msg_orms)):
+            history_payload = conversation.to_llm_payload(self.crypto_service)
+
+        prompt_span = start_span("chat.prompt_build", parent=turn)
+        user_profile = self.account_repo.find_by_id_cached(account_id)
         # 4. 프롬프트 구성 (동적 지시사항 적용)
         system_instruction = (
             "당신은 '관계 심리 상담 전문가'입니다. 다음 지침을 엄격히 준수하세요:\n"
@@ -113,7 +149,6 @@ class StreamChatUsecase:
 
             system_instruction += "이 사람의 특성을 고려하여 대화하세요.\n\n"
 
-        history_payload = conversation.to_llm_payload(self.crypto_service)
         history_context = "".join(
             [f"{'사용자' if h['role'] == 'user' else '상담사'}: {h['content']}\n" for h in history_payload])
 
@@ -134,29 +169,44 @@ class StreamChatUsecase:
             f"--- 첨부 파일 내용 ---\n{file_content_to_append if file_content_to_append else '없음'}\n"
             f"### 현재 상황 지시: {instruction_note}"
         )
+        prompt_span.end()
 
         # 5. AI 응답 스트리밍
+        # yield를 가로지르는 구간이므로 span 대신 직접 측정 (TTFT / 스트림 전체)
         assistant_full_message = ""
+        llm_started = time.perf_counter()
+        first_token = True
         try:
-            async for chunk in self.llm_chat_port.call_gpt(prompt=final_prompt, file_urls=gpt_image_urls):
+            async for chunk in self.llm_chat_port.call_gpt(
+                prompt=final_prompt,
+                file_urls=gpt_image_urls,
+                image_detail=settings.VISION_IMAGE_DETAIL or None,
+                use_case="chat",
+                account_id=account_id,
+            ):
+                if first_token:
+                    first_token = False
+                    observe("chat.ttft", (time.perf_counter() - llm_started) * 1000)
                 assistant_full_message += chunk
                 yield chunk.encode("utf-8")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"AI 응답 생성 실패: {str(e)}")
+        observe("chat.stream", (time.perf_counter() - llm_started) * 1000)
 
         # 6. AI 메시지 저장 및 확정
-        assistant_encrypted, assistant_iv = self.crypto_service.encrypt(assistant_full_message)
-        await self.chat_message_repo.save_message(
-            room_id=room_id,
-            account_id=account_id,
-            role="ASSISTANT",
-            content_enc=assistant_encrypted,
-            iv=assistant_iv,
-            parent_id=saved_user.id,
-            enc_version=self.crypto_service.get_version(),
-            contents_type=contents_type,
-            file_urls=[],
-        )
-
-        self.chat_message_repo.db.commit()
-        await self.usage_meter.record_usage(account_id, len(message), len(assistant_full_message))
\ No newline at end of file
+        with trace_span("chat.persist_assistant", parent=turn):
+            assistant_encrypted, assistant_iv = self.crypto_service.encrypt(assistant_full_message)
+            await self.chat_message_repo.save_message(
+                room_id=room_id,
+                account_id=account_id,
+                role="ASSISTANT",
+                content_enc=assistant_encrypted,
+                iv=assistant_iv,
+                parent_id=saved_user.id,
+                enc_version=self.crypto_service.get_version(),
+                contents_type=contents_type,
+                file_urls=[],
+            )
+
+            self.chat_message_repo.db.commit()
+            await self.usage_meter.record_usage(account_id, len(message), len(assistant_full_message))
\ No newline at end of file
@@ -1,25 +1,52 @@
+import asyncio
+from dataclasses import dataclass, field
 from typing import Optional
 from fastapi import HTTPException
 from app.config.call_gpt import CallGPT
 from app.config.security.message_crypto import AESEncryption
 from app.config.prompt_loader import prompt_loader
+from app.config.settings import settings
+from app.conversation.application.policy.usage_policy import UsagePolicy
+from app.common.infrastructure.single_flight import SingleFlight
+from app.conversation.application.port.out.chat_summary_repository_port import ChatSummaryRepositoryPort
 from app.conversation.domain.conversation.aggregate import Conversation
 
 
+@dataclass
+class _SummaryChunk:
+    """요약 단위가 되는 연속된 메시지 구간"""
+    start_message_id: int
+    end_message_id: int
+    message_count: int
+    closed: bool  # 뒤에 메시지가 더 있어 내용이 확정된 구간
+    lines: list[str] = field(default_factory=list)
+    summary: Optional[str] = None
+
+
 class SummarizeChatUseCase:
-    """채팅 요약 UseCase"""
+    """채팅 요약 UseCase
+
+    요약은 (room_id, last_message_id) 기준으로 저장되어, 새 메시지가 없으면 LLM을 다시 호출하지 않는다.
+    새 메시지가 들어오면 last_message_id가 바뀌므로 캐시는 자동으로 무효화된다.
+    긴 대화는 토큰 예산 단위 청크로 나눠 요약한 뒤 합치며(map-reduce), 닫힌 청크의 요약은
+    저장해 두고 재사용하므로 이후 요약은 새 청크만 처리한다.
+    """
     
     def __init__(
         self,
         chat_room_repo,
         chat_message_repo,
         crypto_service: AESEncryption,
-        llm_service: CallGPT = None,
+        llm_service: CallGPT,
+        chat_summary_repo: Optional[ChatSummaryRepositoryPort] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.chat_room_repo = chat_room_repo
         self.chat_message_repo = chat_message_repo
         self.crypto_service = crypto_service
-        self.llm_service = llm_service or CallGPT()
+        self.llm_service = llm_service
+        self.chat_summary_repo = chat_summary_repo
+        self.single_flight = single_flight
     
     async def execute(self, room_id: str, account_id: int) -> dict:
         """
@@ -31,10 +58,11 @@ class SummarizeChatUseCase:
                 "room_title": "대화방 제목",
                 "message_count": 메시지 수,
                 "created_at": datetime,
-                "room_id": room_id
+                "room_id": room_id,
+                "last_message_id": 요약에 포함된 마지막 메시지 ID
             }
         """
-        # 1. 대화방 및 메시지 로드
+        # 1. 대화방 권한 확인 및 high-water mark 조회
         room_orm = await self.chat_room_repo.find_by_id(room_id)
         if not room_orm:
             raise HTTPException(status_code=404, detail="대화방을 찾을 수 없습니다.")
@@ -42,54 +70,239 @@ class SummarizeChatUseCase:
         if room_orm.account_id != account_id:
             raise HTTPException(status_code=403, detail="권한이 없습니다.")
         
-        msg_orms = await self.chat_message_repo.find_by_room_id(room_id)
-        if not msg_orms:
+        last_message_id = await self.chat_message_repo.find_last_message_id(room_id)
+        if last_message_id is None:
             raise HTTPException(status_code=400, detail="대화 내용이 없습니다.")
         
-        # 2. Conversation 애그리거트 생성
+        # 2. 변경 없는 방이면 저장된 요약 반환
+        cached = await self._find_cached_summary(room_orm, last_message_id)
+        if cached:
+            return cached
+        
+        # 3. 동시 요청은 하나의 생성 결과를 공유 (single-flight)
+        generate = lambda: self._generate_summary(room_orm, last_message_id)
+        if self.single_flight is None:
+            return await generate()
+        
+        return await self.single_flight.do(
+            f"summary:{room_id}:{last_message_id}",
+            generate,
+            lookup=lambda: self._find_cached_summary(room_orm, last_message_id, latest=True),
+        )
+    
+    async def _generate_summary(self, room_orm, last_message_id: int) -> dict:
+        room_id = room_orm.room_id
+        
+        # 요약 기준 시점 이후에 들어온 메시지는 제외 (캐시 키와 내용 일치)
+        msg_orms = [
+            m for m in await self.chat_message_repo.find_by_room_id(room_id)
+            if m.id <= last_message_id
+        ]
+        
+        # Conversation 애그리거트 생성
         conversation = Conversation(room=room_orm, messages=msg_orms)
         
-        # 3. 대화 내용 복호화 및 텍스트로 변환
-        conversation_text = self._format_conversation_for_summary(conversation)
+        # 토큰 예산 단위로 청크 분할 (닫힌 청크는 저장된 요약 재사용)
+        chunks = await self._split_into_chunks(conversation)
+        
+        if len(chunks) == 1 and chunks[0].summary is None:
+            # 짧은 대화: 기존과 동일하게 한 번에 요약
+            summary_text = await self._call_llm(
+                self._create_summary_prompt("\n\n".join(chunks[0].lines))
+            )
+        else:
+            # 긴 대화: 청크별 요약(map)을 동시에 수행한 뒤 합치기(reduce)
+            await self._summarize_chunks(room_id, chunks)
+            summary_text = await self._reduce([c.summary for c in chunks])
         
-        # 4. 요약 프롬프트 구성
-        summary_prompt = self._create_summary_prompt(conversation_text)
+        # 요약 저장 (메시지와 동일하게 암호화)
+        if self.chat_summary_repo is not None:
+            summary_enc, iv = self.crypto_service.encrypt(summary_text)
+            await self.chat_summary_repo.save(
+                room_id=room_id,
+                last_message_id=last_message_id,
+                message_count=len(msg_orms),
+                summary_enc=summary_enc,
+                iv=iv,
+                enc_version=self.crypto_service.get_version(),
+            )
+        
+        return self._to_result(room_orm, summary_text, len(msg_orms), last_message_id)
+    
+    async def _split_into_chunks(self, conversation: Conversation) -> list["_SummaryChunk"]:
+        """
+        처음부터 greedy하게 토큰 예산만큼 메시지를 묶는다.
+        앞쪽 메시지는 변하지 않으므로 닫힌 청크의 경계는 다음 요약에서도 동일하다.
+        """
+        cached_by_start = {}
+        if self.chat_summary_repo is not None:
+            for chunk_orm in await self.chat_summary_repo.find_chunks_by_room_id(conversation.room.room_id):
+                cached_by_start[chunk_orm.start_message_id] = chunk_orm
+        
+        budget = settings.SUMMARY_CHUNK_TOKEN_BUDGET
+        msgs = sorted(conversation.messages, key=lambda x: x.id)
+        chunks = []
+        i = 0
+        while i < len(msgs):
+            cached = cached_by_start.get(msgs[i].id)
+            cached_summary = self._decrypt_chunk_summary(cached) if cached else None
+            if cached_summary is not None and msgs[-1].id > cached.end_message_id:
+                j = i
+                while j < len(msgs) and msgs[j].id <= cached.end_message_id:
+                    j += 1
+                chunks.append(_SummaryChunk(
+                    start_message_id=cached.start_message_id,
+                    end_message_id=cached.end_message_id,
+                    message_count=j - i,
+                    closed=True,
+                    summary=cached_summary,
+                ))
+                i = j
+                continue
+            
+            lines = []
+            tokens = 0
+            j = i
+            while j < len(msgs):
+                line = self._format_message(msgs[j])
+                line_tokens = UsagePolicy.calculate_token(line) if line else 0
+                if j > i and tokens + line_tokens > budget:
+                    break
+                if line:
+                    lines.append(line)
+                tokens += line_tokens
+                j += 1
+            
+            chunks.append(_SummaryChunk(
+                start_message_id=msgs[i].id,
+                end_message_id=msgs[j - 1].id,
+                message_count=j - i,
+                closed=j < len(msgs),
+                lines=lines,
+            ))
+            i = j
+        
+        return chunks
+    
+    async def _summarize_chunks(self, room_id: str, chunks: list["_SummaryChunk"]) -> None:
+        """요약이 없는 청크만 동시에 요약 (동시성은 LLM admission limit이 제한)"""
+        pending = [c for c in chunks if c.summary is None]
+        results = await asyncio.gather(*(
+            self._call_llm(prompt_loader.get_chunk_summary_prompt("\n\n".join(c.lines)))
+            for c in pending
+        ))
         
-        # 5. LLM 호출 (비스트리밍)
+        for chunk, summary_text in zip(pending, results):
+            chunk.summary = summary_text
+            
+            # 마지막(열린) 청크는 메시지가 더 붙을 수 있으므로 저장하지 않음
+            if chunk.closed and self.chat_summary_repo is not None:
+                summary_enc, iv = self.crypto_service.encrypt(summary_text)
+                await self.chat_summary_repo.save_chunk(
+                    room_id=room_id,
+                    start_message_id=chunk.start_message_id,
+                    end_message_id=chunk.end_message_id,
+                    message_count=chunk.message_count,
+                    summary_enc=summary_enc,
+                    iv=iv,
+                    enc_version=self.crypto_service.get_version(),
+                )
+    
+    async def _reduce(self, summaries: list[str]) -> str:
+        """부분 요약을 fan-in 단위로 묶어 계층적으로 합친다."""
+        while len(summaries) > 1:
+            groups = self._group_for_reduce(summaries)
+            summaries = await asyncio.gather(*(
+                self._call_llm(prompt_loader.get_reduce_summary_prompt(
+                    "\n\n".join(f"[구간 {n}]\n{text}" for n, text in enumerate(group, start=1))
+                ))
+                if len(group) > 1 else asyncio.sleep(0, result=group[0])
+                for group in groups
+            ))
+        return summaries[0]
+    
+    @staticmethod
+    def _group_for_reduce(summaries: list[str]) -> list[list[str]]:
+        fan_in = max(2, settings.SUMMARY_REDUCE_FAN_IN)
+        budget = settings.SUMMARY_CHUNK_TOKEN_BUDGET
+        groups = []
+        group, tokens = [], 0
+        for text in summaries:
+            text_tokens = UsagePolicy.calculate_token(text)
+            # 최소 2개는 묶어야 단계마다 개수가 줄어든다
+            if len(group) >= 2 and (len(group) >= fan_in or tokens + text_tokens > budget):
+                groups.append(group)
+                group, tokens = [], 0
+            group.append(text)
+            tokens += text_tokens
+        if group:
+            groups.append(group)
+        return groups
+    
+    async def _call_llm(self, prompt: str) -> str:
+        # LLM 호출 (비스트리밍)
         try:
-            summary_text = await self.llm_service.call_gpt_non_stream(summary_prompt)
+            summary_text = await self.llm_service.call_gpt_non_stream(prompt, use_case="summary")
         except Exception as e:
             raise HTTPException(
                 status_code=500, 
                 detail=f"요약 생성 실패: {str(e)}"
             )
+        return summary_text.strip()
+    
+    def _decrypt_chunk_summary(self, chunk_orm) -> Optional[str]:
+        try:
+            return self.crypto_service.decrypt(
+                ciphertext=chunk_orm.summary_enc,
+                iv=chunk_orm.iv if (chunk_orm.iv and len(chunk_orm.iv) == 16) else None
+            )
+        except Exception:
+            return None
+    
+    async def _find_cached_summary(self, room_orm, last_message_id: int, latest: bool = False) -> Optional[dict]:
+        """저장된 요약 조회 (latest=True: 다른 워커가 커밋한 결과를 기다리는 폴링용)"""
+        if self.chat_summary_repo is None:
+            return None
+        
+        if latest:
+            summary = await self.chat_summary_repo.find_latest_by_room_id(room_orm.room_id)
+        else:
+            summary = await self.chat_summary_repo.find_by_room_id(room_orm.room_id)
+        if not summary or summary.last_message_id != last_message_id:
+            return None
+        
+        try:
+            summary_text = self.crypto_service.decrypt(
+                ciphertext=summary.summary_enc,
+                iv=summary.iv if (summary.iv and len(summary.iv) == 16) else None
+            )
+        except Exception:
+            return None
         
-        # 6. 결과 반환
+        return self._to_result(room_orm, summary_text, summary.message_count, last_message_id)
+    
+    @staticmethod
+    def _to_result(room_orm, summary_text: str, message_count: int, last_message_id: int) -> dict:
         return {
-            "summary": summary_text.strip(),
+            "summary": summary_text,
             "room_title": room_orm.title or "제목 없음",
-            "message_count": len(msg_orms),
+            "message_count": message_count,
             "created_at": room_orm.created_at,
-            "room_id": room_id
+            "room_id": room_orm.room_id,
+            "last_message_id": last_message_id
         }
     
-    def _format_conversation_for_summary(self, conversation: Conversation) -> str:
-        """대화 내용을 요약용 텍스트로 변환"""
-        text_parts = []
-        
-        sorted_msgs = sorted(conversation.messages, key=lambda x: x.id)
-        for msg in sorted_msgs:
-            try:
-                decrypted = self.crypto_service.decrypt(
-                    ciphertext=msg.content_enc,
-                    iv=msg.iv if (msg.iv and len(msg.iv) == 16) else None
-                )
-                role = "사용자" if str(msg.role).upper() == "USER" else "상담사"
-                text_parts.append(f"{role}: {decrypted}")
-            except Exception:
-                continue
-        
-        return "\n\n".join(text_parts)
+    def _format_message(self, msg) -> Optional[str]:
+        """메시지 하나를 요약용 텍스트로 변환 (복호화 실패 시 None)"""
+        try:
+            decrypted = self.crypto_service.decrypt(
+                ciphertext=msg.content_enc,
+                iv=msg.iv if (msg.iv and len(msg.iv) == 16) else None
+            )
+        except Exception:
+            return None
+        role = "사용자" if str(msg.role).upper() == "USER" else "상담사"
+        return f"{role}: {decrypted}"
     
     def _create_summary_prompt(self, conversation_text: str) -> str:
         """요약 프롬프트 생성 (prompt_loader 사용)"""
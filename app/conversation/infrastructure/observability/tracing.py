@@ -1,12 +1,91 @@
+"""
+경량 span 트레이싱
+
+- 현재 span은 contextvar로 전파된다 (같은 요청/태스크 안의 중첩 span은 자동으로 부모-자식)
+- span이 끝나면 이름별 HDR 히스토그램(metrics_registry)에 소요 시간이 기록되고 /metrics로 노출된다
+- TRACE_LOG_SLOW_MS 이상 걸린 span은 로그로 남긴다
+
+async generator(스트리밍) 안에서는 yield를 가로지르는 with 블록에 trace_span을 쓰지 않는다.
+(yield 사이에 contextvar가 다른 컨텍스트에서 복원될 수 있음) 그런 구간은 start_span()으로
+만든 span을 parent로 넘기거나 observe()로 직접 기록한다.
+"""
+
 import time
+import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from app.common.infrastructure.metrics import metrics_registry
+from app.config.settings import settings
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    attributes: dict = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    elapsed_ms: Optional[float] = None
+    error: bool = False
+
+    def child(self, name: str, **attributes) -> "Span":
+        return Span(name=name, trace_id=self.trace_id, parent_id=self.span_id, attributes=attributes)
+
+    def end(self) -> float:
+        """종료 + 히스토그램 기록 (두 번 호출해도 한 번만 기록)"""
+        if self.elapsed_ms is None:
+            self.elapsed_ms = (time.perf_counter() - self.started) * 1000
+            metrics_registry.observe(self.name, self.elapsed_ms)
+            if self.error:
+                metrics_registry.count_error(self.name)
+            _log_if_slow(self)
+        return self.elapsed_ms
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_span(name: str, parent: Optional[Span] = None, **attributes) -> Span:
+    """컨텍스트에 올리지 않는 span 시작 (스트리밍처럼 여러 단계에 걸친 구간용, 끝나면 span.end())"""
+    parent = parent or _current_span.get()
+    if parent is not None:
+        return parent.child(name, **attributes)
+    return Span(name=name, trace_id=uuid.uuid4().hex, attributes=attributes)
 
 
 @contextmanager
-def trace_span(name: str):
-    start = time.time()
+def trace_span(name: str, parent: Optional[Span] = None, **attributes) -> Iterator[Span]:
+    """블록의 소요 시간을 span으로 기록 (블록 안에서는 이 span이 현재 span)"""
+    span = start_span(name, parent=parent, **attributes)
+    token = _current_span.set(span)
     try:
-        yield
+        yield span
+    except Exception:
+        span.error = True
+        raise
     finally:
-        elapsed = (time.time() - start) * 1000
-        print(f"[TRACE] {name} took {elapsed:.2f}ms")
+        span.end()
+        _current_span.reset(token)
+
+
+def observe(name: str, elapsed_ms: float) -> None:
+    """span 없이 측정한 구간(TTFT 등)을 같은 히스토그램에 기록"""
+    metrics_registry.observe(name, elapsed_ms)
+
+
+def _log_if_slow(span: Span) -> None:
+    threshold = settings.TRACE_LOG_SLOW_MS
+    if threshold and span.elapsed_ms >= threshold:
+        attrs = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+        print(
+            f"[TRACE] {span.name} took {span.elapsed_ms:.2f}ms "
+            f"trace={span.trace_id} span={span.span_id} parent={span.parent_id} {attrs}".rstrip()
+        )
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey, Index, UniqueConstraint
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class ChatSummaryChunkOrm(Base):
+    """
+    긴 대화방의 구간(청크) 요약 캐시.
+    닫힌 청크(start_message_id ~ end_message_id)는 내용이 바뀌지 않으므로 한 번만 요약한다.
+    """
+    __tablename__ = "chat_summary_chunk"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    room_id = Column(
+        String(36),
+        ForeignKey("chat_room.room_id", ondelete="CASCADE"),
+        nullable=False
+    )
+    start_message_id = Column(Integer, nullable=False)
+    end_message_id = Column(Integer, nullable=False)
+    message_count = Column(Integer, nullable=False)
+    summary_enc = Column(LargeBinary, nullable=False)
+    iv = Column(LargeBinary, nullable=False)
+    enc_version = Column(Integer)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # --- 인덱스 설정 ---
+    __table_args__ = (
+        # 같은 구간은 한 번만 저장 (동시 요약 시 중복 방지)
+        UniqueConstraint('room_id', 'start_message_id', 'end_message_id', name='uq_summary_chunk_range'),
+
+        # 방 단위로 청크 요약을 순서대로 조회
+        Index('idx_summary_chunk_room_start', 'room_id', 'start_message_id'),
+    )
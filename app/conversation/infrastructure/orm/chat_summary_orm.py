@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey
+from datetime import datetime
+from app.config.database.session import Base
+
+
+class ChatSummaryOrm(Base):
+    """
+    대화방 요약 캐시.
+    last_message_id(요약 시점의 high-water mark)가 현재 마지막 메시지와 같을 때만 유효하다.
+    """
+    __tablename__ = "chat_summary"
+
+    room_id = Column(
+        String(36),
+        ForeignKey("chat_room.room_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    last_message_id = Column(Integer, nullable=False)
+    message_count = Column(Integer, nullable=False)
+    summary_enc = Column(LargeBinary, nullable=False)
+    iv = Column(LargeBinary, nullable=False)
+    enc_version = Column(Integer)
+    pdf_path = Column(String(255), nullable=True)  # 같은 시점으로 미리 렌더링한 PDF의 S3 키
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,5 +1,7 @@
 from io import BytesIO
 from datetime import datetime
+from typing import Callable, Iterable
+from xml.sax.saxutils import escape
 import os
 import re
 from reportlab.lib.pagesizes import A4
@@ -383,6 +385,38 @@ class PDFGeneratorService:
 
         return text
 
+    def _build_header_flowables(self, meta_lines: list) -> list:
+        """브랜딩 타이틀 + 메타 정보 + 구분선 (요약/대화 기록 PDF 공통)"""
+        story = []
+
+        # === 헤더 영역 (간소화) ===
+        service_name = self.config.get_service_name()
+        service_name_en = self.config.get_service_name_en()
+        primary_color = self.config.get_color('primary')
+        secondary_color = self.config.get_color('secondary')
+
+        # 타이틀 (퍼플~핑크)
+        title_html = f'<font color="{primary_color}">{service_name}</font> <font color="{secondary_color}">{service_name_en}</font>'
+        story.append(Paragraph(title_html, self.styles['CustomTitle']))
+
+        # 태그라인
+        tagline = self.config.get_tagline()
+        story.append(Paragraph(tagline, self.styles['CustomSubtitle']))
+
+        # === 메타 정보 (간소화 - 테두리 제거) ===
+        for meta_line in meta_lines:
+            story.append(Paragraph(meta_line, self.styles['CustomMeta']))
+
+        story.append(Spacer(1, 0.5*cm))
+
+        # === 구분선 ===
+        divider_config = self.config.get_divider_config()
+        divider_color = self._resolve_color(divider_config['color'])
+        story.append(Paragraph(f'<hr color="{divider_color}" width="100%"/>', self.styles['CustomBody']))
+        story.append(Spacer(1, 0.3*cm))
+
+        return story
+
     def generate_summary_pdf(
         self,
         room_title: str,
@@ -414,39 +448,11 @@ class PDFGeneratorService:
             bottomMargin=page_config['margin_bottom']*cm
         )
 
-        story = []
-
-        # === 헤더 영역 (간소화) ===
-        service_name = self.config.get_service_name()
-        service_name_en = self.config.get_service_name_en()
-        primary_color = self.config.get_color('primary')
-        secondary_color = self.config.get_color('secondary')
-
-        # 타이틀 (퍼플~핑크)
-        title_html = f'<font color="{primary_color}">{service_name}</font> <font color="{secondary_color}">{service_name_en}</font>'
-        story.append(Paragraph(title_html, self.styles['CustomTitle']))
-
-        # 태그라인
-        tagline = self.config.get_tagline()
-        story.append(Paragraph(tagline, self.styles['CustomSubtitle']))
-
-        # === 메타 정보 (간소화 - 테두리 제거) ===
-        meta_lines = [
+        story = self._build_header_flowables([
             f"<b>대화방:</b> {room_title}",
             f"<b>일시:</b> {created_at.strftime('%Y.%m.%d %H:%M')}",
             f"<b>메시지:</b> {message_count}개",
-        ]
-
-        for meta_line in meta_lines:
-            story.append(Paragraph(meta_line, self.styles['CustomMeta']))
-
-        story.append(Spacer(1, 0.5*cm))
-
-        # === 구분선 ===
-        divider_config = self.config.get_divider_config()
-        divider_color = self._resolve_color(divider_config['color'])
-        story.append(Paragraph(f'<hr color="{divider_color}" width="100%"/>', self.styles['CustomBody']))
-        story.append(Spacer(1, 0.3*cm))
+        ])
 
         # === 요약 내용 ===
         story.append(Paragraph("대화 요약", self.styles['CustomSection_title']))
@@ -460,3 +466,95 @@ class PDFGeneratorService:
                   onLaterPages=self._add_page_decorations)
         buffer.seek(0)
         return buffer
+
+    def generate_transcript_pdf(
+        self,
+        room_title: str,
+        created_at: datetime,
+        message_batches: Iterable[list],
+    ) -> BytesIO:
+        """대화 기록 전체 PDF 생성
+
+        메시지는 배치 단위로 필요할 때만 가져와 flowable로 변환하므로,
+        메시지 수와 관계없이 메모리에는 몇 배치 분량의 flowable만 유지된다.
+
+        Args:
+            room_title: 대화방 제목
+            created_at: 대화방 생성 시각
+            message_batches: (role, 내용, 작성 시각) 목록을 순서대로 내주는 iterable
+
+        Returns:
+            PDF 파일을 담은 BytesIO 객체
+        """
+        buffer = BytesIO()
+
+        # 페이지 설정 (페이지 스트림 압축으로 누적 메모리 축소)
+        page_config = self.config.get_page_config()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=page_config['margin_right']*cm,
+            leftMargin=page_config['margin_left']*cm,
+            topMargin=page_config['margin_top']*cm,
+            bottomMargin=page_config['margin_bottom']*cm,
+            pageCompression=1
+        )
+
+        head = self._build_header_flowables([
+            f"<b>대화방:</b> {escape(room_title)}",
+            f"<b>일시:</b> {created_at.strftime('%Y.%m.%d %H:%M')}",
+        ])
+        head.append(Paragraph("대화 기록", self.styles['CustomSection_title']))
+
+        story = _LazyFlowables(head, message_batches, self._convert_messages_to_flowables)
+
+        doc.build(story, onFirstPage=self._add_page_decorations,
+                  onLaterPages=self._add_page_decorations)
+        buffer.seek(0)
+        return buffer
+
+    def _convert_messages_to_flowables(self, messages: list) -> list:
+        """메시지 배치를 flowable로 변환 (본문은 마크업으로 해석되지 않도록 escape)"""
+        primary_color = self.config.get_color('primary')
+        secondary_color = self.config.get_color('secondary')
+
+        flowables = []
+        for role, text, sent_at in messages:
+            is_user = str(role).upper() == "USER"
+            label = "사용자" if is_user else "상담사"
+            label_color = secondary_color if is_user else primary_color
+            time_text = sent_at.strftime('%Y.%m.%d %H:%M') if sent_at else ""
+
+            flowables.append(Paragraph(
+                f'<font color="{label_color}"><b>{label}</b></font> {time_text}',
+                self.styles['CustomMeta']
+            ))
+            body = escape(text).replace('\n', '<br/>')
+            flowables.append(Paragraph(body, self.styles['CustomBody']))
+            flowables.append(Spacer(1, 0.3*cm))
+        return flowables
+
+
+class _LazyFlowables(list):
+    """doc.build()가 남은 flowable 수를 len()으로 확인할 때마다 다음 배치를 채워 넣는 리스트
+
+    ReportLab은 story 앞에서부터 flowable을 꺼내 소비하므로, 남은 양이 적어질 때만
+    다음 메시지 배치를 변환해 붙이면 전체 대화를 한 번에 메모리에 올리지 않아도 된다.
+    """
+
+    LOW_WATERMARK = 20
+
+    def __init__(self, head: list, batches: Iterable[list], to_flowables: Callable[[list], list]):
+        super().__init__(head)
+        self._batches = iter(batches)
+        self._to_flowables = to_flowables
+        self._exhausted = False
+
+    def __len__(self):
+        while not self._exhausted and super().__len__() < self.LOW_WATERMARK:
+            batch = next(self._batches, None)
+            if batch is None:
+                self._exhausted = True
+                break
+            self.extend(self._to_flowables(batch))
+        return super().__len__()
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from app.config.settings import settings
+
+if TYPE_CHECKING:
+    from app.conversation.infrastructure.pdf.pdf_generator_service import PDFGeneratorService
+
+
+# --- 워커 프로세스 전용 (프로세스당 한 번만 폰트/스타일 로드) ---
+_worker_service: Optional["PDFGeneratorService"] = None
+
+
+def _init_worker():
+    global _worker_service
+    from app.conversation.infrastructure.pdf.pdf_generator_service import PDFGeneratorService
+
+    _worker_service = PDFGeneratorService()
+
+
+def _render_summary_in_worker(room_title: str, summary_text: str, created_at: datetime, message_count: int) -> bytes:
+    return _worker_service.generate_summary_pdf(
+        room_title=room_title,
+        summary_text=summary_text,
+        created_at=created_at,
+        message_count=message_count,
+    ).getvalue()
+
+
+class PDFRenderer:
+    """
+    프로세스 단위 PDF 렌더러 (싱글톤)
+    - 폰트 등록과 ParagraphStyle 생성은 시작 시 한 번만 수행
+    - ReportLab 렌더링은 이벤트 루프 밖(프로세스 풀, 설정이 0이면 스레드)에서 실행
+    - 같은 입력의 PDF는 요약 해시 기준 LRU 캐시에서 바로 반환
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache_max_entries: Optional[int] = None):
+        self._max_workers = settings.PDF_RENDER_MAX_WORKERS if max_workers is None else max_workers
+        self._cache_max_entries = settings.PDF_CACHE_MAX_ENTRIES if cache_max_entries is None else cache_max_entries
+        self._service: Optional["PDFGeneratorService"] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+
+    @property
+    def service(self) -> "PDFGeneratorService":
+        """메인 프로세스의 PDFGeneratorService (스레드 렌더링 / 다른 렌더링 작업용)"""
+        if self._service is None:
+            # reportlab import + 폰트 등록은 무거우므로 처음 필요할 때 수행
+            from app.conversation.infrastructure.pdf.pdf_generator_service import PDFGeneratorService
+
+            self._service = PDFGeneratorService()
+        return self._service
+
+    def start(self) -> None:
+        """렌더링 풀을 띄우고 폰트/스타일 로드는 백그라운드에서 미리 해 둔다 (앱 시작 시 호출, 부팅을 막지 않음)"""
+        self._get_thread_pool().submit(lambda: self.service)
+        if self._max_workers > 0 and self._process_pool is None:
+            # spawn: 이벤트 루프/DB 커넥션을 가진 부모 프로세스를 fork하지 않음
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-render")
+        return self._thread_pool
+
+    async def run_in_thread(self, fn, *args):
+        """메인 프로세스의 서비스가 필요한 렌더링 작업을 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_thread_pool(), fn, *args)
+
+    @staticmethod
+    def _cache_key(room_title: str, summary_text: str, created_at: datetime, message_count: int) -> str:
+        raw = "\x1f".join([room_title, summary_text, created_at.isoformat(), str(message_count)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def render_summary_pdf(
+        self,
+        room_title: str,
+        summary_text: str,
+        created_at: datetime,
+        message_count: int,
+    ) -> bytes:
+        """채팅 요약 PDF 바이트 생성 (캐시 히트 시 렌더링 생략)"""
+        key = self._cache_key(room_title, summary_text, created_at, message_count)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        args = (room_title, summary_text, created_at, message_count)
+        pdf_bytes = None
+        if self._process_pool is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                pdf_bytes = await loop.run_in_executor(self._process_pool, _render_summary_in_worker, *args)
+            except BrokenProcessPool:
+                # 워커가 죽으면 이후 요청은 스레드 렌더링으로 처리
+                self._process_pool = None
+        if pdf_bytes is None:
+            pdf_bytes = await self.run_in_thread(self._render_summary_in_thread, *args)
+
+        self._cache[key] = pdf_bytes
+        if len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+        return pdf_bytes
+
+    def _render_summary_in_thread(self, room_title: str, summary_text: str, created_at: datetime, message_count: int) -> bytes:
+        return self.service.generate_summary_pdf(
+            room_title=room_title,
+            summary_text=summary_text,
+            created_at=created_at,
+            message_count=message_count,
+        ).getvalue()
+
+
+# 싱글톤 인스턴스
+pdf_renderer = PDFRenderer()
@@ -1,5 +1,6 @@
+import os
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from Crypto.Random import get_random_bytes
 
 from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
 from app.conversation.infrastructure.orm.chat_message_orm import ChatMessageOrm
@@ -13,7 +14,7 @@ class ChatMessageRepositoryImpl:
         try:
             # 1. IV 자동 생성
             if not kwargs.get('iv'):
-                kwargs['iv'] = get_random_bytes(16)
+                kwargs['iv'] = os.urandom(16)
 
             # 2. parent_id 유효성 검사
             parent_id = kwargs.get('parent_id')
@@ -44,6 +45,26 @@ class ChatMessageRepositoryImpl:
             .all()
         )
 
+    async def find_page_by_room_id(self, room_id: str, after_id: int, limit: int):
+        return (
+            self.db.query(ChatMessageOrm)
+            .filter(
+                ChatMessageOrm.room_id == room_id,
+                ChatMessageOrm.id > after_id,
+            )
+            .order_by(ChatMessageOrm.id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    async def find_last_message_id(self, room_id: str) -> int | None:
+        """방의 마지막 메시지 ID (high-water mark). 메시지가 없으면 None"""
+        return (
+            self.db.query(func.max(ChatMessageOrm.id))
+            .filter(ChatMessageOrm.room_id == room_id)
+            .scalar()
+        )
+
     async def find_by_room_id_with_feedback(self, room_id: str, account_id: int):
         from app.conversation.infrastructure.orm.chat_message_feedback_orm import ChatFeedbackOrm
 
@@ -0,0 +1,88 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.conversation.application.port.out.chat_summary_repository_port import ChatSummaryRepositoryPort
+from app.conversation.infrastructure.orm.chat_summary_chunk_orm import ChatSummaryChunkOrm
+from app.conversation.infrastructure.orm.chat_summary_orm import ChatSummaryOrm
+
+
+class ChatSummaryRepositoryImpl(ChatSummaryRepositoryPort):
+
+    def __init__(self, session: Session):
+        self.db = session
+
+    async def find_by_room_id(self, room_id: str):
+        return self.db.get(ChatSummaryOrm, room_id)
+
+    async def find_latest_by_room_id(self, room_id: str):
+        # REPEATABLE READ 스냅샷과 identity map을 모두 우회해야 다른 워커의 커밋이 보인다
+        # (폴링하는 쪽은 쓰기 전이라 롤백으로 잃는 변경이 없음)
+        self.db.rollback()
+        return self.db.execute(
+            select(ChatSummaryOrm)
+            .where(ChatSummaryOrm.room_id == room_id)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+
+    async def save(self, room_id, last_message_id, message_count, summary_enc, iv, enc_version) -> None:
+        try:
+            summary = self.db.get(ChatSummaryOrm, room_id)
+            if summary is None:
+                summary = ChatSummaryOrm(room_id=room_id)
+                self.db.add(summary)
+
+            summary.last_message_id = last_message_id
+            summary.message_count = message_count
+            summary.summary_enc = summary_enc
+            summary.iv = iv
+            summary.enc_version = enc_version
+            summary.pdf_path = None  # 이전 시점의 PDF는 더 이상 유효하지 않음
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    async def save_pdf_path(self, room_id: str, last_message_id: int, pdf_path: str) -> None:
+        try:
+            (
+                self.db.query(ChatSummaryOrm)
+                .filter(
+                    ChatSummaryOrm.room_id == room_id,
+                    ChatSummaryOrm.last_message_id == last_message_id,
+                )
+                .update({ChatSummaryOrm.pdf_path: pdf_path}, synchronize_session="fetch")
+            )
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    async def find_chunks_by_room_id(self, room_id: str):
+        return (
+            self.db.query(ChatSummaryChunkOrm)
+            .filter(ChatSummaryChunkOrm.room_id == room_id)
+            .order_by(ChatSummaryChunkOrm.start_message_id.asc())
+            .all()
+        )
+
+    async def save_chunk(
+        self, room_id, start_message_id, end_message_id, message_count, summary_enc, iv, enc_version
+    ) -> None:
+        try:
+            self.db.add(ChatSummaryChunkOrm(
+                room_id=room_id,
+                start_message_id=start_message_id,
+                end_message_id=end_message_id,
+                message_count=message_count,
+                summary_enc=summary_enc,
+                iv=iv,
+                enc_version=enc_version,
+            ))
+            self.db.commit()
+        except IntegrityError:
+            # 다른 워커가 같은 구간을 먼저 저장함
+            self.db.rollback()
+        except Exception as e:
+            self.db.rollback()
+            raise e
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.auth.adapter.input.web.dependencies import verify_admin_role
-from app.config.database.session import get_db_session
+from app.config.database.session import get_db_session, get_read_db_session
 
 from app.faq.adapter.input.web.request.create_faq_request import (
     CreateFAQRequest,
@@ -33,7 +33,7 @@ def get_public_faqs(
     category: Optional[FAQCategory] = Query(None),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db_session),
+    db: Session = Depends(get_read_db_session),
 ):
     """공개 FAQ 목록 조회 (카테고리 필터 가능)"""
     faq_repo = FAQRepositoryImpl(db)
@@ -67,7 +67,7 @@ def search_faqs(
     keyword: str = Query(..., min_length=1),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db_session),
+    db: Session = Depends(get_read_db_session),
 ):
     """FAQ 검색 (FULLTEXT)"""
     faq_repo = FAQRepositoryImpl(db)
@@ -7,7 +7,7 @@ from app.auth.adapter.input.web.dependencies import (
     verify_admin_role,
 )
 from app.auth.application.port.jwt_token_port import TokenPayload
-from app.config.database.session import get_db_session
+from app.config.database.session import get_db_session, get_read_db_session
 
 from app.inquiry.adapter.input.web.request.create_inquiry_request import CreateInquiryRequest
 from app.inquiry.adapter.input.web.request.create_reply_request import CreateReplyRequest
@@ -160,7 +160,7 @@ def get_all_inquiries(
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     admin_id: int = Depends(verify_admin_role),
-    db: Session = Depends(get_db_session),
+    db: Session = Depends(get_read_db_session),
 ):
     """전체 문의 목록 조회 (관리자)"""
     inquiry_repo = InquiryRepositoryImpl(db)
@@ -1,5 +1,9 @@
 """FastAPI application entry point."""
 
+import time
+
+_BOOT_STARTED = time.perf_counter()
+
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -18,12 +22,22 @@ from app.ml.adapter.input.web.ml_router import ml_router
 from app.inquiry.adapter.input.web.inquiry_router import router as inquiry_router
 from app.faq.adapter.input.web.faq_router import router as faq_router
 from app.survey.adapter.input.web.survey_router import router as survey_router
-
-from app.account.infrastructure.orm.account_model import AccountModel  # noqa: F401
-from app.inquiry.infrastructure.orm.inquiry_model import InquiryModel  # noqa: F401
-from app.inquiry.infrastructure.orm.inquiry_reply_model import InquiryReplyModel  # noqa: F401
-from app.faq.infrastructure.orm.faq_model import FAQModel  # noqa: F401
+from app.common.adapter.input.web.metrics_router import metrics_router
+from app.common.adapter.input.web.llm_telemetry_router import router as llm_telemetry_router
+from app.common.adapter.input.web.profiler_router import router as profiler_router
+
+from app.account.infrastructure.cache.account_cache import account_cache
+from app.auth.infrastructure.cache.token_blacklist_filter import token_blacklist_filter
+from app.auth.infrastructure.oauth.factory import OAuthProviderFactory
+from app.common.infrastructure.llm_telemetry import llm_telemetry_writer
+from app.common.infrastructure.sampling_profiler import RequestProfilingMiddleware
+from app.config.container import container
+from app.config.image_processor import image_processor
+from app.config.database.instrumentation import SQLInstrumentationMiddleware
+from app.config.database.models import import_all_models
 from app.config.database.session import Base, engine
+from app.config.redis_config import close_async_redis, get_async_pool_stats
+from app.conversation.infrastructure.pdf.pdf_renderer import pdf_renderer
 from app.config.settings import settings
 
 
@@ -31,13 +45,38 @@ from app.config.settings import settings
 async def lifespan(app: FastAPI):
     """Application lifespan handler.
 
-    Startup: Initialize database tables.
-    Shutdown: Cleanup resources if needed.
+    Startup: Optionally create database tables (DB_CREATE_ALL_ON_STARTUP;
+        the schema is normally migrated with Alembic), warm up PDF fonts/styles
+        in the background, start the image processing pool, start the token
+        blacklist filter and account cache subscriptions, create the OAuth
+        providers' pooled HTTP clients and the process-scoped services in the
+        dependency container, start the LLM telemetry writer.
+    Shutdown: Stop PDF rendering / image processing workers and the subscriptions,
+        close the OAuth HTTP clients, flush queued LLM telemetry, close the
+        async Redis pool, drop the container's singletons.
     """
     # Startup
-    Base.metadata.create_all(bind=engine)
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        import_all_models()
+        Base.metadata.create_all(bind=engine)
+    container.init()
+    pdf_renderer.start()
+    image_processor.start()
+    token_blacklist_filter.start()
+    account_cache.start()
+    OAuthProviderFactory.start()
+    llm_telemetry_writer.start()
+    print(f"[startup] ready in {(time.perf_counter() - _BOOT_STARTED) * 1000:.0f} ms")
     yield
-    # Shutdown (cleanup if needed)
+    # Shutdown
+    await token_blacklist_filter.stop()
+    await account_cache.stop()
+    await OAuthProviderFactory.shutdown()
+    await llm_telemetry_writer.stop()
+    pdf_renderer.shutdown()
+    image_processor.shutdown()
+    await close_async_redis()
+    container.reset()
 
 
 app = FastAPI(
@@ -47,7 +86,13 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS Middleware
+# SQL instrumentation (per-request query stats, X-DB-* headers outside production)
+app.add_middleware(SQLInstrumentationMiddleware)
+
+# Request-sampled profiling (1 in PROFILER_REQUEST_SAMPLE_EVERY requests per route; no-op when 0)
+app.add_middleware(RequestProfilingMiddleware)
+
+# CORS Middleware (added last = outermost)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.CORS_ALLOWED_FRONTEND_URL],
@@ -65,11 +110,14 @@ app.include_router(ml_router, prefix="/ml")
 app.include_router(inquiry_router, prefix="/api/v1")
 app.include_router(faq_router, prefix="/api/v1")
 app.include_router(survey_router, prefix="/survey")
+app.include_router(metrics_router)
+app.include_router(llm_telemetry_router, prefix="/api/v1")
+app.include_router(profiler_router, prefix="/api/v1")
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    """Health check endpoint (includes async Redis pool usage)."""
+    return {"status": "healthy", "redis_pool": get_async_pool_stats()}
 
 
 if __name__ == "__main__":
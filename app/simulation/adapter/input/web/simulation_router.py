@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
 from starlette.responses import StreamingResponse
 
@@ -8,17 +8,59 @@ from app.simulation.application.usecase.simulation_usecase import SimulationServ
 from app.simulation.infrastructure.repository.simulation_repository_impl import SimulationRepositoryImpl
 from app.conversation.adapter.output.stream.stream_adapter import StreamAdapter
 from app.simulation.adapter.input.web.request.start_simulation_request import StartSimulationRequest, SendMessageRequest
+from app.common.domain.exceptions import IdempotencyKeyConflictException
+from app.common.infrastructure.idempotency import IdempotencyStore
+from app.config.container import container
 
 simulation_router = APIRouter(tags=["simulation"])
+idempotency_store = IdempotencyStore()
+
+
+def _simulation_service(db: Session) -> SimulationService:
+    crypto = container.crypto()
+    return SimulationService(SimulationRepositoryImpl(db, crypto), crypto)
+
+
+async def _claim_idempotency_key(account_id: int, idempotency_key: str | None, scope: str, payload: dict):
+    """Idempotency-Key 선점. 재시도라면 기존 레코드를 반환한다."""
+    if not idempotency_key:
+        return None
+    fingerprint = IdempotencyStore.fingerprint(scope, payload)
+    try:
+        return await idempotency_store.claim(account_id, idempotency_key, fingerprint)
+    except IdempotencyKeyConflictException as e:
+        raise HTTPException(status_code=422, detail=e.message)
+
+
+def _failed_request(existing, headers: dict) -> HTTPException:
+    """대화가 만들어진 뒤 실패한 요청의 재시도: 다시 실행하지 않고 저장된 오류를 돌려준다."""
+    return HTTPException(status_code=409, detail=existing.error, headers=headers)
 
 @simulation_router.post("/start")
 async def start_simulation(
         req: StartSimulationRequest,
         account_id: int = Depends(get_current_account_id),
+        idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
         db: Session = Depends(get_db_session)
 ):
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    existing = await _claim_idempotency_key(
+        account_id, idempotency_key, "simulation:start", req.model_dump()
+    )
+    if existing:
+        headers = {
+            "X-Chat-Id": str(existing.resource_id or ""),
+            "Idempotent-Replayed": "true",
+            "Access-Control-Expose-Headers": "X-Chat-Id, Idempotent-Replayed"
+        }
+        if existing.is_failed:
+            raise _failed_request(existing, headers)
+        return StreamingResponse(
+            idempotency_store.replay(account_id, idempotency_key),
+            media_type="text/event-stream",
+            headers=headers
+        )
+
+    service = _simulation_service(db)
 
     try:
         generator, chat_id = await service.start_new_session_stream(
@@ -27,6 +69,9 @@ async def start_simulation(
             gender=req.gender,
             topic=req.topic
         )
+        if idempotency_key:
+            await idempotency_store.set_resource_id(account_id, idempotency_key, str(chat_id))
+            generator = idempotency_store.record(account_id, idempotency_key, generator)
         return StreamingResponse(
             generator,
             media_type="text/event-stream",
@@ -36,19 +81,34 @@ async def start_simulation(
             }
         )
     except Exception as e:
+        if idempotency_key:
+            # 대화가 이미 저장됐다면 FAILED로 남겨 재시도가 두 번째 대화를 만들지 않게 한다
+            await idempotency_store.abort(account_id, idempotency_key, f"시뮬레이션 시작 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"시뮬레이션 시작 실패: {str(e)}")
 @simulation_router.post("/{chat_id}/stream")
 async def send_simulation_stream(
         chat_id: str,
         req: SendMessageRequest,
         account_id: int = Depends(get_current_account_id),
+        idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
         db: Session = Depends(get_db_session)
 ):
     """
     사용자 메시지를 보내고 AI 답변을 스트리밍으로 받습니다.
     """
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    existing = await _claim_idempotency_key(
+        account_id, idempotency_key, "simulation:stream", {"chat_id": chat_id, "content": req.content}
+    )
+    if existing:
+        headers = {"Idempotent-Replayed": "true", "Access-Control-Expose-Headers": "Idempotent-Replayed"}
+        if existing.is_failed:
+            raise _failed_request(existing, headers)
+        return StreamAdapter.to_streaming_response(
+            idempotency_store.replay(account_id, idempotency_key),
+            headers=headers,
+        )
+
+    service = _simulation_service(db)
 
     try:
         generator = await service.send_user_message_stream(
@@ -56,10 +116,17 @@ async def send_simulation_stream(
             account_id=account_id,
             content=req.content
         )
+        if idempotency_key:
+            await idempotency_store.set_resource_id(account_id, idempotency_key, chat_id)
+            generator = idempotency_store.record(account_id, idempotency_key, generator)
         return StreamAdapter.to_streaming_response(generator)
     except PermissionError:
+        if idempotency_key:
+            await idempotency_store.release(account_id, idempotency_key)
         raise HTTPException(status_code=403, detail="해당 대화방에 대한 권한이 없습니다.")
     except Exception as e:
+        if idempotency_key:
+            await idempotency_store.abort(account_id, idempotency_key, f"스트리밍 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"스트리밍 오류: {str(e)}")
 
 
@@ -69,8 +136,7 @@ async def get_simulation_detail(
         account_id: int = Depends(get_current_account_id),
         db: Session = Depends(get_db_session)
 ):
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db)
 
     # 1. "list" 문자열이 들어오면 목록 반환 로직으로 분기
     if chat_id == "list":
@@ -92,8 +158,7 @@ async def delete_simulation(
         db: Session = Depends(get_db_session)
 ):
 
-    repo = SimulationRepositoryImpl(db)
-    service = SimulationService(repo)
+    service = _simulation_service(db)
 
     try:
         success = await service.delete_session(chat_id, account_id)
@@ -7,9 +7,9 @@ from app.config.security.message_crypto import AESEncryption
 
 
 class SimulationService:
-    def __init__(self, repository: SimulationRepositoryPort):
+    def __init__(self, repository: SimulationRepositoryPort, crypto: AESEncryption):
         self.repository = repository
-        self.crypto = AESEncryption()
+        self.crypto = crypto
 
     def _build_system_prompt(self, mbti: str, gender: str, topic: str) -> str:
         mbti = mbti.upper()
@@ -85,7 +85,7 @@ class SimulationService:
 
         async def generator():
             full_text = ""
-            async for chunk in CallGPT.call_gpt(prompt):
+            async for chunk in CallGPT.call_gpt(prompt, use_case="simulation", account_id=account_id):
                 if chunk:
                     full_text += chunk
                     yield chunk
@@ -111,7 +111,7 @@ class SimulationService:
 
         async def generator():
             full_response = ""
-            async for chunk in CallGPT.call_gpt(final_prompt):
+            async for chunk in CallGPT.call_gpt(final_prompt, use_case="simulation", account_id=account_id):
                 full_response += chunk
                 yield chunk
             chat.add_message("assistant", full_response)
@@ -2,7 +2,6 @@ import base64
 from typing import Optional, List
 from sqlalchemy.orm import Session
 
-from app.config.database.session import get_db_session
 from app.simulation.application.port.simulation_repository_port import SimulationRepositoryPort
 from app.simulation.domain.entity.simulation_chat import SimulationChat
 from app.simulation.infrastructure.orm.simulation_chat_orm import SimulationChatORM
@@ -10,9 +9,10 @@ from app.config.security.message_crypto import AESEncryption
 
 
 class SimulationRepositoryImpl(SimulationRepositoryPort):
-    def __init__(self, session: Session | None = None):
-        self.db: Session = session or get_db_session()
-        self.crypto = AESEncryption()
+    def __init__(self, session: Session, crypto: AESEncryption):
+        # 세션은 요청 스코프(Depends(get_db_session)), 암호화는 프로세스 싱글톤(라우터가 컨테이너에서 주입)
+        self.db: Session = session
+        self.crypto = crypto
 
     async def save(self, chat: SimulationChat, is_new: bool = False) -> None:
         processed_messages = []
@@ -0,0 +1,37 @@
+"""Gunicorn configuration (production entry point).
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Every worker is a separate uvicorn event loop, so one worker per core uses
+the whole node. See README "프로덕션 실행" for the per-worker memory budget.
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('APP_HOST', '0.0.0.0')}:{os.getenv('APP_PORT', '33333')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Import the app once in the master; workers share its (copy-on-write) memory
+preload_app = True
+
+# Streaming LLM responses can run long; keep the worker timeout generous
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "1000"))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """Give each worker its own DB/Redis pools (see app/config/worker.py)."""
+    from app.config.worker import init_worker_process
+
+    init_worker_process()
+    server.log.info("Worker %s initialized connection pools", worker.pid)